@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+卡片悬停帧耗时基准测试
+
+构建包含 500 个可悬停卡片的窗口，按帧依次向每个卡片发送离开/进入事件模拟鼠标扫过，
+统计每帧事件处理、重绘和悬停动画的耗时。对比两种实现:
+- paint: 当前实现，按缓存的主题颜色在 paintEvent 中绘制悬停效果
+- stylesheet: 旧实现，每次进入/离开都重新生成并设置卡片样式表
+
+用法:
+    python -m benchmarks.bench_card_hover
+    python -m benchmarks.bench_card_hover --cards 500 --columns 25
+"""
+
+import time
+import argparse
+from benchmarks.common import get_app, process_events, summarize, print_table
+
+DEFAULT_CARD_COUNT = 500
+DEFAULT_COLUMNS = 25
+
+
+def _legacy_card_class():
+    """创建模拟旧实现的卡片类，悬停时重新设置整张样式表"""
+    from PyQt6.QtWidgets import QGroupBox
+    from ui.components import CardGroupBox
+
+    class LegacyStylesheetCard(CardGroupBox):
+        def _apply_stylesheet(self):
+            bg, border, hover_bg, hover_border = self._colors
+            current_bg = hover_bg if self._hover_state else bg
+            current_border = hover_border if self._hover_state else border
+            self.setStyleSheet(f"""
+            CardGroupBox {{
+                background-color: transparent;
+                border: none;
+                margin: 0px;
+                padding: 0px;
+            }}
+
+            CardGroupBox > QWidget {{
+                background-color: {current_bg.name()};
+                border: 1px solid {current_border.name()};
+                border-radius: {self._border_radius}px;
+            }}
+
+            CardGroupBox QWidget[objectName=""] {{
+                background-color: transparent;
+            }}
+            """)
+
+        def paintEvent(self, event):
+            QGroupBox.paintEvent(self, event)
+
+        def enterEvent(self, event):
+            self._hover_state = True
+            self._apply_stylesheet()
+            # 旧实现同样运行 hover_opacity 动画并在每一帧调用 update()
+            self._animate_hover(1.0)
+
+        def leaveEvent(self, event):
+            self._hover_state = False
+            self._apply_stylesheet()
+            self._animate_hover(0.0)
+
+    return LegacyStylesheetCard
+
+
+def build_window(card_class, card_count, columns, animated=True):
+    """
+    构建卡片网格窗口
+
+    Args:
+        card_class (type): 卡片类
+        card_count (int): 卡片数量
+        columns (int): 每行卡片数量
+        animated (bool): 是否保留悬停过渡动画
+
+    Returns:
+        tuple: (窗口, 卡片列表)
+    """
+    from PyQt6.QtWidgets import QWidget, QGridLayout, QLabel
+
+    window = QWidget()
+    layout = QGridLayout(window)
+    layout.setSpacing(4)
+
+    cards = []
+    for index in range(card_count):
+        card = card_class()
+        # 排除阴影开销，只比较悬停效果的更新方式
+        card.setShadowEnabled(False)
+        card.setPadding(4)
+        card.setFixedSize(64, 40)
+        card.addWidget(QLabel(str(index)))
+        if not animated:
+            card._animation = None
+        if hasattr(card, "_apply_stylesheet"):
+            card._apply_stylesheet()
+        layout.addWidget(card, index // columns, index % columns)
+        cards.append(card)
+
+    window.show()
+    process_events(0.1)
+    return window, cards
+
+
+def sweep(cards, frame_interval):
+    """
+    模拟鼠标依次扫过所有卡片，每帧移动到下一个卡片
+
+    每帧的耗时包含离开/进入事件处理、重绘以及帧内悬停动画的处理，不含空闲等待。
+
+    Args:
+        cards (list): 卡片列表
+        frame_interval (float): 帧间隔（秒）
+
+    Returns:
+        dict: 每帧的耗时统计（毫秒）
+    """
+    from PyQt6.QtCore import QEvent, QPointF
+    from PyQt6.QtGui import QEnterEvent
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    samples = []
+    previous = None
+    for card in cards:
+        frame_start = time.perf_counter()
+        if previous is not None:
+            QApplication.sendEvent(previous, QEvent(QEvent.Type.Leave))
+        center = QPointF(card.width() / 2, card.height() / 2)
+        QApplication.sendEvent(card, QEnterEvent(center, center, QPointF(card.mapToGlobal(center.toPoint()))))
+        app.processEvents()
+        busy = time.perf_counter() - frame_start
+
+        # 帧内剩余时间继续处理动画等事件，计入本帧耗时
+        while time.perf_counter() - frame_start < frame_interval:
+            start = time.perf_counter()
+            app.processEvents()
+            busy += time.perf_counter() - start
+            time.sleep(0.001)
+
+        samples.append(busy * 1000)
+        previous = card
+    return summarize(samples)
+
+
+def bench_card_hover(card_class, card_count, columns, frame_interval, animated=True):
+    """
+    测量一种卡片实现的悬停帧耗时
+
+    Returns:
+        dict: 耗时统计（毫秒）
+    """
+    window, cards = build_window(card_class, card_count, columns, animated)
+    try:
+        # 先扫过一行用于预热
+        sweep(cards[:columns], frame_interval)
+        return sweep(cards, frame_interval)
+    finally:
+        window.close()
+        window.deleteLater()
+        process_events()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="卡片悬停帧耗时基准测试")
+    parser.add_argument("--cards", type=int, default=DEFAULT_CARD_COUNT, help="卡片数量 (默认: 500)")
+    parser.add_argument("--columns", type=int, default=DEFAULT_COLUMNS, help="每行卡片数量 (默认: 25)")
+    parser.add_argument("--frame-ms", type=float, default=16.0, help="帧间隔毫秒数 (默认: 16)")
+    args = parser.parse_args()
+    frame_interval = args.frame_ms / 1000
+
+    get_app()
+    from ui.components import CardGroupBox
+
+    legacy_class = _legacy_card_class()
+    rows = []
+    for animated in (True, False):
+        suffix = "" if animated else " (无动画)"
+        rows.append((f"paint{suffix}", bench_card_hover(CardGroupBox, args.cards, args.columns, frame_interval, animated)))
+        rows.append((f"stylesheet{suffix}", bench_card_hover(legacy_class, args.cards, args.columns, frame_interval, animated)))
+    print_table(f"卡片悬停帧耗时 ({args.cards} 个卡片，每帧移动一个卡片)", rows, label="实现")
+
+
+if __name__ == "__main__":
+    main()
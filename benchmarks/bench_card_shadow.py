@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+卡片阴影重绘与滚动耗时基准测试
+
+构建包含 50 个卡片的滚动页面，分别测量整页重绘和逐帧滚动的耗时。对比两种阴影实现:
+- nine-patch: 当前实现，父控件绘制缓存的九宫格阴影
+- effect: 旧实现，每个卡片挂载 QGraphicsDropShadowEffect
+
+用法:
+    python -m benchmarks.bench_card_shadow
+    python -m benchmarks.bench_card_shadow --cards 50 --step 40
+"""
+
+import time
+import argparse
+from benchmarks.common import get_app, process_events, measure, summarize, print_table
+
+DEFAULT_CARD_COUNT = 50
+DEFAULT_SCROLL_STEP = 40
+
+
+def build_page(card_count, use_effect):
+    """
+    构建卡片滚动页面
+
+    Args:
+        card_count (int): 卡片数量
+        use_effect (bool): 是否使用 QGraphicsDropShadowEffect 绘制阴影
+
+    Returns:
+        tuple: (窗口, 滚动区域)
+    """
+    from PyQt6.QtGui import QColor
+    from PyQt6.QtWidgets import (
+        QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QScrollArea, QGraphicsDropShadowEffect,
+    )
+    from ui.components import CardGroupBox
+
+    window = QWidget()
+    window.resize(720, 800)
+    layout = QVBoxLayout(window)
+
+    content = QWidget()
+    content_layout = QVBoxLayout(content)
+    content_layout.setSpacing(12)
+    for index in range(card_count):
+        content_layout.addWidget(QLabel(f"分组 {index}"))
+        card = CardGroupBox()
+        card.setHoverable(False)
+        for line in range(2):
+            row = QHBoxLayout()
+            row.addWidget(QLabel(f"设置项 {index}-{line}"))
+            row.addStretch()
+            row.addWidget(QPushButton("操作"))
+            card.addLayout(row)
+        content_layout.addWidget(card)
+
+        if use_effect:
+            card.setShadowEnabled(False)
+            shadow = QGraphicsDropShadowEffect()
+            shadow.setBlurRadius(12)
+            shadow.setColor(QColor(0, 0, 0, 40))
+            shadow.setOffset(0, 4)
+            card.setGraphicsEffect(shadow)
+
+    scroll_area = QScrollArea()
+    scroll_area.setWidgetResizable(True)
+    scroll_area.setWidget(content)
+    layout.addWidget(scroll_area)
+
+    window.show()
+    process_events(0.2)
+    return window, scroll_area
+
+
+def bench_scroll(scroll_area, step):
+    """
+    从顶部逐帧滚动到底部，统计每一帧的耗时
+
+    Returns:
+        dict: 耗时统计（毫秒）
+    """
+    scrollbar = scroll_area.verticalScrollBar()
+    scrollbar.setValue(0)
+    process_events()
+
+    samples = []
+    for value in range(step, scrollbar.maximum() + step, step):
+        start = time.perf_counter()
+        scrollbar.setValue(min(value, scrollbar.maximum()))
+        process_events()
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples)
+
+
+def bench_card_shadow(card_count, step, use_effect, repeat):
+    """
+    测量一种阴影实现的整页重绘和滚动耗时
+
+    Returns:
+        tuple: (重绘统计, 滚动统计)
+    """
+    window, scroll_area = build_page(card_count, use_effect)
+    try:
+        repaint = measure(window.repaint, repeat=repeat)
+        bench_scroll(scroll_area, step)
+        scroll = bench_scroll(scroll_area, step)
+        return repaint, scroll
+    finally:
+        window.close()
+        window.deleteLater()
+        process_events()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="卡片阴影重绘与滚动耗时基准测试")
+    parser.add_argument("--cards", type=int, default=DEFAULT_CARD_COUNT, help="卡片数量 (默认: 50)")
+    parser.add_argument("--step", type=int, default=DEFAULT_SCROLL_STEP, help="每帧滚动像素 (默认: 40)")
+    parser.add_argument("--repeat", type=int, default=50, help="整页重绘计时次数 (默认: 50)")
+    args = parser.parse_args()
+
+    get_app()
+    rows = []
+    for name, use_effect in (("nine-patch", False), ("effect", True)):
+        repaint, scroll = bench_card_shadow(args.cards, args.step, use_effect, args.repeat)
+        rows.append((f"{name} 重绘", repaint))
+        rows.append((f"{name} 滚动", scroll))
+    print_table(f"卡片阴影耗时 ({args.cards} 个卡片)", rows, label="实现")
+
+
+if __name__ == "__main__":
+    main()
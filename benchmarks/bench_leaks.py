@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+内存与信号连接泄漏基准测试
+
+在离屏主窗口上预热后重复执行主题切换、选项卡切换、打开对话框和处理检查更新结果，
+比较 QObject 数量、信号接收者数量和 tracemalloc 内存快照，发现持续增长时返回非零退出码。
+另外重复创建和销毁主窗口，检查全局信号上是否残留已销毁窗口的连接；
+重复创建并丢弃无父控件的卡片、开关和标题栏，检查它们能否被回收。
+
+用法:
+    python -m benchmarks.bench_leaks
+    python -m benchmarks.bench_leaks --iterations 50 --max-memory-kb 4
+"""
+
+import os
+import sys
+import argparse
+import tempfile
+from benchmarks.common import get_app, process_events
+
+
+def _create_window():
+    from config import ConfigManager
+    from ui.main_window import MainWindow
+
+    config_manager = ConfigManager()
+    # 即时切换选项卡，避免过渡动画跨越迭代
+    config_manager.tab_transition = "instant"
+    window = MainWindow(config_manager)
+    window.show()
+    process_events(0.2)
+    return window
+
+
+def _destroy_window(window):
+    from PyQt6.QtCore import QCoreApplication, QEvent
+
+    window.hide()
+    window.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    process_events()
+
+
+def bench_operations(iterations, warmup):
+    """重复界面操作，返回泄漏报告"""
+    from ui.leak_hunter import LeakHunter
+
+    window = _create_window()
+    try:
+        return LeakHunter(window).run(iterations=iterations, warmup=warmup)
+    finally:
+        _destroy_window(window)
+
+
+def bench_window_lifecycle(cycles):
+    """
+    重复创建和销毁主窗口
+
+    Returns:
+        dict: {信号: 接收者增长}
+    """
+    from ui.styles import theme_manager
+    from ui.signal_registry import signal_registry
+    from utils import get_version_checker
+
+    def counts():
+        # 先统计登记的连接：统计时会断开已销毁控件残留的槽代理
+        registered = signal_registry.report()
+        version_checker = get_version_checker()
+        result = {
+            "ThemeManager.theme_changed": theme_manager.receivers(theme_manager.theme_changed),
+            "VersionChecker.check_finished": version_checker.receivers(version_checker.check_finished),
+        }
+        for name, stats in registered.items():
+            result[f"registered:{name}"] = stats["registered"]
+        return result
+
+    # 第一个窗口创建全局对象（版本检查器等）
+    _destroy_window(_create_window())
+    before = counts()
+    for _ in range(cycles):
+        _destroy_window(_create_window())
+    after = counts()
+    return {name: count - before.get(name, 0) for name, count in after.items() if count > before.get(name, 0)}
+
+
+def bench_parentless_components(count):
+    """
+    重复创建并丢弃无父控件的组件
+
+    组件通过 signal_registry 和 animation_manager 登记了连接和动画，登记不能延长组件的生命周期。
+
+    Returns:
+        tuple: (未被回收的组件数量, {信号: 登记连接或接收者增长})
+    """
+    import gc
+    import weakref
+    from PyQt6.QtWidgets import QWidget
+    from ui.components import CardGroupBox, ModernSwitch
+    from ui.components.custom_titlebar import CustomTitleBar
+    from ui.signal_registry import signal_registry
+    from ui.styles import theme_manager
+
+    def registered():
+        result = {name: stats["registered"] for name, stats in signal_registry.report().items()}
+        result["receivers:ThemeManager.theme_changed"] = theme_manager.receivers(theme_manager.theme_changed)
+        return result
+
+    gc.collect()
+    before = registered()
+    refs = []
+    for _ in range(count):
+        card = CardGroupBox()
+        switch = ModernSwitch()
+        host = QWidget()
+        title_bar = CustomTitleBar(host)
+        refs += [weakref.ref(card), weakref.ref(switch), weakref.ref(title_bar)]
+        del card, switch, host, title_bar
+    process_events()
+    gc.collect()
+
+    alive = sum(1 for ref in refs if ref() is not None)
+    after = registered()
+    growth = {name: n - before.get(name, 0) for name, n in after.items() if n > before.get(name, 0)}
+    return alive, growth
+
+
+def main():
+    parser = argparse.ArgumentParser(description="内存与信号连接泄漏基准测试")
+    parser.add_argument("--iterations", type=int, default=20, help="统计的操作轮数 (默认: 20)")
+    parser.add_argument("--warmup", type=int, default=3, help="预热轮数 (默认: 3)")
+    parser.add_argument("--windows", type=int, default=3, help="重复创建主窗口的次数 (默认: 3)")
+    parser.add_argument("--components", type=int, default=100, help="创建无父控件组件的轮数 (默认: 100)")
+    parser.add_argument("--max-memory-kb", type=float, default=8.0, help="每轮允许的内存增长KB (默认: 8)")
+    args = parser.parse_args()
+
+    # 使用临时配置目录，避免读写用户配置
+    temp_home = tempfile.mkdtemp(prefix="bench_leaks_")
+    os.environ["HOME"] = temp_home
+    os.environ["USERPROFILE"] = temp_home
+
+    get_app()
+    from ui.leak_hunter import LeakHunter
+
+    report = bench_operations(args.iterations, args.warmup)
+    print(f"\n界面操作 {report['iterations']} 轮")
+    print("=" * 72)
+    print(f"内存增长: {report['memory_growth_kb']:.1f}KB（每轮 {report['memory_growth_kb'] / report['iterations']:.2f}KB）")
+    for location, size_kb, count in report["memory_top"][:5]:
+        print(f"  {location:<56}{size_kb:>8.1f}KB {count:>+6d}")
+    print(f"QObject 增长: {report['qobjects'] or '无'}")
+    print(f"信号接收者增长: {report['receivers'] or '无'}")
+
+    failures = LeakHunter.check(report, max_memory_kb_per_iteration=args.max_memory_kb)
+
+    lifecycle = bench_window_lifecycle(args.windows)
+    print(f"\n主窗口创建/销毁 {args.windows} 次")
+    print("=" * 72)
+    print(f"信号接收者增长: {lifecycle or '无'}")
+    failures += [f"主窗口销毁后信号 {name} 残留 {growth} 个连接" for name, growth in lifecycle.items()]
+
+    alive, registered = bench_parentless_components(args.components)
+    print(f"\n无父控件组件创建/丢弃 {args.components} 轮")
+    print("=" * 72)
+    print(f"未回收组件: {alive}")
+    print(f"登记连接/接收者增长: {registered or '无'}")
+    if alive:
+        failures.append(f"{alive} 个无父控件组件未被回收")
+    failures += [f"组件回收后信号 {name} 残留 {growth} 个登记" for name, growth in registered.items()]
+
+    if failures:
+        print("\n检测到泄漏:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print("\n未检测到泄漏")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
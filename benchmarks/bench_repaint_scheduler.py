@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+导航指示器动画的定时器事件与重绘次数基准测试
+
+构建一列导航按钮，持续交替激活/取消激活所有按钮使指示器动画不间断运行，
+统计每秒动画产生的定时器/排队调用事件数量和导航按钮的 paintEvent 次数。对比两种实现:
+- scheduler: 当前实现，属性 setter 通过重绘调度器按帧合并重绘请求
+- singleshot: 旧实现，每个属性 setter 调用 QTimer.singleShot(0, self.update)
+
+用法:
+    python -m benchmarks.bench_repaint_scheduler
+    python -m benchmarks.bench_repaint_scheduler --buttons 8 --duration 2
+"""
+
+import time
+import argparse
+from benchmarks.common import get_app, process_events
+
+DEFAULT_BUTTON_COUNT = 8
+DEFAULT_DURATION = 2.0
+
+
+def _legacy_button_class():
+    """创建模拟旧实现的导航按钮类，属性 setter 各自排队一次 update()"""
+    from PyQt6.QtCore import QTimer, pyqtProperty
+    from ui.components.navigation_tabs import NavigationButton
+
+    class LegacyNavigationButton(NavigationButton):
+        @pyqtProperty(float)
+        def indicatorPosition(self):
+            return self._indicator_position
+
+        @indicatorPosition.setter
+        def indicatorPosition(self, value):
+            if abs(self._indicator_position - value) > 0.01:
+                self._indicator_position = value
+                QTimer.singleShot(0, self.update)
+
+        @pyqtProperty(float)
+        def indicatorOpacity(self):
+            return self._indicator_opacity
+
+        @indicatorOpacity.setter
+        def indicatorOpacity(self, value):
+            new_value = max(0.0, min(1.0, value))
+            if abs(self._indicator_opacity - new_value) > 0.01:
+                self._indicator_opacity = new_value
+                QTimer.singleShot(0, self.update)
+
+    return LegacyNavigationButton
+
+
+def _event_counter(button_class):
+    """创建统计定时器事件和导航按钮重绘次数的应用程序事件过滤器"""
+    from PyQt6.QtCore import QObject, QEvent
+
+    class EventCounter(QObject):
+        def __init__(self):
+            super().__init__()
+            self.timer_events = 0
+            self.paint_events = 0
+
+        def eventFilter(self, obj, event):
+            event_type = event.type()
+            # Qt6 中 0 毫秒的 singleShot 以排队调用（MetaCall）事件投递
+            if event_type in (QEvent.Type.Timer, QEvent.Type.MetaCall):
+                self.timer_events += 1
+            elif event_type == QEvent.Type.Paint and isinstance(obj, button_class):
+                self.paint_events += 1
+            return False
+
+    return EventCounter()
+
+
+def bench_indicator_animation(button_class, button_count, duration):
+    """
+    测量一种实现在指示器动画持续运行期间的事件数量
+
+    Args:
+        button_class (type): 导航按钮类
+        button_count (int): 按钮数量
+        duration (float): 统计时长（秒）
+
+    Returns:
+        dict: 每秒的定时器事件数和重绘次数
+    """
+    from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout
+
+    window = QWidget()
+    layout = QVBoxLayout(window)
+    buttons = []
+    for index in range(button_count):
+        button = button_class(f"选项 {index}", "●")
+        layout.addWidget(button)
+        buttons.append(button)
+    window.show()
+    process_events(0.2)
+
+    app = QApplication.instance()
+    counter = _event_counter(button_class)
+    active = False
+    app.installEventFilter(counter)
+    try:
+        start = time.perf_counter()
+        next_toggle = start
+        while time.perf_counter() - start < duration:
+            now = time.perf_counter()
+            if now >= next_toggle:
+                # 动画时长 250ms，每 260ms 切换一次保证动画持续运行
+                active = not active
+                for button in buttons:
+                    button.setActive(active)
+                next_toggle = now + 0.26
+            app.processEvents()
+            time.sleep(0.001)
+        elapsed = time.perf_counter() - start
+    finally:
+        app.removeEventFilter(counter)
+        window.close()
+        window.deleteLater()
+        process_events()
+
+    return {
+        "timer_events": counter.timer_events / elapsed,
+        "paint_events": counter.paint_events / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="导航指示器动画的定时器事件与重绘次数基准测试")
+    parser.add_argument("--buttons", type=int, default=DEFAULT_BUTTON_COUNT, help="导航按钮数量 (默认: 8)")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION, help="统计时长秒数 (默认: 2)")
+    args = parser.parse_args()
+
+    get_app()
+    from ui.components.navigation_tabs import NavigationButton
+
+    rows = [
+        ("scheduler", bench_indicator_animation(NavigationButton, args.buttons, args.duration)),
+        ("singleshot", bench_indicator_animation(_legacy_button_class(), args.buttons, args.duration)),
+    ]
+
+    print(f"\n导航指示器动画每秒事件数 ({args.buttons} 个按钮)")
+    print("=" * 52)
+    print(f"{'实现':<20}{'定时器事件/秒':>16}{'重绘次数/秒':>16}")
+    print("-" * 52)
+    for name, stats in rows:
+        print(f"{name:<20}{stats['timer_events']:>16.1f}{stats['paint_events']:>16.1f}")
+    print("=" * 52)
+
+
+if __name__ == "__main__":
+    main()
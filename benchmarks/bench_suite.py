@@ -0,0 +1,365 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+UI 组件离屏渲染基准测试套件
+
+在 QT_QPA_PLATFORM=offscreen 下批量创建 ModernSwitch、CardGroupBox、NavigationButton、
+CircleButton、CustomTitleBar 以及完整的 MainWindow，通过 grab() 强制绘制，分别统计:
+- construct: 创建组件
+- polish: 首次应用样式表
+- paint: 绘制整个容器
+- theme_switch: 切换主题并重新绘制
+- tab_switch: 切换选项卡并重新绘制（仅 MainWindow）
+
+结果以 JSON 输出，可与阈值文件（scale=1 时各场景的中位数上限，按实例数量换算）及历史结果比较，
+出现性能回退时返回非零退出码。
+
+用法:
+    python -m benchmarks.bench_suite
+    python -m benchmarks.bench_suite --output results.json --check
+    python -m benchmarks.bench_suite --baseline old.json --tolerance 0.25 --scale 2
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+from benchmarks.common import root_dir, get_app, process_events, measure, summarize, print_table
+
+# 默认阈值文件
+DEFAULT_THRESHOLDS = os.path.join(root_dir, "benchmarks", "thresholds.json")
+# 各组件在 scale=1 时的实例数量
+COMPONENT_COUNTS = {
+    "modern_switch": 500,
+    "card_group_box": 200,
+    "navigation_button": 200,
+    "circle_button": 300,
+    "custom_titlebar": 20,
+}
+
+
+def _component_factories():
+    """各组件的创建函数，返回添加到网格中的控件"""
+    from PyQt6.QtWidgets import QWidget, QLabel
+    from ui.components import ModernSwitch, CardGroupBox
+    from ui.components.navigation_tabs import NavigationButton
+    from ui.components.circle_button import CircleButton
+    from ui.components.custom_titlebar import CustomTitleBar, TitleBarConfig
+
+    def card(index):
+        widget = CardGroupBox()
+        widget.addWidget(QLabel(f"卡片 {index}"))
+        return widget
+
+    def circle_button(index):
+        button = CircleButton()
+        button.setFixedSize(20, 20)
+        button.setColors(*TitleBarConfig.COLORS["close"])
+        button.setIcon(TitleBarConfig.ICONS["close"])
+        return button
+
+    def titlebar(index):
+        host = QWidget()
+        host.setFixedSize(360, 60)
+        CustomTitleBar(host)
+        return host
+
+    return {
+        "modern_switch": lambda index: ModernSwitch(),
+        "card_group_box": card,
+        "navigation_button": lambda index: NavigationButton(f"选项 {index}", "●"),
+        "circle_button": circle_button,
+        "custom_titlebar": titlebar,
+    }
+
+
+def _theme_switcher():
+    """返回交替切换浅色/深色主题的函数"""
+    from ui.styles import theme_manager
+
+    def switch():
+        theme_manager.set_theme("dark" if theme_manager.get_current_theme() == "light" else "light")
+
+    return switch
+
+
+def _dispose(widget):
+    """关闭并立即销毁控件，避免残留控件参与后续场景的样式刷新"""
+    from PyQt6.QtCore import QCoreApplication, QEvent
+
+    widget.close()
+    widget.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    process_events()
+
+
+def bench_component(name, factory, count, repeat):
+    """
+    测量一种组件的创建、样式应用、绘制和主题切换耗时
+
+    Args:
+        name (str): 场景名称
+        factory (callable): 创建函数
+        count (int): 实例数量
+        repeat (int): 计时次数
+
+    Returns:
+        dict: {指标: 耗时统计}
+    """
+    from PyQt6.QtWidgets import QWidget, QGridLayout
+    from ui.animation_manager import animation_manager
+
+    columns = max(1, int(count ** 0.5))
+    construct_samples = []
+    polish_samples = []
+    container = None
+
+    # 创建和样式应用只能各测一次，重复构建容器以得到多个样本
+    for _ in range(max(1, repeat // 5)):
+        if container is not None:
+            _dispose(container)
+
+        start = time.perf_counter()
+        container = QWidget()
+        layout = QGridLayout(container)
+        with animation_manager.suppressed():
+            for index in range(count):
+                layout.addWidget(factory(index), index // columns, index % columns)
+        construct_samples.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        container.ensurePolished()
+        polish_samples.append((time.perf_counter() - start) * 1000)
+
+    container.show()
+    process_events(0.1)
+
+    switch_theme = _theme_switcher()
+
+    def theme_switch():
+        switch_theme()
+        container.grab()
+
+    try:
+        return {
+            "construct": summarize(construct_samples),
+            "polish": summarize(polish_samples),
+            "paint": measure(container.grab, repeat=repeat),
+            "theme_switch": measure(theme_switch, repeat=repeat),
+        }
+    finally:
+        _dispose(container)
+
+
+def bench_main_window(repeat):
+    """
+    测量完整主窗口的创建、样式应用、绘制、主题切换和选项卡切换耗时
+
+    Returns:
+        dict: {指标: 耗时统计}
+    """
+    from config import ConfigManager
+    from ui.main_window import MainWindow
+
+    config_manager = ConfigManager()
+    # 选项卡切换使用即时模式，只统计页面切换和绘制本身
+    config_manager.tab_transition = "instant"
+
+    construct_samples = []
+    polish_samples = []
+    window = None
+    for _ in range(max(1, repeat // 5)):
+        if window is not None:
+            _dispose(window)
+
+        start = time.perf_counter()
+        window = MainWindow(config_manager)
+        construct_samples.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        window.ensurePolished()
+        polish_samples.append((time.perf_counter() - start) * 1000)
+
+    window.show()
+    process_events(0.3)
+
+    def theme_switch():
+        window.theme_manager.switch_theme("dark" if window.current_theme == "light" else "light")
+        window.grab()
+
+    def tab_switch():
+        window.tabs.setCurrentIndex((window.tabs.currentIndex() + 1) % window.tabs.count())
+        window.grab()
+
+    try:
+        return {
+            "construct": summarize(construct_samples),
+            "polish": summarize(polish_samples),
+            "paint": measure(window.grab, repeat=repeat),
+            "theme_switch": measure(theme_switch, repeat=repeat),
+            "tab_switch": measure(tab_switch, repeat=repeat),
+        }
+    finally:
+        _dispose(window)
+
+
+def run_suite(scale, repeat, only=None):
+    """
+    运行基准测试套件
+
+    Args:
+        scale (float): 组件数量倍数
+        repeat (int): 每项计时次数
+        only (list): 只运行指定场景，为 None 时运行全部
+
+    Returns:
+        dict: 包含运行环境和各场景结果的报告
+    """
+    from PyQt6.QtCore import QT_VERSION_STR, PYQT_VERSION_STR
+
+    results = {}
+    for name, factory in _component_factories().items():
+        if only and name not in only:
+            continue
+        count = max(1, int(COMPONENT_COUNTS[name] * scale))
+        results[name] = bench_component(name, factory, count, repeat)
+        results[name]["count"] = count
+
+    if not only or "main_window" in only:
+        results["main_window"] = bench_main_window(repeat)
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "qt": QT_VERSION_STR,
+            "pyqt": PYQT_VERSION_STR,
+            "qpa": os.environ.get("QT_QPA_PLATFORM", ""),
+            "scale": scale,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def iter_medians(report):
+    """遍历报告中各指标的中位数，返回 (场景.指标, 中位数)"""
+    for scenario, metrics in report["results"].items():
+        for metric, stats in metrics.items():
+            if isinstance(stats, dict):
+                yield f"{scenario}.{metric}", stats["median"]
+
+
+def scenario_scale(report, scenario):
+    """
+    场景实际实例数量相对 scale=1 的倍数，主窗口等固定规模的场景为 1
+
+    Args:
+        report (dict): 结果报告
+        scenario (str): 场景名称
+
+    Returns:
+        float: 倍数
+    """
+    count = report["results"].get(scenario, {}).get("count")
+    if not count or scenario not in COMPONENT_COUNTS:
+        return 1.0
+    return count / COMPONENT_COUNTS[scenario]
+
+
+def check_regressions(report, thresholds=None, baseline=None, tolerance=0.25):
+    """
+    检查性能回退
+
+    阈值为 scale=1 时的中位数上限，按各场景的实例数量等比换算；
+    与历史结果比较时同样按两次的实例数量换算。
+
+    Args:
+        report (dict): 本次结果
+        thresholds (dict): {场景.指标: scale=1 时的中位数上限毫秒}
+        baseline (dict): 历史结果报告
+        tolerance (float): 相对历史结果允许的增幅
+
+    Returns:
+        list: 回退说明
+    """
+    baseline_medians = dict(iter_medians(baseline)) if baseline else {}
+    failures = []
+    for key, median in iter_medians(report):
+        scenario = key.split(".", 1)[0]
+        factor = scenario_scale(report, scenario)
+
+        limit = (thresholds or {}).get(key)
+        if limit is not None and median > limit * factor:
+            failures.append(f"{key}: 中位数 {median:.2f}ms 超过阈值 {limit * factor:.2f}ms")
+
+        previous = baseline_medians.get(key)
+        if previous:
+            previous *= factor / scenario_scale(baseline, scenario)
+            if median > previous * (1 + tolerance):
+                failures.append(
+                    f"{key}: 中位数 {median:.2f}ms 较历史结果 {previous:.2f}ms 增加 {(median / previous - 1) * 100:.0f}%"
+                )
+    return failures
+
+
+def _load_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UI 组件离屏渲染基准测试套件")
+    parser.add_argument("--scale", type=float, default=1.0, help="组件数量倍数 (默认: 1)")
+    parser.add_argument("--repeat", type=int, default=10, help="每项计时次数 (默认: 10)")
+    parser.add_argument("--only", nargs="+", help="只运行指定场景，如 modern_switch main_window")
+    parser.add_argument("--output", help="结果 JSON 输出路径 (默认输出到标准输出)")
+    parser.add_argument("--check", action="store_true", help="按阈值文件检查性能回退")
+    parser.add_argument("--thresholds", default=DEFAULT_THRESHOLDS, help="阈值文件 (默认: benchmarks/thresholds.json)")
+    parser.add_argument("--baseline", help="用于比较的历史结果 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="相对历史结果允许的增幅 (默认: 0.25)")
+    args = parser.parse_args()
+
+    # 主窗口使用临时配置目录，避免读写用户配置
+    temp_home = tempfile.mkdtemp(prefix="bench_suite_")
+    os.environ["HOME"] = temp_home
+    os.environ["USERPROFILE"] = temp_home
+
+    get_app()
+    report = run_suite(args.scale, args.repeat, args.only)
+
+    for scenario, metrics in report["results"].items():
+        rows = [(metric, stats) for metric, stats in metrics.items() if isinstance(stats, dict)]
+        count = metrics.get("count")
+        print_table(f"{scenario}" + (f" ({count} 个)" if count else ""), rows, label="指标")
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+        print(f"\n结果已保存: {args.output}")
+    else:
+        print(output)
+
+    thresholds = _load_json(args.thresholds) if args.check and os.path.exists(args.thresholds) else None
+    baseline = _load_json(args.baseline) if args.baseline else None
+    if thresholds is None and baseline is None:
+        return 0
+
+    failures = check_regressions(report, thresholds, baseline, args.tolerance)
+    if failures:
+        print("\n检测到性能回退:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print("\n未检测到性能回退")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
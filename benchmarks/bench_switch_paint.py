@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+开关绘制吞吐量基准测试
+
+在离屏窗口中构建 1000 个 ModernSwitch 组成的网格（一半为选中状态），反复整窗重绘，
+统计每秒完成的开关 paintEvent 次数。对比两种实现:
+- cached: 当前实现，画刷和圆角路径来自共享的绘制资源缓存
+- alloc: 旧实现，每次绘制都新建 QBrush 并调用 drawRoundedRect
+
+用法:
+    python -m benchmarks.bench_switch_paint
+    python -m benchmarks.bench_switch_paint --switches 1000 --columns 40 --repeat 30
+"""
+
+import time
+import argparse
+from benchmarks.common import get_app, process_events, measure, print_table
+
+DEFAULT_SWITCH_COUNT = 1000
+DEFAULT_COLUMNS = 40
+
+
+def _legacy_switch_class():
+    """创建模拟旧实现的开关类，每次绘制都新建画刷"""
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QPainter, QBrush
+    from ui.components import ModernSwitch
+
+    class LegacySwitch(ModernSwitch):
+        def paintEvent(self, event):
+            painter = QPainter(self)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+            if self.isChecked():
+                painter.setBrush(QBrush(self._checked_bg_color))
+            else:
+                painter.setBrush(QBrush(self._bg_color))
+
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawRoundedRect(0, 0, self.width(), self.height(), self.height() / 2, self.height() / 2)
+
+            circle_diameter = self.height() - 4
+            circle_x = int(self._circle_position)
+            circle_y = int((self.height() - circle_diameter) / 2)
+
+            painter.setBrush(QBrush(self._circle_color if not self.isChecked() else self._checked_circle_color))
+            painter.drawEllipse(circle_x, circle_y, circle_diameter, circle_diameter)
+
+    return LegacySwitch
+
+
+def build_window(switch_class, switch_count, columns):
+    """
+    构建开关网格窗口
+
+    Returns:
+        tuple: (窗口, 开关列表)
+    """
+    from PyQt6.QtWidgets import QWidget, QGridLayout
+    from ui.animation_manager import animation_manager
+
+    window = QWidget()
+    layout = QGridLayout(window)
+    layout.setSpacing(2)
+
+    switches = []
+    with animation_manager.suppressed():
+        for index in range(switch_count):
+            switch = switch_class()
+            switch.setChecked(index % 2 == 0)
+            layout.addWidget(switch, index // columns, index % columns)
+            switches.append(switch)
+
+    window.show()
+    process_events(0.2)
+    return window, switches
+
+
+def bench_switch_paint(switch_class, switch_count, columns, repeat):
+    """
+    测量一种开关实现的整窗重绘耗时
+
+    Returns:
+        tuple: (重绘统计, 每秒开关绘制次数)
+    """
+    window, switches = build_window(switch_class, switch_count, columns)
+    paint_count = [0]
+    paint_event = switch_class.paintEvent
+
+    def counted_paint_event(self, event):
+        paint_count[0] += 1
+        paint_event(self, event)
+
+    switch_class.paintEvent = counted_paint_event
+    try:
+        start = time.perf_counter()
+        stats = measure(window.repaint, repeat=repeat, warmup=0)
+        elapsed = time.perf_counter() - start
+        return stats, paint_count[0] / elapsed
+    finally:
+        switch_class.paintEvent = paint_event
+        window.close()
+        window.deleteLater()
+        process_events()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="开关绘制吞吐量基准测试")
+    parser.add_argument("--switches", type=int, default=DEFAULT_SWITCH_COUNT, help="开关数量 (默认: 1000)")
+    parser.add_argument("--columns", type=int, default=DEFAULT_COLUMNS, help="每行开关数量 (默认: 40)")
+    parser.add_argument("--repeat", type=int, default=30, help="整窗重绘次数 (默认: 30)")
+    args = parser.parse_args()
+
+    get_app()
+    from ui.components import ModernSwitch
+
+    rows = []
+    rates = []
+    for name, switch_class in (("cached", ModernSwitch), ("alloc", _legacy_switch_class())):
+        # 预热：先完整重绘一次，填充绘制资源缓存
+        window, _ = build_window(switch_class, args.switches, args.columns)
+        window.repaint()
+        window.close()
+        window.deleteLater()
+        process_events()
+
+        stats, rate = bench_switch_paint(switch_class, args.switches, args.columns, args.repeat)
+        rows.append((f"{name} 整窗重绘", stats))
+        rates.append((name, rate))
+
+    print_table(f"开关网格整窗重绘耗时 ({args.switches} 个开关)", rows, label="实现")
+    for name, rate in rates:
+        print(f"{name:<20}{rate:>12.0f} 次开关绘制/秒")
+
+
+if __name__ == "__main__":
+    main()
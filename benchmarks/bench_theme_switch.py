@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+主题切换耗时基准测试
+
+分别构建包含 10/100/1000 个卡片的窗口，交替切换浅色/深色主题，
+统计从 set_theme 开始到重绘完成的耗时。
+
+用法:
+    python -m benchmarks.bench_theme_switch
+    python -m benchmarks.bench_theme_switch --cards 10 100 1000 --repeat 20
+"""
+
+import argparse
+from benchmarks.common import get_app, process_events, measure, print_table
+
+DEFAULT_CARD_COUNTS = [10, 100, 1000]
+
+
+def build_window(card_count):
+    """
+    构建包含指定数量卡片的测试窗口
+
+    Args:
+        card_count (int): 卡片数量
+
+    Returns:
+        QWidget: 已显示的测试窗口
+    """
+    from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QScrollArea
+    from ui.components import CardGroupBox
+    from ui.styles import StyleHelper
+
+    window = QWidget()
+    window.resize(800, 600)
+    layout = QVBoxLayout(window)
+
+    content = QWidget()
+    content_layout = QVBoxLayout(content)
+    for index in range(card_count):
+        card = CardGroupBox()
+        row = QHBoxLayout()
+        label = QLabel(f"卡片 {index}")
+        button = QPushButton("操作")
+        StyleHelper.set_button_type(button, "default")
+        row.addWidget(label)
+        row.addStretch()
+        row.addWidget(button)
+        card.addLayout(row)
+        content_layout.addWidget(card)
+
+    scroll_area = QScrollArea()
+    scroll_area.setWidgetResizable(True)
+    scroll_area.setWidget(content)
+    layout.addWidget(scroll_area)
+
+    window.show()
+    process_events(0.1)
+    return window
+
+
+def bench_theme_switch(card_count, repeat):
+    """
+    测量指定卡片数量下的主题切换耗时
+
+    Args:
+        card_count (int): 卡片数量
+        repeat (int): 计时次数
+
+    Returns:
+        dict: 耗时统计（毫秒）
+    """
+    from ui.styles import theme_manager
+
+    window = build_window(card_count)
+
+    def switch():
+        theme = "light" if theme_manager.is_dark_theme() else "dark"
+        theme_manager.set_theme(theme)
+        process_events()
+
+    try:
+        return measure(switch, repeat=repeat)
+    finally:
+        window.close()
+        window.deleteLater()
+        process_events()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="主题切换耗时基准测试")
+    parser.add_argument("--cards", type=int, nargs="+", default=DEFAULT_CARD_COUNTS, help="卡片数量 (默认: 10 100 1000)")
+    parser.add_argument("--repeat", type=int, default=20, help="每组计时次数 (默认: 20)")
+    args = parser.parse_args()
+
+    get_app()
+    rows = [(f"{count} 个卡片", bench_theme_switch(count, args.repeat)) for count in args.cards]
+    print_table("主题切换耗时 (set_theme + 重绘)", rows)
+
+
+if __name__ == "__main__":
+    main()
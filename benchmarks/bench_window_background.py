@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+半透明主窗口背景绘制耗时基准测试
+
+构建与主窗口相同的无边框半透明窗口（由 CustomTitleBar 绘制圆角背景），
+窗口中的 ModernSwitch 持续切换，统计每帧窗口背景 paintEvent 的耗时和整帧耗时。对比两种实现:
+- cached: 当前实现，背景缓存为图片，只绘制需要重绘的区域
+- path: 旧实现，每次重绘都用画笔绘制整个抗锯齿圆角矩形
+
+用法:
+    python -m benchmarks.bench_window_background
+    python -m benchmarks.bench_window_background --width 700 --height 800 --duration 2
+"""
+
+import time
+import argparse
+from benchmarks.common import get_app, process_events, summarize, print_table
+
+DEFAULT_WIDTH = 700
+DEFAULT_HEIGHT = 800
+DEFAULT_DURATION = 2.0
+
+
+def _legacy_titlebar_class():
+    """创建模拟旧实现的标题栏类，每次重绘都绘制完整的圆角背景"""
+    from PyQt6.QtGui import QPainter, QBrush, QColor, QPen, QPainterPath
+    from ui.components.custom_titlebar import CustomTitleBar
+    from ui.styles import AntColors, AntColorsDark, theme_manager
+
+    class LegacyTitleBar(CustomTitleBar):
+        def _parent_paintEvent(self, event):
+            self.parent_widget._original_paintEvent(event)
+
+            painter = QPainter(self.parent_widget)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+            colors = AntColorsDark if theme_manager.get_current_theme() == "dark" else AntColors
+            painter.setBrush(QBrush(QColor(colors.GRAY_1)))
+            painter.setPen(QPen(QColor(colors.GRAY_4), 1))
+
+            path = QPainterPath()
+            rect = self.parent_widget.rect().adjusted(1, 1, -1, -1)
+            path.addRoundedRect(float(rect.x()), float(rect.y()), float(rect.width()), float(rect.height()), 12.0, 12.0)
+            painter.drawPath(path)
+
+    return LegacyTitleBar
+
+
+def build_window(titlebar_class, width, height):
+    """
+    构建无边框半透明窗口
+
+    Returns:
+        tuple: (窗口, 开关, 背景绘制耗时样本列表)
+    """
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
+    from ui.components import ModernSwitch
+
+    window = QWidget()
+    window.setWindowFlags(Qt.WindowType.FramelessWindowHint)
+    window.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
+    window.resize(width, height)
+
+    layout = QVBoxLayout(window)
+    layout.addWidget(titlebar_class(window))
+    row = QHBoxLayout()
+    row.addWidget(QLabel("开关"))
+    row.addStretch()
+    switch = ModernSwitch()
+    row.addWidget(switch)
+    layout.addLayout(row)
+    layout.addStretch()
+
+    # 统计窗口背景 paintEvent 的耗时
+    paint_samples = []
+    paint_event = window.paintEvent
+
+    def timed_paint_event(event):
+        start = time.perf_counter()
+        paint_event(event)
+        paint_samples.append((time.perf_counter() - start) * 1000)
+
+    window.paintEvent = timed_paint_event
+
+    window.show()
+    process_events(0.2)
+    return window, switch, paint_samples
+
+
+def bench_window_background(titlebar_class, width, height, duration, frame_interval=0.016):
+    """
+    在开关动画持续运行期间统计每帧耗时
+
+    Returns:
+        tuple: (背景绘制统计, 整帧统计)
+    """
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    window, switch, paint_samples = build_window(titlebar_class, width, height)
+    try:
+        paint_samples.clear()
+        frame_samples = []
+        start = time.perf_counter()
+        next_toggle = start
+        while time.perf_counter() - start < duration:
+            frame_start = time.perf_counter()
+            if frame_start >= next_toggle:
+                # 开关动画 200ms，持续切换使动画不间断运行
+                switch.setChecked(not switch.isChecked())
+                next_toggle = frame_start + 0.21
+            app.processEvents()
+            frame_samples.append((time.perf_counter() - frame_start) * 1000)
+            remaining = frame_interval - (time.perf_counter() - frame_start)
+            if remaining > 0:
+                time.sleep(remaining)
+        return summarize(paint_samples or [0.0]), summarize(frame_samples)
+    finally:
+        window.close()
+        window.deleteLater()
+        process_events()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="半透明主窗口背景绘制耗时基准测试")
+    parser.add_argument("--width", type=int, default=DEFAULT_WIDTH, help="窗口宽度 (默认: 700)")
+    parser.add_argument("--height", type=int, default=DEFAULT_HEIGHT, help="窗口高度 (默认: 800)")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION, help="统计时长秒数 (默认: 2)")
+    args = parser.parse_args()
+
+    get_app()
+    from ui.components.custom_titlebar import CustomTitleBar
+
+    rows = []
+    for name, titlebar_class in (("cached", CustomTitleBar), ("path", _legacy_titlebar_class())):
+        paint, frame = bench_window_background(titlebar_class, args.width, args.height, args.duration)
+        rows.append((f"{name} 背景绘制", paint))
+        rows.append((f"{name} 整帧", frame))
+    print_table(f"开关动画期间的窗口绘制耗时 ({args.width}x{args.height})", rows, label="实现")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+性能基准测试公共工具
+
+提供离屏运行的 QApplication、计时统计与结果表格输出，
+各基准测试脚本可直接运行，例如:
+    python -m benchmarks.bench_theme_switch
+"""
+
+import os
+import sys
+import time
+import statistics
+
+# 项目根目录
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+# 设置标准输出编码为UTF-8，解决Windows环境下中文输出问题
+if sys.stdout.encoding != 'utf-8':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except AttributeError:
+        import io
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+
+def get_app(offscreen=True):
+    """
+    获取基准测试使用的 QApplication，并应用项目主题
+
+    Args:
+        offscreen (bool): 是否使用离屏平台，避免弹出窗口并排除显示器刷新的影响
+
+    Returns:
+        QApplication: 应用程序实例
+    """
+    if offscreen:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    from PyQt6.QtWidgets import QApplication
+    from ui.styles import StyleApplier
+
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv[:1])
+        StyleApplier.apply_ant_design_theme(app)
+    return app
+
+
+def process_events(duration=0.0):
+    """
+    处理事件队列，duration 大于0时持续处理指定秒数（等待动画结束）
+
+    Args:
+        duration (float): 持续处理时间（秒）
+    """
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    deadline = time.perf_counter() + duration
+    app.processEvents()
+    while time.perf_counter() < deadline:
+        app.processEvents()
+
+
+def measure(func, repeat=20, warmup=2):
+    """
+    多次执行并统计耗时
+
+    Args:
+        func (callable): 被测函数
+        repeat (int): 计时次数
+        warmup (int): 预热次数，不计入统计
+
+    Returns:
+        dict: 耗时统计（毫秒），包含 mean/median/p95/min/max
+    """
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return summarize(samples)
+
+
+def summarize(samples):
+    """
+    汇总耗时样本
+
+    Args:
+        samples (list): 耗时样本（毫秒）
+
+    Returns:
+        dict: 耗时统计（毫秒）
+    """
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, int(round(len(ordered) * 0.95)) - 1)
+    return {
+        "count": len(ordered),
+        "mean": statistics.fmean(ordered),
+        "median": statistics.median(ordered),
+        "p95": ordered[max(0, p95_index)],
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+
+
+def print_table(title, rows, label="场景"):
+    """
+    输出耗时统计表格
+
+    Args:
+        title (str): 表格标题
+        rows (list): [(场景名称, 统计结果)]
+        label (str): 第一列标题
+    """
+    print("\n" + title)
+    print("=" * 72)
+    print(f"{label:<20}{'平均':>10}{'中位数':>10}{'P95':>10}{'最小':>10}{'最大':>10}")
+    print("-" * 72)
+    for name, stats in rows:
+        print(
+            f"{name:<20}{stats['mean']:>8.2f}ms{stats['median']:>8.2f}ms{stats['p95']:>8.2f}ms"
+            f"{stats['min']:>8.2f}ms{stats['max']:>8.2f}ms"
+        )
+    print("=" * 72)
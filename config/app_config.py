@@ -29,6 +29,16 @@ DEFAULT_CONFIG = {
         "close_to_tray": True,  # 关闭窗口时默认最小化到托盘
         "theme": "light",  # 默认浅色主题
         "check_update_on_start": True,  # 启动时检查更新默认开启
+        "tab_transition": "fade",  # 选项卡切换方式：fade 淡入淡出，instant 立即切换
+        "reduced_motion": False,  # 减少动画效果，开启后所有动画直接跳到结束状态
+    },
+    "update": {
+        "download_rate_limit_kb": 0,  # 更新包下载限速（KB/s），0表示不限速
+        "check_interval_hours": 24,  # 定期检查更新间隔（小时），0表示仅启动时检查
+        "skip_on_battery": True,  # 使用电池供电时跳过定期检查
+        # 发布信息和更新包镜像，{url} 会被替换为原始地址，"{url}" 表示直连
+        # 例如添加 "https://ghproxy.example.com/{url}" 使用 GitHub 代理镜像
+        "mirrors": ["{url}"],
     },
     "window": {"width": 700, "height": 800},  # 默认窗口尺寸
 }
@@ -38,6 +48,17 @@ SYSTEM_CONFIG = {
     "config_dir_name": ".ace-pyqt",  # 配置目录名称
     "log_dir_name": "logs",  # 日志目录名称
     "config_file_name": "config.yaml",  # 配置文件名称
+    "update_dir_name": "updates",  # 更新包下载目录名称
     "network_timeout": 10,  # 网络请求超时时间（秒）
+    "download_workers": 4,  # 更新包并行下载连接数
+    "update_check_jitter": 0.1,  # 定期检查更新的随机抖动比例
+    "mirror_stats_file_name": "mirror_stats.json",  # 镜像统计文件名称
+    "mirror_race_stagger": 0.3,  # 镜像竞速时相邻镜像发起请求的间隔（秒）
     "require_admin_privileges": False,  # 是否要求管理员权限启动应用程序
+    "profile_dir_name": "profiles",  # 性能分析报告目录名称
+    "event_profile_duration": 10,  # 托盘菜单“事件分析”的统计时长（秒）
+    "stall_threshold_ms": 200,  # 调试模式下GUI线程阻塞超过该时长（毫秒）时记录调用栈
+    "cpu_profile_duration": 30,  # 托盘菜单“CPU分析”的分析时长（秒）
+    "cpu_profile_mode": "sampling",  # CPU分析模式：sampling 采样所有线程，cprofile 确定性分析GUI线程
+    "cpu_profile_sample_rate": 100,  # 采样模式的采样频率（次/秒）
 }
@@ -25,6 +25,16 @@ class ConfigManager:
         "close_to_tray": ("application.close_to_tray", bool, None),
         "theme": ("application.theme", str, lambda x: x if x in ["light", "dark"] else None),
         "check_update_on_start": ("application.check_update_on_start", bool, None),
+        "tab_transition": ("application.tab_transition", str, lambda x: x if x in ["fade", "instant"] else None),
+        "reduced_motion": ("application.reduced_motion", bool, None),
+        "download_rate_limit_kb": ("update.download_rate_limit_kb", int, lambda x: x if x >= 0 else None),
+        "update_check_interval_hours": ("update.check_interval_hours", float, lambda x: x if x >= 0 else None),
+        "update_check_skip_on_battery": ("update.skip_on_battery", bool, None),
+        "update_mirrors": (
+            "update.mirrors",
+            list,
+            lambda x: [m for m in x if isinstance(m, str) and "{url}" in m] or None,
+        ),
         "window_width": ("window.width", int, None),
         "window_height": ("window.height", int, None),
     }
@@ -92,6 +102,11 @@ class ConfigManager:
         self.config_dir = os.path.join(os.path.expanduser("~"), self.system_config["config_dir_name"])
         self.log_dir = os.path.join(self.config_dir, self.system_config["log_dir_name"])
         self.config_file = os.path.join(self.config_dir, self.system_config["config_file_name"])
+        self.update_dir = os.path.join(self.config_dir, self.system_config.get("update_dir_name", "updates"))
+        self.profile_dir = os.path.join(self.config_dir, self.system_config.get("profile_dir_name", "profiles"))
+        self.mirror_stats_file = os.path.join(
+            self.config_dir, self.system_config.get("mirror_stats_file_name", "mirror_stats.json")
+        )
 
     def _init_config_attributes(self):
         """初始化配置属性为默认值"""
@@ -19,6 +19,9 @@ from utils import (
     send_notification,
     create_notification_thread,
     check_for_update,
+    get_install_dir,
+    UpdateStager,
+    get_cpu_profiler,
 )
 from ui import create_gui
 
@@ -72,6 +75,10 @@ def main(custom_app_info=None, custom_default_config=None, custom_system_config=
 
     logger.debug("🟩 程序已启动！")
 
+    # 处理已暂存的更新：切换目录需要在本进程退出后进行
+    if apply_staged_update(config_manager):
+        return
+
     icon_path = find_icon_path()
 
     # 通知线程
@@ -80,6 +87,11 @@ def main(custom_app_info=None, custom_default_config=None, custom_system_config=
     # 创建并运行PyQt6图形界面
     app, window = create_gui(config_manager, icon_path, start_minimized)
 
+    # 使用 --profile 或 --profile=cprofile 启动时立即开始CPU分析
+    profile_arg = next((arg for arg in sys.argv if arg == "--profile" or arg.startswith("--profile=")), None)
+    if profile_arg:
+        get_cpu_profiler().start_with_config(config_manager, mode=profile_arg.partition("=")[2] or None)
+
     app_name = config_manager.get_app_name()
     app_author = config_manager.get_app_author()
     github_repo = config_manager.get_github_repo()
@@ -117,5 +129,37 @@ def main(custom_app_info=None, custom_default_config=None, custom_system_config=
         logger.debug("🔴 程序已终止！")
 
 
+def apply_staged_update(config_manager):
+    """
+    启动时处理更新暂存目录
+
+    新版本启动后清理暂存标记；存在已暂存的新版本时启动切换脚本；
+    使用 --rollback-update 参数启动时恢复保留的旧版本。
+
+    Args:
+        config_manager (ConfigManager): 配置管理器
+
+    Returns:
+        bool: 是否已启动切换脚本（需要立即退出当前进程）
+    """
+    install_dir = get_install_dir()
+    if not install_dir:
+        return False
+
+    stager = UpdateStager(install_dir, f"{config_manager.get_app_name()}.exe")
+
+    if "--rollback-update" in sys.argv:
+        logger.info("正在回滚到上一个版本...")
+        return stager.launch_rollback(os.getpid(), config_manager.update_dir, relaunch=True)
+
+    stager.finish_applied()
+
+    if stager.get_pending():
+        logger.info("检测到已暂存的新版本，退出后切换...")
+        return stager.launch_apply(os.getpid(), config_manager.update_dir, relaunch=True)
+
+    return False
+
+
 if __name__ == "__main__":
     main()
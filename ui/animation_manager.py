@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+动画管理器
+
+各组件的 QPropertyAnimation / 动画组在此登记，并通过 animation_manager.start() 启动：
+- 批量恢复状态（如启动时加载设置）期间，动画直接跳到结束状态
+- 开启减少动画后，所有动画直接跳到结束状态
+- 主窗口隐藏到托盘时暂停正在运行的动画，重新显示后继续
+- 统计当前正在运行的动画数量
+
+管理器只保存动画的弱引用，不延长动画及其目标控件的生命周期，已被回收的动画在登记数量增长时批量清除。
+"""
+
+import weakref
+from contextlib import contextmanager
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QEvent, QAbstractAnimation, pyqtSignal
+from utils.logger import logger
+
+
+# 清除已回收动画的最小登记数量
+PRUNE_MIN_SIZE = 64
+
+
+class AnimationManager(QObject):
+    """动画管理器"""
+
+    # 正在运行的动画数量变化信号
+    active_count_changed = pyqtSignal(int)
+
+    def __init__(self):
+        super().__init__()
+        self._animations = {}  # {id: 动画弱引用}
+        self._prune_at = PRUNE_MIN_SIZE  # 登记数量达到该值时清除已回收的动画
+        self._active = set()  # 正在运行的动画 id
+        self._paused = set()  # 因窗口隐藏而暂停的动画 id
+        self._reduced_motion = False
+        self._suppress_depth = 0
+        self._window_hidden = False
+        self._window = None
+
+    def register(self, animation):
+        """
+        登记动画
+
+        Args:
+            animation (QAbstractAnimation): 动画或动画组
+
+        Returns:
+            QAbstractAnimation: 传入的动画，便于链式使用
+        """
+        key = id(animation)
+        # id 可能被已回收的动画使用过，以弱引用指向的对象为准
+        if self._get(key) is not animation:
+            if len(self._animations) >= self._prune_at:
+                self._prune()
+            self._animations[key] = weakref.ref(animation)
+            # 连接到本对象的方法，程序退出时管理器先于动画销毁也会自动断开；
+            # 不连接 destroyed：动画随控件被垃圾回收时，PyQt 向 Python 槽发送 destroyed 会导致崩溃
+            animation.stateChanged.connect(self._on_state_changed)
+        return animation
+
+    def start(self, animation, policy=QAbstractAnimation.DeletionPolicy.KeepWhenStopped):
+        """
+        启动动画，动画被禁用时直接跳到结束状态（仍会发出 finished 信号）
+
+        Args:
+            animation (QAbstractAnimation): 动画或动画组
+            policy (QAbstractAnimation.DeletionPolicy): 动画结束后的删除策略
+        """
+        self.register(animation)
+        animation.start(policy)
+        if not self.is_enabled() and animation.totalDuration() >= 0:
+            animation.setCurrentTime(animation.totalDuration())
+
+    def is_enabled(self):
+        """当前是否播放动画"""
+        return not (self._reduced_motion or self._suppress_depth > 0 or self._window_hidden)
+
+    @contextmanager
+    def suppressed(self):
+        """
+        批量更新状态期间禁用动画
+
+        用法:
+            with animation_manager.suppressed():
+                switch.setChecked(True)
+        """
+        self._suppress_depth += 1
+        try:
+            yield
+        finally:
+            self._suppress_depth -= 1
+
+    def set_reduced_motion(self, enabled):
+        """
+        设置减少动画模式，开启后立即结束正在运行的动画
+
+        Args:
+            enabled (bool): 是否减少动画
+        """
+        self._reduced_motion = bool(enabled)
+        if self._reduced_motion:
+            self.finish_all()
+        logger.debug(f"减少动画模式: {'开启' if self._reduced_motion else '关闭'}")
+
+    def is_reduced_motion(self):
+        """是否开启减少动画模式"""
+        return self._reduced_motion
+
+    def attach_window(self, window):
+        """
+        监听主窗口的显示/隐藏，窗口隐藏时暂停所有动画
+
+        Args:
+            window (QWidget): 主窗口
+        """
+        if self._window is not None:
+            self._window.removeEventFilter(self)
+            self._window.destroyed.disconnect(self._on_window_destroyed)
+        self._window = window
+        self._window_hidden = not window.isVisible()
+        window.installEventFilter(self)
+        window.destroyed.connect(self._on_window_destroyed)
+
+    def _on_window_destroyed(self, *args):
+        """主窗口销毁后不再引用它，动画恢复运行"""
+        self._window = None
+        if self._window_hidden:
+            self._window_hidden = False
+            self.resume_all()
+
+    def eventFilter(self, obj, event):
+        if obj is self._window:
+            if event.type() == QEvent.Type.Hide and not obj.isVisible():
+                self._window_hidden = True
+                self.pause_all()
+            elif event.type() == QEvent.Type.Show:
+                self._window_hidden = False
+                self.resume_all()
+        return False
+
+    def pause_all(self):
+        """暂停所有正在运行的动画"""
+        for key in list(self._active):
+            animation = self._get(key)
+            if animation is not None and animation.state() == QAbstractAnimation.State.Running:
+                animation.pause()
+                self._paused.add(key)
+        if self._paused:
+            logger.debug(f"窗口已隐藏，暂停 {len(self._paused)} 个动画")
+
+    def resume_all(self):
+        """恢复因窗口隐藏而暂停的动画"""
+        paused, self._paused = self._paused, set()
+        for key in paused:
+            animation = self._get(key)
+            if animation is not None and animation.state() == QAbstractAnimation.State.Paused:
+                animation.resume()
+
+    def finish_all(self):
+        """让所有正在运行的动画立即跳到结束状态"""
+        for key in list(self._active):
+            animation = self._get(key)
+            if animation is not None and animation.totalDuration() >= 0:
+                animation.setCurrentTime(animation.totalDuration())
+
+    def active_count(self):
+        """正在运行（含暂停）的动画数量"""
+        return len(self._active)
+
+    def get_stats(self):
+        """
+        获取动画统计信息
+
+        Returns:
+            dict: 登记数量、运行数量、暂停数量和当前模式
+        """
+        self._prune()
+        return {
+            "registered": len(self._animations),
+            "active": len(self._active),
+            "paused": len(self._paused),
+            "reduced_motion": self._reduced_motion,
+            "suppressed": self._suppress_depth > 0,
+            "window_hidden": self._window_hidden,
+        }
+
+    def _on_state_changed(self, new_state, old_state):
+        """跟踪动画运行状态"""
+        key = id(self.sender())
+        count = len(self._active)
+        if new_state == QAbstractAnimation.State.Stopped:
+            self._active.discard(key)
+            self._paused.discard(key)
+        else:
+            self._active.add(key)
+        if len(self._active) != count:
+            self.active_count_changed.emit(len(self._active))
+
+    def _get(self, key):
+        """获取登记的动画，已被回收或 C++ 对象已随父对象销毁时返回 None"""
+        ref = self._animations.get(key)
+        animation = ref() if ref is not None else None
+        return None if animation is None or sip.isdeleted(animation) else animation
+
+    def _prune(self):
+        """清除已回收的动画（动画析构前会先停止，运行数量已在状态变化时更新）"""
+        for key in [key for key in self._animations if self._get(key) is None]:
+            del self._animations[key]
+            self._active.discard(key)
+            self._paused.discard(key)
+        self._prune_at = max(PRUNE_MIN_SIZE, len(self._animations) * 2)
+
+
+# 全局动画管理器实例
+animation_manager = AnimationManager()
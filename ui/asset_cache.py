@@ -0,0 +1,316 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+图标与图片资源缓存
+
+- 存在由 utils/build_assets.py 生成的资源包 assets.rcc 时，通过 QResource 映射加载，
+  资源按包内清单直接解析为 ":/" 路径，无需访问文件系统；SVG 的预栅格化图片优先使用
+- 否则资源路径只解析一次（开发环境使用项目根目录，打包环境额外查找可执行文件所在目录）
+- SVG 按 (尺寸, 设备像素比, 着色) 直接栅格化为图片，其他图片平滑缩放，各控件共享同一张图片
+- 图片按最近最少使用（LRU）淘汰，总字节数不超过预算
+- 统计命中、未命中和淘汰次数
+"""
+
+import os
+import sys
+import json
+from collections import OrderedDict
+from PyQt6.QtCore import Qt, QSize, QRectF, QFile, QIODevice, QResource
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap
+from PyQt6.QtSvg import QSvgRenderer
+from utils.logger import logger
+
+# 默认缓存预算（字节）
+DEFAULT_BUDGET_BYTES = 8 * 1024 * 1024
+
+# 资源包文件名及包内清单路径
+ASSET_BUNDLE_NAME = "assets.rcc"
+ASSET_MANIFEST_PATH = "assets/manifest.json"
+
+
+def variant_key(width, height, dpr):
+    """
+    预栅格化图片在清单中的键
+
+    Args:
+        width (int): 逻辑宽度
+        height (int): 逻辑高度
+        dpr (float): 设备像素比
+
+    Returns:
+        str: 如 "12x12@1.5"
+    """
+    return f"{width}x{height}@{dpr:g}"
+
+
+def rasterize_svg(renderer, width, height):
+    """
+    将 SVG 栅格化为指定像素尺寸的图片，与 QIcon 一致按整数像素保持宽高比缩放后居中
+
+    Args:
+        renderer (QSvgRenderer): SVG 渲染器
+        width (int): 图片宽度（设备像素）
+        height (int): 图片高度（设备像素）
+
+    Returns:
+        QImage: 栅格化后的图片
+    """
+    fitted = renderer.defaultSize().scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio)
+    image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+    renderer.render(
+        painter,
+        QRectF(width // 2 - fitted.width() // 2, height // 2 - fitted.height() // 2, fitted.width(), fitted.height()),
+    )
+    painter.end()
+    return image
+
+
+class AssetCache:
+    """图标与图片资源缓存"""
+
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES):
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self._search_dirs = [project_root, os.path.dirname(sys.executable)]
+        self._budget_bytes = budget_bytes
+        self._paths = {}  # {资源名: 绝对路径或 None}
+        self._pixmaps = OrderedDict()  # {(路径, 宽, 高, 设备像素比, 着色): (图片, 字节数)}
+        self._renderers = {}  # {SVG路径: QSvgRenderer}
+        self._total_bytes = 0
+        self._manifest = None  # 资源包清单 {资源名: 信息}
+        self._bundle_path = None
+        self._bundle_checked = False
+
+        # 统计信息
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def resolve(self, name):
+        """
+        解析资源路径，结果会被缓存，不存在的资源只警告一次
+
+        Args:
+            name (str): 资源的绝对路径或相对项目根目录的路径，如 "assets/icon/minus.svg"
+
+        Returns:
+            str: 资源的绝对路径，不存在时返回 None
+        """
+        if name in self._paths:
+            return self._paths[name]
+        if name.startswith(":/"):
+            return name
+
+        self._ensure_bundle()
+        if self._manifest is not None and name in self._manifest:
+            path = ":/" + name
+            self._paths[name] = path
+            return path
+
+        candidates = [name] if os.path.isabs(name) else []
+        candidates += [os.path.join(base, name) for base in self._search_dirs]
+        # 打包环境中资源可能直接位于可执行文件目录下
+        candidates.append(os.path.join(self._search_dirs[-1], os.path.basename(name)))
+
+        path = next((candidate for candidate in candidates if os.path.exists(candidate)), None)
+        if path is None:
+            logger.warning(f"资源文件不存在: {name}")
+        self._paths[name] = path
+        return path
+
+    def url(self, name):
+        """
+        获取样式表 url() 中使用的资源路径
+
+        Args:
+            name (str): 资源路径，规则同 resolve()
+
+        Returns:
+            str: 资源包路径或使用正斜杠的绝对路径，资源不存在时原样返回
+        """
+        path = self.resolve(name)
+        return path.replace("\\", "/") if path else name
+
+    def load_bundle(self, bundle_path=None):
+        """
+        注册资源包并读取清单
+
+        Args:
+            bundle_path (str): 资源包路径，为 None 时在项目根目录和可执行文件目录中查找
+
+        Returns:
+            bool: 是否加载成功
+        """
+        self._bundle_checked = True
+        if bundle_path is None:
+            candidates = [os.path.join(base, ASSET_BUNDLE_NAME) for base in self._search_dirs]
+            bundle_path = next((candidate for candidate in candidates if os.path.exists(candidate)), None)
+            if bundle_path is None:
+                return False
+
+        # QResource 以内存映射方式加载资源包
+        if not QResource.registerResource(bundle_path):
+            logger.warning(f"无法注册资源包: {bundle_path}")
+            return False
+
+        manifest_file = QFile(":/" + ASSET_MANIFEST_PATH)
+        if not manifest_file.open(QIODevice.OpenModeFlag.ReadOnly):
+            logger.warning(f"资源包缺少清单: {bundle_path}")
+            return False
+        try:
+            manifest = json.loads(bytes(manifest_file.readAll()).decode("utf-8"))
+        except ValueError as e:
+            logger.warning(f"资源包清单无效: {e}")
+            return False
+        finally:
+            manifest_file.close()
+
+        self._manifest = manifest.get("files", {})
+        self._bundle_path = bundle_path
+        self._paths.clear()
+        logger.debug(f"已加载资源包: {bundle_path}，共 {len(self._manifest)} 个资源")
+        return True
+
+    def _ensure_bundle(self):
+        """首次解析资源时尝试加载资源包"""
+        if not self._bundle_checked:
+            self.load_bundle()
+
+    def _variant_path(self, path, size, dpr):
+        """查找资源包中与尺寸和设备像素比匹配的预栅格化图片"""
+        if self._manifest is None or not path.startswith(":/"):
+            return None
+        entry = self._manifest.get(path[2:], {})
+        variant = entry.get("variants", {}).get(variant_key(size.width(), size.height(), dpr))
+        return ":/" + variant if variant else None
+
+    def pixmap(self, name, size, dpr=1.0, tint=None):
+        """
+        获取指定尺寸的资源图片
+
+        Args:
+            name (str): 资源路径，规则同 resolve()
+            size (int | QSize): 逻辑尺寸，非 SVG 图片保持宽高比缩放到该尺寸以内
+            dpr (float): 设备像素比
+            tint (QColor | str): 着色颜色，为 None 时保持原色
+
+        Returns:
+            QPixmap: 已设置设备像素比的图片，资源不存在或加载失败时返回空图片
+        """
+        path = self.resolve(name)
+        if path is None:
+            return QPixmap()
+
+        if isinstance(size, int):
+            size = QSize(size, size)
+        tint_key = QColor(tint).rgba() if tint is not None else None
+        key = (path, size.width(), size.height(), dpr, tint_key)
+
+        entry = self._pixmaps.get(key)
+        if entry is not None:
+            self._hits += 1
+            self._pixmaps.move_to_end(key)
+            return entry[0]
+
+        self._misses += 1
+        pixmap = self._render(path, size, dpr, tint)
+        if pixmap.isNull():
+            return pixmap
+
+        nbytes = pixmap.width() * pixmap.height() * 4
+        self._pixmaps[key] = (pixmap, nbytes)
+        self._total_bytes += nbytes
+        self._evict()
+        return pixmap
+
+    def _render(self, path, size, dpr, tint):
+        """栅格化 SVG 或缩放普通图片"""
+        device_width = max(1, round(size.width() * dpr))
+        device_height = max(1, round(size.height() * dpr))
+
+        variant = self._variant_path(path, size, dpr) if tint is None else None
+        if variant is not None:
+            pixmap = QPixmap(variant)
+            pixmap.setDevicePixelRatio(dpr)
+            return pixmap
+
+        if path.lower().endswith(".svg"):
+            renderer = self._renderers.get(path)
+            if renderer is None:
+                renderer = QSvgRenderer(path)
+                self._renderers[path] = renderer
+            if not renderer.isValid():
+                logger.warning(f"无法加载SVG资源: {path}")
+                return QPixmap()
+            image = rasterize_svg(renderer, device_width, device_height)
+        else:
+            image = QImage(path)
+            if image.isNull():
+                logger.warning(f"无法加载图片资源: {path}")
+                return QPixmap()
+            image = image.scaled(
+                device_width,
+                device_height,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+
+        if tint is not None:
+            image = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+            painter = QPainter(image)
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+            painter.fillRect(image.rect(), QColor(tint))
+            painter.end()
+
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(dpr)
+        return pixmap
+
+    def _evict(self):
+        """超出预算时淘汰最近最少使用的图片（至少保留最新的一张）"""
+        while self._total_bytes > self._budget_bytes and len(self._pixmaps) > 1:
+            _, (_, nbytes) = self._pixmaps.popitem(last=False)
+            self._total_bytes -= nbytes
+            self._evictions += 1
+
+    def set_budget(self, budget_bytes):
+        """
+        设置缓存预算
+
+        Args:
+            budget_bytes (int): 缓存图片的总字节数上限
+        """
+        self._budget_bytes = budget_bytes
+        self._evict()
+
+    def clear(self):
+        """清空图片缓存（保留路径解析结果）"""
+        self._pixmaps.clear()
+        self._renderers.clear()
+        self._total_bytes = 0
+
+    def get_stats(self):
+        """
+        获取缓存统计信息
+
+        Returns:
+            dict: 命中、未命中、淘汰次数，缓存数量和字节数
+        """
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total else 0.0,
+            "evictions": self._evictions,
+            "entries": len(self._pixmaps),
+            "bytes": self._total_bytes,
+            "budget_bytes": self._budget_bytes,
+            "bundle": self._bundle_path,
+        }
+
+
+# 全局资源缓存实例
+asset_cache = AssetCache()
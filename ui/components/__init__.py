@@ -8,6 +8,7 @@ from .custom_titlebar import CustomTitleBar
 from .modern_switch import ModernSwitch
 from .navigation_tabs import NavigationTabs, NavigationTabWidget
 from .card_group_box import CardGroupBox
+from .paint_hud import PaintHud
 
 __all__ = [
     "CircleButton",
@@ -16,4 +17,5 @@ __all__ = [
     "NavigationTabs",
     "NavigationTabWidget",
     "CardGroupBox",
+    "PaintHud",
 ]
@@ -3,11 +3,129 @@
 
 """现代化卡片样式的QGroupBox组件"""
 
-from PyQt6.QtWidgets import QGroupBox, QVBoxLayout, QHBoxLayout, QLabel, QWidget, QGraphicsDropShadowEffect
-from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, pyqtProperty, QRectF
+import weakref
+from PyQt6 import sip
+from PyQt6.QtWidgets import QGroupBox, QVBoxLayout, QHBoxLayout, QLabel, QWidget
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QPropertyAnimation,
+    QEasingCurve,
+    pyqtProperty,
+    QRectF,
+    QPointF,
+    QRect,
+    QObject,
+    QEvent,
+)
 from PyQt6.QtGui import QPainter, QPainterPath, QColor, QBrush, QPen
 from ui.styles import theme_manager, AntColors, AntColorsDark
-from utils import logger
+from ui.shadow_renderer import shadow_renderer
+from ui.animation_manager import animation_manager
+from ui.signal_registry import signal_registry
+
+# 默认圆角半径
+DEFAULT_BORDER_RADIUS = 12
+
+# 卡片阴影参数
+SHADOW_BLUR = 12
+SHADOW_COLOR = QColor(0, 0, 0, 40)
+SHADOW_OFFSET = QPointF(0, 4)
+
+# 各主题的卡片颜色缓存 {主题: (背景色, 边框色, 悬停背景色, 悬停边框色)}
+_card_colors_cache = {}
+
+
+def _get_card_colors(theme):
+    """
+    获取指定主题的卡片颜色，同一主题只创建一次 QColor
+
+    Args:
+        theme (str): 主题名称
+
+    Returns:
+        tuple: (背景色, 边框色, 悬停背景色, 悬停边框色)
+    """
+    colors = _card_colors_cache.get(theme)
+    if colors is None:
+        palette = AntColorsDark if theme == "dark" else AntColors
+        colors = (QColor(palette.GRAY_1), QColor(palette.GRAY_4), QColor(palette.GRAY_2), QColor(palette.PRIMARY_4))
+        _card_colors_cache[theme] = colors
+    return colors
+
+
+def _blend_color(start, end, ratio):
+    """按比例混合两种颜色"""
+    return QColor(
+        round(start.red() + (end.red() - start.red()) * ratio),
+        round(start.green() + (end.green() - start.green()) * ratio),
+        round(start.blue() + (end.blue() - start.blue()) * ratio),
+        round(start.alpha() + (end.alpha() - start.alpha()) * ratio),
+    )
+
+
+class _CardShadowHost(QObject):
+    """卡片阴影宿主
+
+    安装在卡片的父控件上，在父控件绘制时于所有子控件下方绘制缓存的九宫格阴影，
+    阴影超出卡片边界的部分因此无需卡片自身离屏渲染。
+
+    宿主只保存卡片的弱引用，已销毁的卡片在绘制时清除。不监听卡片的 destroyed 信号：
+    卡片与父控件形成引用环被垃圾回收时，PyQt 向 Python 槽发送 destroyed 会导致崩溃。
+    """
+
+    OBJECT_NAME = "_card_shadow_host"
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setObjectName(self.OBJECT_NAME)
+        self._cards = {}  # {id: 卡片弱引用}
+        parent.installEventFilter(self)
+
+    @classmethod
+    def for_widget(cls, widget):
+        """获取控件上的阴影宿主，不存在时创建"""
+        host = widget.findChild(cls, cls.OBJECT_NAME, Qt.FindChildOption.FindDirectChildrenOnly)
+        return host if host is not None else cls(widget)
+
+    def add_card(self, card):
+        """登记需要绘制阴影的卡片"""
+        self._cards[id(card)] = weakref.ref(card)
+
+    def remove_card(self, card):
+        """移除卡片"""
+        self._cards.pop(id(card), None)
+
+    def _live_cards(self):
+        """获取仍存在的卡片，同时清除已销毁的卡片"""
+        cards = []
+        for key, ref in list(self._cards.items()):
+            card = ref()
+            if card is None or sip.isdeleted(card):
+                del self._cards[key]
+            else:
+                cards.append(card)
+        return cards
+
+    def eventFilter(self, obj, event):
+        if event.type() != QEvent.Type.Paint or not self._cards:
+            return False
+
+        # 先让父控件绘制自身背景，再在子控件绘制之前叠加阴影
+        obj.event(event)
+
+        painter = None
+        for card in self._live_cards():
+            if not card.isVisible() or not card.shadowRect().intersects(event.rect()):
+                continue
+            if painter is None:
+                painter = QPainter(obj)
+            shadow_renderer.draw(
+                painter, QRectF(card.geometry()), card.borderRadius(), SHADOW_BLUR, SHADOW_COLOR, SHADOW_OFFSET
+            )
+        if painter is not None:
+            painter.end()
+        return True
 
 
 class CardGroupBox(QGroupBox):
@@ -33,16 +151,16 @@ class CardGroupBox(QGroupBox):
         self._is_hoverable = True
         self._is_clickable = False
         self._hover_state = False
-        self._border_radius = 12
+        self._border_radius = DEFAULT_BORDER_RADIUS
         self._padding = 16
         self._shadow_enabled = True
 
         # 主题相关属性
         self._current_theme = theme_manager.get_current_theme()
-        self._colors = self._get_theme_colors()
+        self._colors = _get_card_colors(self._current_theme)
 
-        # 动画属性
-        self._hover_opacity = 1.0
+        # 动画属性，hover_opacity 为悬停颜色的混合比例（0: 常态, 1: 完全悬停）
+        self._hover_opacity = 0.0
         self._animation = None
 
         # 初始化组件
@@ -51,13 +169,6 @@ class CardGroupBox(QGroupBox):
         self._setup_shadow()
         self._connect_signals()
 
-        # 设置初始样式
-        self._update_style()
-
-    def _get_theme_colors(self):
-        """获取当前主题的颜色配置"""
-        return AntColorsDark if self._current_theme == "dark" else AntColors
-
     def _setup_ui(self):
         """设置UI结构"""
         # 移除默认标题显示
@@ -84,89 +195,82 @@ class CardGroupBox(QGroupBox):
         self._animation = QPropertyAnimation(self, b"hover_opacity")
         self._animation.setDuration(200)
         self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        animation_manager.register(self._animation)
 
     def _setup_shadow(self):
-        """设置阴影效果"""
+        """设置阴影效果，阴影由父控件上的阴影宿主统一绘制"""
+        parent = self.parentWidget()
+        if parent is None:
+            return
+        host = _CardShadowHost.for_widget(parent)
         if self._shadow_enabled:
-            try:
-                shadow = QGraphicsDropShadowEffect()
-                shadow.setBlurRadius(12)
-                shadow.setColor(QColor(0, 0, 0, 40))
-                shadow.setOffset(0, 4)
-                # 将阴影应用到整个CardGroupBox而不是内部widget
-                self.setGraphicsEffect(shadow)
-            except Exception as e:
-                logger.warning(f"设置阴影效果失败: {e}")
-                self._shadow_enabled = False
+            host.add_card(self)
+        else:
+            host.remove_card(self)
+        self._update_shadow_area(self.geometry())
+
+    def _update_shadow_area(self, geometry):
+        """请求父控件重绘指定卡片位置对应的阴影区域"""
+        parent = self.parentWidget()
+        # 卡片随引用环被垃圾回收时，属性已清空而 C++ 析构仍会发送隐藏事件
+        if parent is not None and getattr(self, "_shadow_enabled", False):
+            rect = shadow_renderer.shadow_rect(QRectF(geometry), SHADOW_BLUR, SHADOW_OFFSET)
+            parent.update(rect.toAlignedRect())
+
+    def shadowRect(self):
+        """获取阴影在父控件坐标系中的区域"""
+        return shadow_renderer.shadow_rect(QRectF(self.geometry()), SHADOW_BLUR, SHADOW_OFFSET).toAlignedRect()
 
     def _connect_signals(self):
         """连接信号"""
-        # 监听主题变化
-        theme_manager.theme_changed.connect(self._on_theme_changed)
+        # 监听主题变化（卡片销毁时自动断开）
+        signal_registry.connect(theme_manager, "theme_changed", self._on_theme_changed)
 
     def _on_theme_changed(self, theme):
         """主题变化处理"""
         self._current_theme = theme
-        self._colors = self._get_theme_colors()
-        self._update_style()
+        self._colors = _get_card_colors(theme)
         self.update()
 
-    def _update_style(self):
-        """更新样式"""
-        # 卡片主体样式
-        card_bg = self._colors.GRAY_1
-        card_border = self._colors.GRAY_4
-        hover_bg = self._colors.GRAY_2 if self._is_hoverable else card_bg
-
-        # 根据悬停状态动态设置背景色
-        current_bg = hover_bg if (self._is_hoverable and self._hover_state) else card_bg
-        current_border = self._colors.PRIMARY_4 if (self._is_hoverable and self._hover_state) else card_border
-
-        style = f"""
-        CardGroupBox {{
-            background-color: transparent;
-            border: none;
-            margin: 0px;
-            padding: 0px;
-        }}
-
-        CardGroupBox > QWidget {{
-            background-color: {current_bg};
-            border: 1px solid {current_border};
-            border-radius: {self._border_radius}px;
-        }}
-
-        /* 只有主容器有背景，不影响特定UI组件 */
-        CardGroupBox > QWidget {{
-            background-color: {current_bg};
-            border: 1px solid {current_border};
-            border-radius: {self._border_radius}px;
-        }}
-
-        /* 确保容器内的布局容器背景透明，但不影响UI控件 */
-        CardGroupBox QWidget[objectName=""] {{
-            background-color: transparent;
-        }}
-        """
-
-        self.setStyleSheet(style)
+    def _current_colors(self):
+        """根据悬停动画进度计算当前的背景色和边框色"""
+        bg, border, hover_bg, hover_border = self._colors
+        ratio = self._hover_opacity if self._is_hoverable else 0.0
+        if ratio <= 0.0:
+            return bg, border
+        if ratio >= 1.0:
+            return hover_bg, hover_border
+        return _blend_color(bg, hover_bg, ratio), _blend_color(border, hover_border, ratio)
 
     def paintEvent(self, event):
-        """自定义绘制事件"""
-        # 让父类处理基础绘制
-        super().paintEvent(event)
+        """自定义绘制事件，直接绘制卡片背景和边框，悬停时无需重新应用样式表"""
+        bg, border = self._current_colors()
+        rect = QRectF(self._main_widget.geometry()).adjusted(0.5, 0.5, -0.5, -0.5)
+        radius = max(0.0, self._border_radius - 0.5)
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setPen(QPen(border, 1))
+        painter.setBrush(QBrush(bg))
+        painter.drawRoundedRect(rect, radius, radius)
+        painter.end()
+
+    def _animate_hover(self, end_value):
+        """启动悬停颜色过渡动画"""
+        if self._animation:
+            self._animation.stop()
+            self._animation.setStartValue(self._hover_opacity)
+            self._animation.setEndValue(end_value)
+            animation_manager.start(self._animation)
+        else:
+            self.set_hover_opacity(end_value)
 
     def enterEvent(self, event):
         """鼠标进入事件"""
         if self._is_hoverable:
             self._hover_state = True
             self.hovered.emit(True)
-            self._update_style()  # 重新应用样式以显示悬停效果
-
-            if self._animation:
-                self._animation.setStartValue(self._hover_opacity)
-                self._animation.setEndValue(0.9)
-                self._animation.start()
+            self._animate_hover(1.0)
 
         super().enterEvent(event)
 
@@ -175,15 +279,43 @@ class CardGroupBox(QGroupBox):
         if self._is_hoverable:
             self._hover_state = False
             self.hovered.emit(False)
-            self._update_style()  # 重新应用样式以移除悬停效果
-
-            if self._animation:
-                self._animation.setStartValue(self._hover_opacity)
-                self._animation.setEndValue(1.0)
-                self._animation.start()
+            self._animate_hover(0.0)
 
         super().leaveEvent(event)
 
+    def event(self, event):
+        """父控件变化时将阴影转移到新的父控件"""
+        if event.type() == QEvent.Type.ParentAboutToChange:
+            parent = self.parentWidget()
+            if parent is not None:
+                self._update_shadow_area(self.geometry())
+                _CardShadowHost.for_widget(parent).remove_card(self)
+        elif event.type() == QEvent.Type.ParentChange:
+            self._setup_shadow()
+        return super().event(event)
+
+    def moveEvent(self, event):
+        """移动时重绘新旧位置的阴影"""
+        self._update_shadow_area(QRect(event.oldPos(), self.size()))
+        self._update_shadow_area(self.geometry())
+        super().moveEvent(event)
+
+    def resizeEvent(self, event):
+        """尺寸变化时重绘新旧尺寸的阴影"""
+        self._update_shadow_area(QRect(self.pos(), event.oldSize()))
+        self._update_shadow_area(self.geometry())
+        super().resizeEvent(event)
+
+    def showEvent(self, event):
+        """显示时绘制阴影"""
+        self._update_shadow_area(self.geometry())
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        """隐藏时清除阴影"""
+        self._update_shadow_area(self.geometry())
+        super().hideEvent(event)
+
     def mousePressEvent(self, event):
         """鼠标点击事件"""
         if event.button() == Qt.MouseButton.LeftButton and self._is_clickable:
@@ -204,7 +336,12 @@ class CardGroupBox(QGroupBox):
     def setHoverable(self, hoverable):
         """设置是否启用悬停效果"""
         self._is_hoverable = hoverable
-        self._update_style()
+        if not hoverable:
+            if self._animation:
+                self._animation.stop()
+            self._hover_state = False
+            self._hover_opacity = 0.0
+        self.update()
 
     def isHoverable(self):
         """获取是否启用悬停效果"""
@@ -225,7 +362,7 @@ class CardGroupBox(QGroupBox):
     def setBorderRadius(self, radius):
         """设置圆角半径"""
         self._border_radius = radius
-        self._update_style()
+        self.update()
 
     def borderRadius(self):
         """获取圆角半径"""
@@ -243,12 +380,10 @@ class CardGroupBox(QGroupBox):
 
     def setShadowEnabled(self, enabled):
         """设置是否启用阴影"""
+        if not enabled:
+            self._update_shadow_area(self.geometry())
         self._shadow_enabled = enabled
-        if enabled:
-            self._setup_shadow()
-        else:
-            # 移除阴影效果
-            self.setGraphicsEffect(None)
+        self._setup_shadow()
 
     def isShadowEnabled(self):
         """获取是否启用阴影"""
@@ -3,7 +3,9 @@
 
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtCore import Qt, pyqtSignal, QSize
-from PyQt6.QtGui import QPainter, QColor, QPainterPath, QIcon
+from PyQt6.QtGui import QPainter
+from ui.asset_cache import asset_cache
+from ui.paint_resources import paint_resources
 
 
 class CircleButton(QWidget):
@@ -14,7 +16,7 @@ class CircleButton(QWidget):
         super().__init__(parent)
         self._default_color = "#FF5F57"
         self._hover_color = "#FF5F57"
-        self._icon = None
+        self._icon = None  # 图标路径，图片由资源缓存按尺寸和设备像素比提供
         self._icon_size = 10
         self._is_hover = False
 
@@ -29,7 +31,7 @@ class CircleButton(QWidget):
 
     def setIcon(self, icon_path):
         """设置按钮图标"""
-        self._icon = QIcon(icon_path)
+        self._icon = icon_path
         self.update()
 
     def setIconSize(self, size):
@@ -51,19 +53,16 @@ class CircleButton(QWidget):
 
     def _draw_background(self, painter):
         """绘制按钮背景"""
-        path = QPainterPath()
-        path.addEllipse(0, 0, self.width(), self.height())
-
-        color = QColor(self._hover_color if self._is_hover else self._default_color)
-        painter.fillPath(path, color)
+        path = paint_resources.ellipse_path(self.width(), self.height())
+        painter.fillPath(path, paint_resources.brush(self._hover_color if self._is_hover else self._default_color))
 
     def _draw_icon(self, painter):
         """绘制图标"""
         icon_pos_x = (self.width() - self._icon_size) // 2
         icon_pos_y = (self.height() - self._icon_size) // 2
-        self._icon.paint(
-            painter, icon_pos_x, icon_pos_y, self._icon_size, self._icon_size
-        )
+        pixmap = asset_cache.pixmap(self._icon, self._icon_size, self.devicePixelRatioF())
+        if not pixmap.isNull():
+            painter.drawPixmap(icon_pos_x, icon_pos_y, pixmap)
 
     def enterEvent(self, event):
         """鼠标进入事件"""
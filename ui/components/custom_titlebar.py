@@ -1,7 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import os
+import math
+from collections import OrderedDict
 from dataclasses import dataclass
 from PyQt6.QtWidgets import QWidget, QLabel, QHBoxLayout
 from PyQt6.QtCore import (
@@ -15,11 +16,20 @@ from PyQt6.QtCore import (
     QRectF,
     QTimer,
 )
-from PyQt6.QtGui import QIcon, QPainter, QBrush, QColor, QPen, QPainterPath, QRegion
+from PyQt6.QtGui import QIcon, QPainter, QBrush, QColor, QPen, QPainterPath, QPixmap, QRegion, QGuiApplication
 from .circle_button import CircleButton
 from ui.styles import AntColors, AntColorsDark, theme_manager
+from ui.animation_manager import animation_manager
+from ui.repaint_scheduler import repaint_scheduler
+from ui.asset_cache import asset_cache
+from ui.signal_registry import signal_registry
 from utils import logger
 
+# 窗口合成器始终开启的平台，可直接依靠半透明背景绘制圆角
+COMPOSITED_PLATFORMS = ("windows", "cocoa", "wayland")
+# 不支持窗口遮罩的平台
+MASKLESS_PLATFORMS = ("offscreen", "minimal")
+
 
 @dataclass
 class TitleBarConfig:
@@ -32,6 +42,7 @@ class TitleBarConfig:
     BUTTON_SIZE: int = 20  # 右上角button大小
     ICON_SIZE: int = 12  # 右上角button内的icon大小
     FAVICON_SIZE: int = 20  # favicon图标大小
+    WINDOW_RADIUS: int = 12  # 窗口圆角半径
 
     # 按钮颜色配置
     COLORS = {
@@ -49,6 +60,72 @@ class TitleBarConfig:
     }
 
 
+class RoundedRegionCache:
+    """
+    圆角窗口遮罩缓存
+
+    每个圆角半径只计算一次圆角每一行的缩进，遮罩由上下圆角的逐行矩形和中间的整块矩形组成，
+    无需构建 QPainterPath 并展开为多边形。生成的遮罩按 (宽, 高, 半径) 缓存最近使用的若干个。
+    """
+
+    MAX_REGIONS = 8
+
+    def __init__(self):
+        self._insets = {}  # {半径: 每行缩进}
+        self._regions = OrderedDict()  # {(宽, 高, 半径): QRegion}
+
+    def _corner_insets(self, radius):
+        """计算圆角区域每一行左右两侧的缩进像素"""
+        insets = self._insets.get(radius)
+        if insets is None:
+            insets = []
+            for row in range(radius):
+                dy = radius - row - 0.5
+                dx = math.sqrt(max(0.0, radius * radius - dy * dy))
+                insets.append(int(round(radius - dx)))
+            self._insets[radius] = insets
+        return insets
+
+    def get(self, width, height, radius):
+        """
+        获取指定尺寸的圆角遮罩
+
+        Args:
+            width (int): 窗口宽度
+            height (int): 窗口高度
+            radius (int): 圆角半径
+
+        Returns:
+            QRegion: 圆角遮罩
+        """
+        radius = max(0, min(radius, width // 2, height // 2))
+        key = (width, height, radius)
+        region = self._regions.get(key)
+        if region is not None:
+            self._regions.move_to_end(key)
+            return region
+
+        insets = self._corner_insets(radius)
+        # 按从上到下的顺序排列互不重叠的矩形，可直接使用 setRects
+        rects = [QRect(inset, row, width - 2 * inset, 1) for row, inset in enumerate(insets)]
+        if height > 2 * radius:
+            rects.append(QRect(0, radius, width, height - 2 * radius))
+        rects.extend(
+            QRect(inset, height - 1 - row, width - 2 * inset, 1) for row, inset in reversed(list(enumerate(insets)))
+        )
+
+        region = QRegion()
+        region.setRects(rects)
+        self._regions[key] = region
+        if len(self._regions) > self.MAX_REGIONS:
+            self._regions.popitem(last=False)
+        return region
+
+
+# 全局圆角遮罩缓存
+rounded_region_cache = RoundedRegionCache()
+
+
 class CustomTitleBar(QWidget):
     def __init__(self, parent=None, show_systray=True, show_minimize=True, show_close=True):
         super().__init__(parent)
@@ -59,6 +136,20 @@ class CustomTitleBar(QWidget):
         self.minimize_animations = None
         self.taskbar_animation = None
 
+        # 窗口背景缓存 (键, 图片)
+        self._background_cache = None
+
+        # 调整窗口大小期间每帧最多更新一次遮罩
+        self._mask_timer = QTimer(self)
+        self._mask_timer.setSingleShot(True)
+        self._mask_timer.timeout.connect(self.apply_rounded_mask)
+
+        # 手动拖动窗口时每帧最多移动一次
+        self._pending_move_pos = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.timeout.connect(self._apply_pending_move)
+
         # 控制按钮显示
         self.show_systray = show_systray
         self.show_minimize = show_minimize
@@ -71,24 +162,14 @@ class CustomTitleBar(QWidget):
         self.setAutoFillBackground(True)
 
         # 连接主题切换信号
-        theme_manager.theme_changed.connect(self.update_parent_window)
+        signal_registry.connect(theme_manager, "theme_changed", self.update_parent_window)
 
         self.init_ui()
 
     def _get_icon_path(self, icon_key):
-        """获取图标的绝对路径"""
+        """获取图标的绝对路径（由资源缓存解析，每个图标只查找一次）"""
         try:
-            # 获取项目根目录
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = os.path.dirname(os.path.dirname(current_dir))
-            icon_path = os.path.join(project_root, self.config.ICONS[icon_key])
-
-            # 如果文件不存在，返回None
-            if not os.path.exists(icon_path):
-                logger.warning(f"图标文件不存在: {icon_path}")
-                return None
-
-            return icon_path
+            return asset_cache.resolve(self.config.ICONS[icon_key])
         except Exception as e:
             logger.error(f"获取图标路径失败: {e}")
             return None
@@ -132,21 +213,55 @@ class CustomTitleBar(QWidget):
             except:
                 pass
 
-        # 绘制圆角窗口背景
+        # 只把缓存背景中需要重绘的区域绘制到窗口上
+        dpr = self.parent_widget.devicePixelRatioF()
+        background = self._get_background_pixmap(self.parent_widget.size(), dpr)
+        target = event.rect()
+        source = QRectF(target.x() * dpr, target.y() * dpr, target.width() * dpr, target.height() * dpr)
+
         painter = QPainter(self.parent_widget)
+        painter.drawPixmap(QRectF(target), background, source)
+        painter.end()
+
+    def _get_background_pixmap(self, size, dpr):
+        """
+        获取圆角窗口背景图片，按 (尺寸, 主题, 设备像素比) 缓存
+
+        Args:
+            size (QSize): 窗口尺寸
+            dpr (float): 设备像素比
+
+        Returns:
+            QPixmap: 背景图片
+        """
+        theme = theme_manager.get_current_theme()
+        key = (size.width(), size.height(), theme, dpr)
+        if self._background_cache is not None and self._background_cache[0] == key:
+            return self._background_cache[1]
+
+        pixmap = QPixmap(max(1, round(size.width() * dpr)), max(1, round(size.height() * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
 
         # 获取当前主题颜色
-        colors = AntColorsDark if theme_manager.get_current_theme() == "dark" else AntColors
+        colors = AntColorsDark if theme == "dark" else AntColors
 
         # 绘制圆角背景
         painter.setBrush(QBrush(QColor(colors.GRAY_1)))
         painter.setPen(QPen(QColor(colors.GRAY_4), 1))
 
         path = QPainterPath()
-        rect = self.parent_widget.rect().adjusted(1, 1, -1, -1)
-        path.addRoundedRect(float(rect.x()), float(rect.y()), float(rect.width()), float(rect.height()), 12.0, 12.0)
+        rect = QRect(0, 0, size.width(), size.height()).adjusted(1, 1, -1, -1)
+        radius = float(self.config.WINDOW_RADIUS)
+        path.addRoundedRect(float(rect.x()), float(rect.y()), float(rect.width()), float(rect.height()), radius, radius)
         painter.drawPath(path)
+        painter.end()
+
+        self._background_cache = (key, pixmap)
+        return pixmap
 
     def _parent_showEvent(self, event):
         """父窗口的显示事件"""
@@ -175,22 +290,35 @@ class CustomTitleBar(QWidget):
             except:
                 pass
 
-        # 延迟应用遮罩以确保窗口完全调整大小后再应用
-        QTimer.singleShot(10, self.apply_rounded_mask)
+        # 合并同一帧内的多次大小变化，只在下一帧应用一次遮罩
+        if not self._mask_timer.isActive():
+            self._mask_timer.start(max(1, int(repaint_scheduler.frame_interval() * 1000)))
+
+    @staticmethod
+    def needs_window_mask():
+        """
+        是否需要使用窗口遮罩裁剪圆角
+
+        有窗口合成器时半透明背景已绘制出抗锯齿的圆角，无需遮罩；不支持遮罩的平台同样跳过。
+
+        Returns:
+            bool: 是否需要遮罩
+        """
+        platform = QGuiApplication.platformName()
+        return platform not in COMPOSITED_PLATFORMS and platform not in MASKLESS_PLATFORMS
 
     def apply_rounded_mask(self):
         """应用圆角遮罩到父窗口"""
         if not self.parent_widget:
             return
 
+        self._mask_timer.stop()
+        if not self.needs_window_mask():
+            return
+
         try:
-            # 创建圆角路径
-            path = QPainterPath()
             rect = self.parent_widget.rect()
-            path.addRoundedRect(float(rect.x()), float(rect.y()), float(rect.width()), float(rect.height()), 12.0, 12.0)
-
-            # 应用遮罩
-            region = QRegion(path.toFillPolygon().toPolygon())
+            region = rounded_region_cache.get(rect.width(), rect.height(), self.config.WINDOW_RADIUS)
             self.parent_widget.setMask(region)
 
         except Exception as e:
@@ -283,22 +411,38 @@ class CustomTitleBar(QWidget):
         return button
 
     def mousePressEvent(self, event):
-        """鼠标按下事件"""
+        """鼠标按下事件，优先交给窗口系统移动窗口"""
         if event.button() == Qt.MouseButton.LeftButton:
+            handle = self.parent_widget.windowHandle()
+            if handle is not None and handle.startSystemMove():
+                event.accept()
+                return
+
             self._start_pos = event.globalPosition().toPoint() - self.parent_widget.frameGeometry().topLeft()
             self._is_tracking = True
             event.accept()
 
     def mouseMoveEvent(self, event):
-        """鼠标移动事件"""
+        """鼠标移动事件（平台不支持系统移动时），每帧最多移动一次窗口"""
         if self._is_tracking and event.buttons() == Qt.MouseButton.LeftButton:
-            self.parent_widget.move(event.globalPosition().toPoint() - self._start_pos)
+            self._pending_move_pos = event.globalPosition().toPoint() - self._start_pos
+            if not self._move_timer.isActive():
+                self._move_timer.start(max(1, int(repaint_scheduler.frame_interval() * 1000)))
             event.accept()
 
     def mouseReleaseEvent(self, event):
         """鼠标释放事件"""
+        if self._is_tracking:
+            self._apply_pending_move()
         self._is_tracking = False
 
+    def _apply_pending_move(self):
+        """移动窗口到最近一次记录的位置"""
+        self._move_timer.stop()
+        if self._pending_move_pos is not None:
+            self.parent_widget.move(self._pending_move_pos)
+            self._pending_move_pos = None
+
     def minimize_to_tray(self):
         """最小化到系统托盘"""
         if self.minimize_animations is None:
@@ -344,7 +488,7 @@ class CustomTitleBar(QWidget):
         if hasattr(self.parent_widget, "is_custom_minimized"):
             self.parent_widget.is_custom_minimized = True
 
-        self.minimize_animations.start()
+        animation_manager.start(self.minimize_animations)
 
     def minimize_with_animation(self):
         """最小化到任务栏"""
@@ -356,7 +500,7 @@ class CustomTitleBar(QWidget):
 
         self.taskbar_animation.setStartValue(1.0)
         self.taskbar_animation.setEndValue(0.0)
-        self.taskbar_animation.start()
+        animation_manager.start(self.taskbar_animation)
 
     def _on_tray_minimize_finished(self):
         """托盘最小化动画完成后的处理"""
@@ -436,7 +580,7 @@ class CustomTitleBar(QWidget):
             restore_animations.finished.connect(lambda: self._on_restore_animation_finished(restore_animations))
 
             # 启动动画
-            restore_animations.start()
+            animation_manager.start(restore_animations)
 
             logger.debug("窗口正在从托盘恢复，带动画效果")
 
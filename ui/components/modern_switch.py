@@ -3,7 +3,9 @@
 
 from PyQt6.QtWidgets import QAbstractButton
 from PyQt6.QtCore import Qt, QSize, QPropertyAnimation, QEasingCurve, pyqtProperty, pyqtSignal
-from PyQt6.QtGui import QPainter, QColor, QBrush
+from PyQt6.QtGui import QPainter, QColor
+from ui.animation_manager import animation_manager
+from ui.paint_resources import paint_resources
 
 """
 信号触发流程
@@ -35,6 +37,7 @@ class ModernSwitch(QAbstractButton):
         self._animation = QPropertyAnimation(self, b"circle_position")
         self._animation.setEasingCurve(QEasingCurve.Type.OutBounce)  # 弹性缓动曲线
         self._animation.setDuration(500)  # 动画持续时间
+        animation_manager.register(self._animation)
 
         self.toggled.connect(self._on_toggled)
 
@@ -54,7 +57,7 @@ class ModernSwitch(QAbstractButton):
             self._animation.setEndValue(self.width() - self.height() + 2)
         else:
             self._animation.setEndValue(2)  # 设置动画结束值，用于匹配未选中状态
-        self._animation.start()
+        animation_manager.start(self._animation)
 
     def resizeEvent(self, event):
         """动态计算圆圈位置"""
@@ -72,21 +75,23 @@ class ModernSwitch(QAbstractButton):
         # 启用反锯齿
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # 根据控件状态设置背景颜色
+        # 根据控件状态设置背景颜色（画刷和路径由绘制资源缓存共享）
         if self.isChecked():
-            painter.setBrush(QBrush(self._checked_bg_color))
+            painter.setBrush(paint_resources.brush(self._checked_bg_color))
         else:
-            painter.setBrush(QBrush(self._bg_color))
+            painter.setBrush(paint_resources.brush(self._bg_color))
 
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(0, 0, self.width(), self.height(), self.height() / 2, self.height() / 2)
+        painter.drawPath(paint_resources.rounded_rect_path(self.width(), self.height(), self.height() / 2))
 
         circle_diameter = self.height() - 4
         circle_x = int(self._circle_position)
         circle_y = int((self.height() - circle_diameter) / 2)
 
         # 根据控件状态设置滑块圆圈的颜色
-        painter.setBrush(QBrush(self._circle_color if not self.isChecked() else self._checked_circle_color))
+        painter.setBrush(
+            paint_resources.brush(self._circle_color if not self.isChecked() else self._checked_circle_color)
+        )
         # 绘制滑块圆圈
         painter.drawEllipse(circle_x, circle_y, circle_diameter, circle_diameter)
 
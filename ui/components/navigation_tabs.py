@@ -30,7 +30,6 @@ from PyQt6.QtWidgets import (
     QStackedWidget,
     QFrame,
     QScrollArea,
-    QGraphicsOpacityEffect,
 )
 from PyQt6.QtCore import (
     Qt,
@@ -42,13 +41,20 @@ from PyQt6.QtCore import (
     pyqtProperty,
     QParallelAnimationGroup,
 )
-from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QFont
-from ui.styles import AntColors, AntColorsDark, theme_manager
+from PyQt6.QtGui import QIcon, QPixmap, QPainter, QFont
+from ui.styles import StyleHelper
+from ui.animation_manager import animation_manager
+from ui.repaint_scheduler import repaint_scheduler
+from ui.asset_cache import asset_cache
+from ui.paint_resources import paint_resources
 
 
 class NavigationButton(QPushButton):
     """导航按钮组件 - 带有Fluent Design风格的指示器和动画效果"""
 
+    # 指示器宽度
+    INDICATOR_WIDTH = 4
+
     def __init__(self, text: str, icon_text: str = "", parent=None):
         super().__init__(parent)
         self.text_content = text
@@ -77,9 +83,6 @@ class NavigationButton(QPushButton):
         # 应用样式
         self._update_style()
 
-        # 监听主题变化
-        theme_manager.theme_changed.connect(self._on_theme_changed)
-
     def _setup_layout(self):
         """设置按钮布局"""
         # 创建水平布局
@@ -91,11 +94,12 @@ class NavigationButton(QPushButton):
         self.icon_label = QLabel(self.icon_text)
         self.icon_label.setFixedSize(24, 24)
         self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.icon_label.setStyleSheet("font-size: 16px; font-weight: bold;")
+        self.icon_label.setObjectName("nav_icon_label")
 
         # 文本标签
         self.text_label = QLabel(self.text_content)
         self.text_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        self.text_label.setObjectName("nav_text_label")
         # 字体样式由CSS控制，删除冗余的setFont()调用
 
         layout.addWidget(self.icon_label)
@@ -122,6 +126,7 @@ class NavigationButton(QPushButton):
         # 添加到动画组
         self._animation_group.addAnimation(self._indicator_pos_animation)
         self._animation_group.addAnimation(self._indicator_opacity_animation)
+        animation_manager.register(self._animation_group)
 
     # 动画属性定义
     @pyqtProperty(float)
@@ -132,10 +137,8 @@ class NavigationButton(QPushButton):
     def indicatorPosition(self, value):
         if abs(self._indicator_position - value) > 0.01:  # 只有变化足够大时才更新
             self._indicator_position = value
-            # 使用QTimer.singleShot来避免在paintEvent中直接调用update()
-            from PyQt6.QtCore import QTimer
-
-            QTimer.singleShot(0, self.update)
+            # 由重绘调度器合并到下一帧，只重绘指示器所在区域
+            repaint_scheduler.schedule(self, self._indicator_repaint_rect())
 
     @pyqtProperty(float)
     def indicatorOpacity(self):
@@ -147,10 +150,11 @@ class NavigationButton(QPushButton):
         new_value = max(0.0, min(1.0, value))
         if abs(self._indicator_opacity - new_value) > 0.01:  # 只有变化足够大时才更新
             self._indicator_opacity = new_value
-            # 使用QTimer.singleShot来避免在paintEvent中直接调用update()
-            from PyQt6.QtCore import QTimer
+            repaint_scheduler.schedule(self, self._indicator_repaint_rect())
 
-            QTimer.singleShot(0, self.update)
+    def _indicator_repaint_rect(self):
+        """指示器可能覆盖的区域（指示器X坐标被限制在按钮左侧）"""
+        return QRect(0, 0, self.INDICATOR_WIDTH * 2, self.height())
 
     def setActive(self, active: bool):
         """设置激活状态并触发动画"""
@@ -186,7 +190,7 @@ class NavigationButton(QPushButton):
             self._indicator_opacity_animation.setEndValue(0.0)  # 完全透明
 
         # 启动动画组
-        self._animation_group.start()
+        animation_manager.start(self._animation_group)
 
     def _update_style(self):
         """更新样式"""
@@ -196,29 +200,12 @@ class NavigationButton(QPushButton):
         else:
             self.setProperty("buttonState", "inactive")
 
-        # 刷新样式以应用新的属性
-        self.style().unpolish(self)
-        self.style().polish(self)
-
-        # 更新内部标签的颜色（这些不在全局样式中定义）
-        colors = AntColorsDark if theme_manager.is_dark_theme() else AntColors
-
-        if self.is_active:
-            icon_color = colors.PRIMARY_6
-            text_color = colors.PRIMARY_6
-        else:
-            icon_color = colors.GRAY_7
-            text_color = colors.GRAY_9
-
-        # 只设置颜色，字体样式由CSS控制
+        # 刷新样式以应用新的属性，内部标签的颜色同样由 buttonState 决定
+        StyleHelper.repolish(self)
         if hasattr(self, "icon_label"):
-            self.icon_label.setStyleSheet(f"color: {icon_color};")
+            StyleHelper.repolish(self.icon_label)
         if hasattr(self, "text_label"):
-            self.text_label.setStyleSheet(f"color: {text_color};")
-
-    def _on_theme_changed(self, theme):
-        """主题变化时更新样式"""
-        self._update_style()
+            StyleHelper.repolish(self.text_label)
 
     def paintEvent(self, event):
         """自定义绘制事件 - 添加带动画的Fluent Design风格圆滑指示器"""
@@ -245,29 +232,23 @@ class NavigationButton(QPushButton):
             # 设置抗锯齿
             painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
 
-            # 获取当前主题颜色
-            colors = AntColorsDark if theme_manager.is_dark_theme() else AntColors
-
             # 绘制左侧圆滑指示条
-            indicator_width = 4
+            indicator_width = self.INDICATOR_WIDTH
             indicator_height = min(28, self.height() - 4)  # 确保指示器不超出按钮高度
             indicator_x = max(0, min(self._indicator_position, self.width() - indicator_width))  # 限制位置范围
             indicator_y = (self.height() - indicator_height) // 2
 
             # 只有在有效区域内才绘制
             if indicator_height > 0 and indicator_x >= 0:
-                # 设置指示器颜色和画笔
-                indicator_color = QColor(colors.PRIMARY_6)
-                indicator_color.setAlphaF(max(0.0, min(1.0, self._indicator_opacity)))  # 限制透明度范围
-                painter.setBrush(indicator_color)
+                # 设置指示器颜色和画笔（当前主题颜色的画刷按透明度缓存）
+                alpha = round(max(0.0, min(1.0, self._indicator_opacity)) * 255)  # 限制透明度范围
+                painter.setBrush(paint_resources.theme_brush("PRIMARY_6", alpha))
                 painter.setPen(Qt.PenStyle.NoPen)
 
                 # 绘制圆角矩形指示器
-                from PyQt6.QtCore import QRectF
-
-                indicator_rect = QRectF(indicator_x, indicator_y, indicator_width, indicator_height)
                 corner_radius = indicator_width / 2
-                painter.drawRoundedRect(indicator_rect, corner_radius, corner_radius)
+                painter.translate(indicator_x, indicator_y)
+                painter.drawPath(paint_resources.rounded_rect_path(indicator_width, indicator_height, corner_radius))
 
         except Exception as e:
             # 如果绘制过程中出现异常，记录但不中断程序
@@ -291,9 +272,6 @@ class NavigationTabs(QWidget):
 
         self._setup_ui()
 
-        # 监听主题变化
-        theme_manager.theme_changed.connect(self._on_theme_changed)
-
     def _setup_ui(self):
         """设置UI"""
         layout = QVBoxLayout()
@@ -443,14 +421,9 @@ class NavigationTabs(QWidget):
         if icon_path and icon_path.strip():
             # 图片Logo
             try:
-                # 加载并缩放图片
-                pixmap = QPixmap(icon_path.strip())
-                if not pixmap.isNull():
-                    # 缩放到48x48像素，保持宽高比
-                    scaled_pixmap = pixmap.scaled(
-                        48, 48, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-                    )
-
+                # 从资源缓存获取缩放到48x48以内（保持宽高比）的图片
+                scaled_pixmap = asset_cache.pixmap(icon_path.strip(), 48, self.devicePixelRatioF())
+                if not scaled_pixmap.isNull():
                     # 直接使用缩放后的图片，不应用任何遮罩或叠加效果
                     self.logo_icon_label.setPixmap(scaled_pixmap)
                     # 设置为图片模式，应用对应的CSS样式
@@ -482,7 +455,6 @@ class NavigationTabs(QWidget):
         # 处理Logo文字
         if logo_text and logo_text.strip():
             self.logo_text_label.setText(logo_text.strip())
-            self._update_logo_text_style()
             self.logo_text_label.show()
             self.logo_text_container.show()  # 显示文字容器
         else:
@@ -490,31 +462,59 @@ class NavigationTabs(QWidget):
             self.logo_text_label.hide()
             self.logo_text_container.hide()  # 隐藏文字容器
 
-    def _update_logo_text_style(self):
-        """更新Logo文字颜色（字体样式由CSS控制）"""
-        if hasattr(self, "logo_text_label"):
-            colors = AntColorsDark if theme_manager.is_dark_theme() else AntColors
-            # 只设置颜色，其他样式由CSS控制
-            self.logo_text_label.setStyleSheet(f"color: {colors.PRIMARY_6};")
 
-    def _on_theme_changed(self, theme):
-        """主题变化时刷新样式"""
-        # 刷新容器样式
-        self.style().unpolish(self)
-        self.style().polish(self)
+class CrossfadeOverlay(QWidget):
+    """内容切换时覆盖在内容区域上方的淡入淡出层
 
-        # 刷新所有按钮的样式（按钮有自己的主题变化处理）
-        for button in self.buttons:
-            button._update_style()
+    只绘制切换前后两张页面快照，动画期间下方的真实页面不会被重绘。
+    """
 
-        # 更新Logo样式
-        self._update_logo_theme()
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._old_pixmap = None
+        self._new_pixmap = None
+        self._progress = 0.0
+
+        # 不拦截鼠标事件，动画期间点击直接落到新页面上
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+        # 快照完全覆盖自身区域，无需重绘下方控件
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.hide()
+
+    def start(self, old_pixmap, new_pixmap):
+        """设置切换前后的页面快照并显示"""
+        self._old_pixmap = old_pixmap
+        self._new_pixmap = new_pixmap
+        self._progress = 0.0
+        self.setGeometry(self.parentWidget().rect())
+        self.raise_()
+        self.show()
+
+    def finish(self):
+        """隐藏并释放页面快照"""
+        self.hide()
+        self._old_pixmap = None
+        self._new_pixmap = None
+
+    @pyqtProperty(float)
+    def progress(self):
+        return self._progress
 
-    def _update_logo_theme(self):
-        """更新Logo主题样式"""
-        # Logo图标样式由CSS控制，只需要更新文字颜色
-        if self.logo_text_label.isVisible():
-            self._update_logo_text_style()
+    @progress.setter
+    def progress(self, value):
+        self._progress = max(0.0, min(1.0, value))
+        self.update()
+
+    def paintEvent(self, event):
+        """先绘制新页面，再按剩余透明度叠加旧页面"""
+        if self._new_pixmap is None:
+            return
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._new_pixmap)
+        if self._old_pixmap is not None and self._progress < 1.0:
+            painter.setOpacity(1.0 - self._progress)
+            painter.drawPixmap(0, 0, self._old_pixmap)
+        painter.end()
 
 
 class NavigationTabWidget(QWidget):
@@ -523,20 +523,20 @@ class NavigationTabWidget(QWidget):
     # 信号：当前选项卡改变
     currentChanged = pyqtSignal(int)
 
+    # 内容切换方式
+    TRANSITION_FADE = "fade"  # 页面快照淡入淡出
+    TRANSITION_INSTANT = "instant"  # 立即切换，不播放动画
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         # 内容切换动画属性
-        self._content_opacity = 1.0
+        self._transition_mode = self.TRANSITION_FADE
         self._content_animation = None
-        self._pending_index = -1  # 待切换的索引
 
         self._setup_ui()
         self._setup_content_animation()
 
-        # 监听主题变化
-        theme_manager.theme_changed.connect(self._on_theme_changed)
-
     def _setup_ui(self):
         """设置UI"""
         layout = QHBoxLayout()
@@ -564,62 +564,70 @@ class NavigationTabWidget(QWidget):
 
     def _setup_content_animation(self):
         """设置内容切换动画"""
-        self._content_animation = QPropertyAnimation(self, b"contentOpacity")
+        self._crossfade_overlay = CrossfadeOverlay(self.content_stack)
+
+        self._content_animation = QPropertyAnimation(self._crossfade_overlay, b"progress")
         self._content_animation.setDuration(200)
         self._content_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self._content_animation.finished.connect(self._on_fade_out_finished)
+        self._content_animation.setStartValue(0.0)
+        self._content_animation.setEndValue(1.0)
+        self._content_animation.finished.connect(self._crossfade_overlay.finish)
+        animation_manager.register(self._content_animation)
 
-    # 内容透明度属性
-    @pyqtProperty(float)
-    def contentOpacity(self):
-        return self._content_opacity
+    def setTransitionMode(self, mode: str):
+        """设置内容切换方式
 
-    @contentOpacity.setter
-    def contentOpacity(self, value):
-        # 限制透明度范围
-        new_value = max(0.0, min(1.0, value))
-        if abs(self._content_opacity - new_value) > 0.01:  # 只有变化足够大时才更新
-            self._content_opacity = new_value
-            # 设置内容区域的透明度效果
-            if not hasattr(self.content_stack, "_opacity_effect") or self.content_stack._opacity_effect is None:
-                self.content_stack._opacity_effect = QGraphicsOpacityEffect()
-                self.content_stack.setGraphicsEffect(self.content_stack._opacity_effect)
-
-            # 安全地设置透明度
-            try:
-                self.content_stack._opacity_effect.setOpacity(new_value)
-            except Exception as e:
-                print(f"Warning: Error setting content opacity: {e}")
+        Args:
+            mode: 'fade' 淡入淡出，'instant' 立即切换
+        """
+        self._transition_mode = self.TRANSITION_INSTANT if mode == self.TRANSITION_INSTANT else self.TRANSITION_FADE
+        if self._transition_mode == self.TRANSITION_INSTANT:
+            self._stop_transition()
+
+    def transitionMode(self) -> str:
+        """获取内容切换方式"""
+        return self._transition_mode
+
+    def _stop_transition(self):
+        """立即结束正在进行的切换动画"""
+        if self._content_animation.state() == QPropertyAnimation.State.Running:
+            self._content_animation.stop()
+        self._crossfade_overlay.finish()
+
+    def _grab_content(self):
+        """截取内容区域在窗口中的最终显示效果（包含窗口背景）"""
+        window = self.content_stack.window()
+        rect = QRect(self.content_stack.mapTo(window, self.content_stack.rect().topLeft()), self.content_stack.size())
+        return window.grab(rect)
 
     def _on_current_changed(self, index: int):
         """处理当前选项卡改变，带动画效果"""
         if index == self.content_stack.currentIndex():
             return  # 相同索引，不需要切换
 
-        # 保存待切换的索引
-        self._pending_index = index
+        animate = (
+            self._transition_mode == self.TRANSITION_FADE
+            and self.content_stack.isVisible()
+            and animation_manager.is_enabled()
+        )
+        if not animate:
+            self._stop_transition()
+            self.content_stack.setCurrentIndex(index)
+            self.currentChanged.emit(index)
+            return
 
-        # 开始淡出动画
+        # 切换前后各截取一次快照，动画期间只在覆盖层上混合两张图片
         if self._content_animation.state() == QPropertyAnimation.State.Running:
             self._content_animation.stop()
+        old_pixmap = self._grab_content()
+        self._crossfade_overlay.finish()
 
-        self._content_animation.setStartValue(self._content_opacity)
-        self._content_animation.setEndValue(0.0)
-        self._content_animation.start()
-
-    def _on_fade_out_finished(self):
-        """淡出动画完成后的回调"""
-        if self._pending_index >= 0:
-            # 切换到新内容
-            self.content_stack.setCurrentIndex(self._pending_index)
-            self.currentChanged.emit(self._pending_index)
+        self.content_stack.setCurrentIndex(index)
+        new_pixmap = self._grab_content()
 
-            # 开始淡入动画
-            self._content_animation.setStartValue(0.0)
-            self._content_animation.setEndValue(1.0)
-            self._content_animation.start()
-
-            self._pending_index = -1
+        self._crossfade_overlay.start(old_pixmap, new_pixmap)
+        animation_manager.start(self._content_animation)
+        self.currentChanged.emit(index)
 
     def addTab(self, widget: QWidget, text: str, icon_text: str = ""):
         """添加选项卡"""
@@ -670,16 +678,3 @@ class NavigationTabWidget(QWidget):
             icon_path: 图片文件路径，优先级高于icon_text
         """
         self.nav_tabs.set_logo(icon_text, logo_text, icon_path)
-
-    def _on_theme_changed(self, theme):
-        """主题变化时刷新样式"""
-        # 刷新内容区域样式
-        self.content_stack.style().unpolish(self.content_stack)
-        self.content_stack.style().polish(self.content_stack)
-
-        # 刷新所有滚动区域的样式
-        for i in range(self.content_stack.count()):
-            scroll_area = self.content_stack.widget(i)
-            if isinstance(scroll_area, QScrollArea):
-                scroll_area.style().unpolish(scroll_area)
-                scroll_area.style().polish(scroll_area)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+绘制性能 HUD
+
+调试模式下叠加在主窗口右上角的浮层，显示帧率、每帧绘制耗时、每帧绘制的控件数量
+以及累计绘制耗时最高的控件类。数据来自 paint_profiler，显示时开启统计，隐藏时关闭。
+"""
+
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QTimer, QEvent
+from PyQt6.QtGui import QPainter, QFont, QFontMetrics
+from ui.paint_profiler import paint_profiler
+from ui.paint_resources import paint_resources
+
+
+class PaintHud(QWidget):
+    """绘制性能浮层"""
+
+    REFRESH_INTERVAL = 500  # 刷新间隔（毫秒）
+    TOP_N = 5  # 显示耗时最高的控件类数量
+    MARGIN = 8  # 距父控件右上角的距离
+    TOP_OFFSET = 40  # 避开标题栏
+    PADDING = 6
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self._lines = []
+
+        # 不透明背景：刷新浮层时无需重绘下方的控件，且不拦截鼠标事件
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+
+        self._font = QFont("Consolas")
+        self._font.setStyleHint(QFont.StyleHint.Monospace)
+        self._font.setPointSize(8)
+        self.setFont(self._font)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.REFRESH_INTERVAL)
+        self._timer.timeout.connect(self._refresh)
+
+        # 浮层自身的绘制不计入统计
+        paint_profiler.exclude(self)
+        parent.installEventFilter(self)
+        self.hide()
+
+    def toggle(self):
+        """切换显示状态"""
+        self.setVisible(not self.isVisible())
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        paint_profiler.start()
+        self._timer.start()
+        self._refresh()
+        self.raise_()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._timer.stop()
+        paint_profiler.stop()
+
+    def eventFilter(self, obj, event):
+        if obj is self.parentWidget() and event.type() == QEvent.Type.Resize and self.isVisible():
+            self._reposition()
+        return False
+
+    def _refresh(self):
+        """按最新统计更新显示内容"""
+        stats = paint_profiler.get_stats(self.TOP_N)
+        lines = [
+            f"FPS {stats['fps']:5.1f}",
+            f"帧绘制 {stats['frame_ms']:6.2f}ms  平均 {stats['avg_frame_ms']:6.2f}ms  最大 {stats['max_frame_ms']:6.2f}ms",
+            f"控件/帧 {stats['widgets']:4d}  平均 {stats['avg_widgets']:6.1f}",
+        ]
+        for item in stats["top"]:
+            lines.append(
+                f"{item['class'][:22]:<22} {item['total_ms']:8.1f}ms  x{item['count']:<6d} 最大 {item['max_ms']:5.2f}ms"
+            )
+        self._lines = lines
+
+        metrics = QFontMetrics(self._font)
+        width = max(metrics.horizontalAdvance(line) for line in lines) + self.PADDING * 2
+        height = metrics.height() * len(lines) + self.PADDING * 2
+        if width != self.width() or height != self.height():
+            self.resize(width, height)
+            self._reposition()
+        self.update()
+
+    def _reposition(self):
+        """固定在父控件右上角"""
+        parent = self.parentWidget()
+        self.move(parent.width() - self.width() - self.MARGIN, self.TOP_OFFSET)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), paint_resources.color("#1F1F1F"))
+        painter.setPen(paint_resources.color("#52C41A"))
+
+        metrics = painter.fontMetrics()
+        y = self.PADDING + metrics.ascent()
+        for line in self._lines:
+            painter.drawText(self.PADDING, y, line)
+            y += metrics.height()
@@ -3,12 +3,17 @@
 
 """
 窗口边缘拖拽调整大小组件
+
+优先交给窗口系统调整大小（QWindow.startSystemResize），由窗口管理器处理拖拽过程；
+平台不支持时退回手动调整，并将几何更新限制为每帧一次。
+窗口尺寸只在拖拽结束后保存一次。
 """
 
 from enum import Enum
-from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import Qt, QPoint, QRect, QTimer
+from PyQt6.QtWidgets import QWidget, QApplication
+from PyQt6.QtCore import Qt, QPoint, QRect, QTimer, QEvent, QObject
 
+from ui.repaint_scheduler import repaint_scheduler
 from utils import logger
 
 
@@ -23,6 +28,69 @@ class ResizeDirection(Enum):
     BOTTOM_RIGHT = 5
 
 
+# 调整方向对应的窗口边缘
+RESIZE_EDGES = {
+    ResizeDirection.BOTTOM: Qt.Edge.BottomEdge,
+    ResizeDirection.LEFT: Qt.Edge.LeftEdge,
+    ResizeDirection.RIGHT: Qt.Edge.RightEdge,
+    ResizeDirection.BOTTOM_LEFT: Qt.Edge.BottomEdge | Qt.Edge.LeftEdge,
+    ResizeDirection.BOTTOM_RIGHT: Qt.Edge.BottomEdge | Qt.Edge.RightEdge,
+}
+
+
+class SystemGestureWatcher(QObject):
+    """
+    监听由窗口系统接管的移动/调整大小手势，手势结束后调用回调
+
+    窗口系统接管后不一定会把鼠标释放事件交还给窗口，因此在窗口几何变化后
+    延迟检查鼠标左键是否已松开，松开即视为手势结束。
+    """
+
+    CHECK_INTERVAL = 150
+
+    def __init__(self, window, on_finished):
+        super().__init__(window)
+        self.window = window
+        self.on_finished = on_finished
+        self.active = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.CHECK_INTERVAL)
+        self._timer.timeout.connect(self._check_finished)
+
+    def start(self):
+        """开始监听"""
+        if not self.active:
+            self.active = True
+            self.window.installEventFilter(self)
+        self._timer.start()
+
+    def eventFilter(self, obj, event):
+        if self.active and obj is self.window:
+            event_type = event.type()
+            if event_type in (QEvent.Type.Resize, QEvent.Type.Move):
+                self._timer.start()
+            elif event_type in (QEvent.Type.MouseButtonRelease, QEvent.Type.NonClientAreaMouseButtonRelease):
+                self._finish()
+        return False
+
+    def _check_finished(self):
+        """鼠标左键已松开时结束手势，否则继续等待"""
+        if QApplication.mouseButtons() & Qt.MouseButton.LeftButton:
+            self._timer.start()
+        else:
+            self._finish()
+
+    def _finish(self):
+        if not self.active:
+            return
+        self.active = False
+        self._timer.stop()
+        self.window.removeEventFilter(self)
+        self.on_finished()
+
+
 class ResizableWindow:
     """窗口边缘拖拽调整大小功能类"""
 
@@ -37,6 +105,15 @@ class ResizableWindow:
         self.resize_start_pos = QPoint()
         self.resize_start_geometry = QRect()
 
+        # 系统调整大小结束后保存窗口尺寸
+        self.system_resize_watcher = SystemGestureWatcher(self.window, self._save_window_size)
+
+        # 手动调整大小时每帧最多更新一次几何
+        self._pending_resize_pos = None
+        self._resize_timer = QTimer(self.window)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._apply_pending_resize)
+
         self.install_event_filter()
         logger.debug(f"ResizableWindow初始化完成，边缘宽度: {edge_width}px，最小尺寸: {min_width}x{min_height}")
 
@@ -86,6 +163,10 @@ class ResizableWindow:
             direction = self.get_resize_direction(pos)
 
             if direction != ResizeDirection.NONE:
+                if self._start_system_resize(direction):
+                    event.accept()
+                    return
+
                 self.is_resizing = True
                 self.resize_direction = direction
                 self.resize_start_pos = event.globalPosition().toPoint()
@@ -97,7 +178,10 @@ class ResizableWindow:
 
     def _mouse_move_event(self, event):
         if self.is_resizing:
-            self._perform_resize(event.globalPosition().toPoint())
+            # 记录最新位置，下一帧统一更新几何
+            self._pending_resize_pos = event.globalPosition().toPoint()
+            if not self._resize_timer.isActive():
+                self._resize_timer.start(max(1, int(repaint_scheduler.frame_interval() * 1000)))
             event.accept()
             return
         if hasattr(self.window, "_original_mouseMoveEvent"):
@@ -105,6 +189,9 @@ class ResizableWindow:
 
     def _mouse_release_event(self, event):
         if self.is_resizing and event.button() == Qt.MouseButton.LeftButton:
+            # 应用最后一次未处理的位置
+            self._pending_resize_pos = event.globalPosition().toPoint()
+            self._apply_pending_resize()
             self.is_resizing = False
             self.resize_direction = ResizeDirection.NONE
 
@@ -116,6 +203,29 @@ class ResizableWindow:
         if hasattr(self.window, "_original_mouseReleaseEvent"):
             self.window._original_mouseReleaseEvent(event)
 
+    def _start_system_resize(self, direction):
+        """
+        交给窗口系统调整大小
+
+        Args:
+            direction (ResizeDirection): 调整方向
+
+        Returns:
+            bool: 平台是否支持并已开始调整
+        """
+        handle = self.window.windowHandle()
+        if handle is None or not handle.startSystemResize(RESIZE_EDGES[direction]):
+            return False
+        self.system_resize_watcher.start()
+        return True
+
+    def _apply_pending_resize(self):
+        """应用最近一次记录的拖拽位置"""
+        self._resize_timer.stop()
+        if self._pending_resize_pos is not None:
+            self._perform_resize(self._pending_resize_pos)
+            self._pending_resize_pos = None
+
     def _leave_event(self, event):
         if hasattr(self.window, "_original_leaveEvent"):
             self.window._original_leaveEvent(event)
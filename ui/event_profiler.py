@@ -0,0 +1,312 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+事件分发性能分析器
+
+通过 ProfilingApplication.notify() 对整个应用的事件分发计时，在固定时长内统计：
+- 按 (事件类型, 接收者类名) 统计分发次数、累计耗时、自身耗时（扣除嵌套分发）和最大耗时
+- 按 (类名, 信号名) 统计信号发射次数及开始时的连接数量，如 theme_changed 的扇出
+结束后导出可排序的 CSV 报告。未开始统计时 notify() 直接转发，只有一次属性判断的开销。
+"""
+
+import os
+import csv
+import time
+from functools import partial
+from PyQt6.QtCore import QObject, QEvent, QMetaMethod, QTimer, pyqtSignal, pyqtBoundSignal
+from PyQt6.QtWidgets import QApplication
+from utils.logger import logger
+
+# 默认统计时长（秒）
+DEFAULT_DURATION = 10
+# 日志中输出的耗时最高条目数量
+LOG_TOP_N = 10
+
+
+def event_type_name(event_type):
+    """
+    获取事件类型名称
+
+    Args:
+        event_type (int): 事件类型值
+
+    Returns:
+        str: 如 "Paint"，未知类型（如自定义事件）返回数值
+    """
+    try:
+        return QEvent.Type(event_type).name
+    except ValueError:
+        return str(event_type)
+
+
+class ProfilingApplication(QApplication):
+    """支持事件分发计时的 QApplication"""
+
+    def __init__(self, argv):
+        super().__init__(argv)
+        self.event_profiler = None
+
+    def notify(self, receiver, event):
+        profiler = self.event_profiler
+        if profiler is None:
+            return super().notify(receiver, event)
+        return profiler.dispatch(super().notify, receiver, event)
+
+
+class EventProfiler(QObject):
+    """事件分发性能分析器"""
+
+    # 统计结束信号，参数为报告路径（导出失败时为空字符串）
+    finished = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        self._active = False
+        self._output_dir = None
+        self._started_at = 0.0
+        self._elapsed = 0.0
+        self._stack = []  # 嵌套分发时各层累计的子分发耗时
+        self._events = {}  # {(事件类型, 类名): [次数, 总耗时, 自身耗时, 最大耗时]}
+        self._signals = {}  # {(类名, 信号名): [发射次数, 连接数量]}
+        self._connections = []  # [(信号, 计数槽)]
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.stop)
+
+    @staticmethod
+    def is_available():
+        """当前应用是否支持事件分发计时"""
+        return isinstance(QApplication.instance(), ProfilingApplication)
+
+    def is_active(self):
+        """是否正在统计"""
+        return self._active
+
+    def start(self, duration=DEFAULT_DURATION, output_dir=None):
+        """
+        开始统计，到时后自动停止并导出报告
+
+        Args:
+            duration (float): 统计时长（秒），为 0 时需手动调用 stop()
+            output_dir (str): 报告输出目录，为 None 时不导出
+
+        Returns:
+            bool: 是否已开始
+        """
+        if self._active:
+            return False
+        if not self.is_available():
+            logger.warning("当前应用不支持事件分发计时，无法开始事件分析")
+            return False
+
+        self._events.clear()
+        self._signals.clear()
+        self._stack.clear()
+        self._output_dir = output_dir
+        self._connect_signals()
+
+        self._active = True
+        self._started_at = time.perf_counter()
+        QApplication.instance().event_profiler = self
+        if duration > 0:
+            self._timer.start(int(duration * 1000))
+        logger.debug(f"事件分析已开始，时长 {duration}s，监听 {len(self._connections)} 个信号")
+        return True
+
+    def stop(self):
+        """
+        停止统计并导出报告
+
+        Returns:
+            str: 报告路径，未导出时返回 None
+        """
+        if not self._active:
+            return None
+        QApplication.instance().event_profiler = None
+        self._active = False
+        self._timer.stop()
+        self._elapsed = time.perf_counter() - self._started_at
+        self._disconnect_signals()
+
+        report = self.get_report()
+        for row in report["events"][:LOG_TOP_N]:
+            logger.debug(
+                f"事件分析: {row['event']} -> {row['receiver']} x{row['count']} "
+                f"总 {row['total_ms']:.1f}ms 自身 {row['self_ms']:.1f}ms 最大 {row['max_ms']:.2f}ms"
+            )
+
+        path = None
+        if self._output_dir:
+            try:
+                path = self.export(os.path.join(self._output_dir, f"events-{time.strftime('%Y%m%d-%H%M%S')}.csv"))
+            except OSError as e:
+                logger.error(f"导出事件分析报告失败: {e}")
+        self.finished.emit(path or "")
+        return path
+
+    def dispatch(self, notify, receiver, event):
+        """
+        计时并分发事件，由 ProfilingApplication.notify() 调用
+
+        Args:
+            notify (callable): QApplication.notify
+            receiver (QObject): 接收者
+            event (QEvent): 事件
+
+        Returns:
+            bool: notify 的返回值
+        """
+        # 分发过程中接收者可能被删除，先取出统计键
+        key = (event.type().value, type(receiver).__name__)
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return notify(receiver, event)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+
+            stats = self._events.get(key)
+            if stats is None:
+                self._events[key] = [1, elapsed, elapsed - children, elapsed]
+            else:
+                stats[0] += 1
+                stats[1] += elapsed
+                stats[2] += elapsed - children
+                if elapsed > stats[3]:
+                    stats[3] = elapsed
+
+    def _watched_objects(self):
+        """需要统计信号的对象：应用、所有顶层控件及其子对象、全局管理器"""
+        from ui.styles import theme_manager
+        from ui.animation_manager import animation_manager
+        from ui.repaint_scheduler import repaint_scheduler
+
+        app = QApplication.instance()
+        objects = [app, theme_manager, animation_manager, repaint_scheduler]
+        for widget in app.topLevelWidgets():
+            objects.append(widget)
+            objects.extend(widget.findChildren(QObject))
+        return objects
+
+    def _connect_signals(self):
+        """为对象的所有信号连接计数槽"""
+        for obj in self._watched_objects():
+            meta = obj.metaObject()
+            class_name = type(obj).__name__
+            seen = set()
+            for index in range(meta.methodCount()):
+                method = meta.method(index)
+                if method.methodType() != QMetaMethod.MethodType.Signal:
+                    continue
+                name = method.name().data().decode()
+                if name in seen:
+                    continue
+                seen.add(name)
+
+                signal = getattr(obj, name, None)
+                if not isinstance(signal, pyqtBoundSignal):
+                    continue
+                key = (class_name, name)
+                stats = self._signals.setdefault(key, [0, 0])
+                try:
+                    stats[1] += obj.receivers(signal)
+                except (RuntimeError, TypeError):
+                    pass
+
+                slot = partial(self._count_signal, stats)
+                try:
+                    signal.connect(slot)
+                except TypeError:
+                    continue
+                self._connections.append((signal, slot))
+
+    def _disconnect_signals(self):
+        """断开计数槽"""
+        for signal, slot in self._connections:
+            try:
+                signal.disconnect(slot)
+            except (RuntimeError, TypeError):
+                # 对象已被删除
+                pass
+        self._connections.clear()
+
+    @staticmethod
+    def _count_signal(stats, *args):
+        stats[0] += 1
+
+    def get_report(self, sort_by="total_ms"):
+        """
+        获取统计报告
+
+        Args:
+            sort_by (str): 事件排序字段，如 "total_ms"、"self_ms"、"max_ms"、"count"
+
+        Returns:
+            dict: {"duration": 秒, "events": [...], "signals": [...]}
+        """
+        events = [
+            {
+                "event": event_type_name(event_type),
+                "receiver": class_name,
+                "count": count,
+                "total_ms": total * 1000,
+                "self_ms": own * 1000,
+                "avg_ms": total / count * 1000,
+                "max_ms": longest * 1000,
+            }
+            for (event_type, class_name), (count, total, own, longest) in self._events.items()
+        ]
+        events.sort(key=lambda row: row[sort_by], reverse=True)
+
+        signals = [
+            {"sender": class_name, "signal": name, "count": count, "receivers": receivers}
+            for (class_name, name), (count, receivers) in self._signals.items()
+            if count
+        ]
+        signals.sort(key=lambda row: row["count"], reverse=True)
+
+        duration = self._elapsed if not self._active else time.perf_counter() - self._started_at
+        return {"duration": duration, "events": events, "signals": signals}
+
+    def export(self, path):
+        """
+        导出 CSV 报告，事件和信号各占一段，可在表格软件中排序
+
+        Args:
+            path (str): 报告路径
+
+        Returns:
+            str: 报告路径
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        report = self.get_report()
+        with open(path, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.writer(f)
+            writer.writerow(["kind", "name", "class", "count", "total_ms", "self_ms", "avg_ms", "max_ms", "receivers"])
+            for row in report["events"]:
+                writer.writerow(
+                    [
+                        "event",
+                        row["event"],
+                        row["receiver"],
+                        row["count"],
+                        f"{row['total_ms']:.3f}",
+                        f"{row['self_ms']:.3f}",
+                        f"{row['avg_ms']:.4f}",
+                        f"{row['max_ms']:.3f}",
+                        "",
+                    ]
+                )
+            for row in report["signals"]:
+                writer.writerow(["signal", row["signal"], row["sender"], row["count"], "", "", "", "", row["receivers"]])
+        logger.info(f"事件分析报告已导出: {path}，统计时长 {report['duration']:.1f}s")
+        return path
+
+
+# 全局事件分发性能分析器实例
+event_profiler = EventProfiler()
@@ -7,8 +7,9 @@ import os
 import sys
 import subprocess
 from PyQt6.QtWidgets import QApplication, QSystemTrayIcon
-from PyQt6.QtCore import QTimer
-from utils import logger
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QKeySequence, QShortcut
+from utils import logger, get_task_executor, get_scheduler, get_stall_watchdog, get_cpu_profiler
 
 
 class EventHandler:
@@ -35,11 +36,36 @@ class EventHandler:
         if hasattr(self.main_window, "about_btn"):
             self.main_window.about_btn.clicked.connect(self._on_show_about)
 
+        # 调试模式下按 F12 切换绘制性能浮层
+        self.main_window.paint_hud_shortcut = QShortcut(QKeySequence(Qt.Key.Key_F12), self.main_window)
+        self.main_window.paint_hud_shortcut.activated.connect(self.toggle_paint_hud)
+
     def setup_timer(self):
         """设置定时器"""
         self.main_window.update_timer = QTimer(self.main_window)
+        # 驱动共享调度器执行到期的定时任务
+        self.main_window.update_timer.timeout.connect(get_scheduler().tick)
         self.main_window.update_timer.start(1000)
 
+        # 调试模式下监测GUI线程卡顿
+        if self.config_manager.debug_mode:
+            self.start_stall_watchdog()
+
+    def start_stall_watchdog(self):
+        """开启GUI线程卡顿监测"""
+        get_stall_watchdog().start(self.config_manager.system_config.get("stall_threshold_ms", 200))
+
+    def toggle_paint_hud(self):
+        """切换绘制性能浮层，仅在调试模式下可用"""
+        if not self.config_manager.debug_mode:
+            return
+
+        if getattr(self.main_window, "paint_hud", None) is None:
+            from ui.components.paint_hud import PaintHud
+
+            self.main_window.paint_hud = PaintHud(self.main_window)
+        self.main_window.paint_hud.toggle()
+
     def open_config_dir(self):
         """打开配置目录"""
         try:
@@ -89,6 +115,17 @@ class EventHandler:
         if hasattr(self.main_window, "tray_manager") and self.main_window.tray_manager.tray_icon:
             self.main_window.tray_manager.hide_tray()
 
+        # 停止卡顿监测并输出汇总，未结束的CPU分析立即输出结果
+        get_stall_watchdog().stop()
+        get_cpu_profiler().stop()
+
+        # 取消并等待后台任务结束
+        get_task_executor().shutdown()
+
+        # 切换到已暂存的新版本（等待进程退出后执行）
+        if hasattr(self.main_window, "version_manager"):
+            self.main_window.version_manager.apply_pending_update()
+
         # 退出应用
         QApplication.quit()
 
@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+内存与信号连接泄漏排查
+
+在主窗口上重复执行主题切换、选项卡切换、打开对话框和处理检查更新结果，比较前后的：
+- tracemalloc 快照差异（按代码行统计增长的内存）
+- 各类 QObject 的存活数量
+- 全局信号及版本标签等信号的接收者数量（receivers()）和 signal_registry 登记的连接数量
+先预热若干轮填充各类缓存，之后任何持续增长都视为泄漏。
+"""
+
+import gc
+import tracemalloc
+from collections import Counter
+from PyQt6.QtCore import QObject, QCoreApplication, QEvent, QTimer
+from PyQt6.QtWidgets import QApplication
+from ui.styles import theme_manager
+from ui.animation_manager import animation_manager
+from ui.signal_registry import signal_registry
+from utils import CheckMode, UpdateResult
+
+# 对话框自动关闭的最大重试次数（每次间隔 10 毫秒）
+DIALOG_CLOSE_RETRIES = 100
+# tracemalloc 记录的调用栈深度
+TRACEMALLOC_FRAMES = 10
+
+
+class LeakHunter:
+    """重复执行界面操作并统计资源增长"""
+
+    OPERATIONS = ("theme_switch", "tab_switch", "dialog", "update_check")
+
+    def __init__(self, window):
+        self.window = window
+        self._iteration = 0
+
+    def _signal_probes(self):
+        """需要统计接收者数量的信号 [(名称, 发送者, 信号名)]"""
+        probes = [
+            ("ThemeManager.theme_changed", theme_manager, "theme_changed"),
+            ("AnimationManager.active_count_changed", animation_manager, "active_count_changed"),
+            ("VersionChecker.check_finished", self.window.version_manager.version_checker, "check_finished"),
+        ]
+        if hasattr(self.window, "version_label"):
+            probes.append(("version_label.linkActivated", self.window.version_label, "linkActivated"))
+        return probes
+
+    def count_qobjects(self):
+        """
+        统计存活的 QObject 数量
+
+        Returns:
+            Counter: {类名: 数量}
+        """
+        app = QApplication.instance()
+        objects = app.findChildren(QObject)
+        for widget in app.topLevelWidgets():
+            objects.append(widget)
+            objects.extend(widget.findChildren(QObject))
+        return Counter(type(obj).__name__ for obj in objects)
+
+    def count_receivers(self):
+        """
+        统计信号的接收者数量
+
+        Returns:
+            dict: {信号: 接收者数量}，登记的连接以 "registered:" 为前缀
+        """
+        counts = {}
+        for name, sender, signal_name in self._signal_probes():
+            counts[name] = sender.receivers(getattr(sender, signal_name))
+        for name, stats in signal_registry.report().items():
+            counts[f"registered:{name}"] = stats["registered"]
+        return counts
+
+    def snapshot(self):
+        """
+        记录当前状态
+
+        Returns:
+            dict: {"qobjects", "receivers", "memory"}
+        """
+        self._settle()
+        return {
+            "qobjects": self.count_qobjects(),
+            "receivers": self.count_receivers(),
+            "memory": tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None,
+        }
+
+    def run_iteration(self):
+        """执行一轮所有操作"""
+        self._iteration += 1
+        self.switch_theme()
+        self.switch_tab()
+        self.open_dialog()
+        self.simulate_update_check()
+
+    def switch_theme(self):
+        """切换主题"""
+        theme = "dark" if self.window.current_theme == "light" else "light"
+        self.window.theme_manager.switch_theme(theme)
+
+    def switch_tab(self):
+        """切换到下一个选项卡"""
+        tabs = self.window.tabs
+        tabs.setCurrentIndex((tabs.currentIndex() + 1) % tabs.count())
+
+    def open_dialog(self):
+        """打开关于对话框并自动关闭"""
+        self._close_modal_later()
+        self.window.dialog_manager.show_about_dialog()
+
+    def simulate_update_check(self):
+        """模拟一次检查更新完成，交替使用静默和手动检查（手动检查会弹出对话框）"""
+        version_manager = self.window.version_manager
+        interactive = self._iteration % 2 == 0
+        result = UpdateResult(
+            mode=CheckMode.INTERACTIVE if interactive else CheckMode.SILENT,
+            current_version=self.window.config_manager.get_app_version(),
+            latest_version="999.0.0",
+            has_update=True,
+        )
+        if interactive:
+            self._close_modal_later()
+        version_manager.version_checker.check_finished.emit(result)
+
+    def _close_modal_later(self, retries=DIALOG_CLOSE_RETRIES):
+        """对话框进入模态事件循环后将其关闭"""
+
+        def close():
+            dialog = QApplication.activeModalWidget()
+            if dialog is not None:
+                dialog.reject()
+            elif retries > 0:
+                self._close_modal_later(retries - 1)
+
+        QTimer.singleShot(10, close)
+
+    def _settle(self):
+        """处理积压事件和延迟删除，并执行垃圾回收"""
+        for _ in range(3):
+            QApplication.processEvents()
+            QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        gc.collect()
+
+    def run(self, iterations=20, warmup=3):
+        """
+        预热后重复执行操作并比较前后状态
+
+        Args:
+            iterations (int): 统计的轮数
+            warmup (int): 预热轮数
+
+        Returns:
+            dict: {"iterations", "qobjects": {类名: 增长}, "receivers": {信号: 增长},
+                   "memory_growth_kb", "memory_top": [(位置, 增长KB, 增加的块数)]}
+        """
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        try:
+            for _ in range(warmup):
+                self.run_iteration()
+            before = self.snapshot()
+            for _ in range(iterations):
+                self.run_iteration()
+            after = self.snapshot()
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+        qobjects = {
+            name: after["qobjects"][name] - before["qobjects"].get(name, 0)
+            for name in after["qobjects"]
+            if after["qobjects"][name] > before["qobjects"].get(name, 0)
+        }
+        receivers = {
+            name: count - before["receivers"].get(name, 0)
+            for name, count in after["receivers"].items()
+            if count > before["receivers"].get(name, 0)
+        }
+
+        stats = after["memory"].compare_to(before["memory"], "lineno")
+        growth = [stat for stat in stats if stat.size_diff > 0]
+        return {
+            "iterations": iterations,
+            "qobjects": qobjects,
+            "receivers": receivers,
+            "memory_growth_kb": sum(stat.size_diff for stat in stats) / 1024,
+            "memory_top": [
+                (f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", stat.size_diff / 1024, stat.count_diff)
+                for stat in growth[:10]
+            ],
+        }
+
+    @staticmethod
+    def check(report, max_object_growth=0, max_receiver_growth=0, max_memory_kb_per_iteration=8.0):
+        """
+        判断是否存在泄漏
+
+        Args:
+            report (dict): run() 的结果
+            max_object_growth (int): 每类 QObject 允许的增长数量
+            max_receiver_growth (int): 每个信号允许的接收者增长数量
+            max_memory_kb_per_iteration (float): 每轮允许的内存增长（KB）
+
+        Returns:
+            list: 泄漏说明，为空表示未发现泄漏
+        """
+        failures = [
+            f"QObject {name} 增加 {growth} 个" for name, growth in report["qobjects"].items() if growth > max_object_growth
+        ]
+        failures += [
+            f"信号 {name} 接收者增加 {growth} 个"
+            for name, growth in report["receivers"].items()
+            if growth > max_receiver_growth
+        ]
+        per_iteration = report["memory_growth_kb"] / max(1, report["iterations"])
+        if per_iteration > max_memory_kb_per_iteration:
+            failures.append(f"内存每轮增长 {per_iteration:.1f}KB，超过 {max_memory_kb_per_iteration}KB")
+        return failures
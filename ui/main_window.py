@@ -16,6 +16,8 @@ from PyQt6.QtGui import QIcon
 
 from utils import logger
 from ui.styles import StyleApplier
+from ui.animation_manager import animation_manager
+from ui.event_profiler import ProfilingApplication
 
 from ui.managers import (
     UIManager,
@@ -56,6 +58,9 @@ class MainWindow(QWidget):
         # 初始化管理器
         self._initialize_managers()
 
+        # 设置动画管理器
+        self._setup_animation_manager()
+
         # 设置UI
         self._setup_ui()
 
@@ -87,6 +92,11 @@ class MainWindow(QWidget):
         self.dialog_manager = DialogManager(self)
         self.event_handler = EventHandler(self)
 
+    def _setup_animation_manager(self):
+        """应用减少动画设置，并在窗口隐藏到托盘时暂停动画"""
+        animation_manager.set_reduced_motion(self.config_manager.reduced_motion)
+        animation_manager.attach_window(self)
+
     def _setup_ui(self):
         """设置用户界面"""
         self.setWindowTitle(self.app_name)
@@ -162,7 +172,8 @@ def create_gui(config_manager, icon_path=None, start_minimized=False):
 
     app = QApplication.instance()
     if app is None:
-        app = QApplication(sys.argv)
+        # 支持从托盘菜单开启事件分发分析
+        app = ProfilingApplication(sys.argv)
 
     # 应用Ant Design全局主题样式
     StyleApplier.apply_ant_design_theme(app)
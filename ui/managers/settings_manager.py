@@ -4,7 +4,8 @@
 """设置管理器"""
 
 from PyQt6.QtWidgets import QMessageBox
-from utils import logger, enable_auto_start, disable_auto_start
+from utils import logger, enable_auto_start, disable_auto_start, get_stall_watchdog
+from ui.animation_manager import animation_manager
 
 
 class SettingsManager:
@@ -17,33 +18,47 @@ class SettingsManager:
     def load_settings(self):
         """加载设置到界面"""
         try:
-            # 设置通知选项
-            if hasattr(self.main_window, "notify_checkbox"):
-                self.main_window.notify_checkbox.setChecked(self.config_manager.show_notifications)
-            if hasattr(self.main_window, "tray_manager") and self.main_window.tray_manager.notify_action:
-                self.main_window.tray_manager.notify_action.setChecked(self.config_manager.show_notifications)
-
-            # 设置开机自启动选项
-            if hasattr(self.main_window, "startup_checkbox"):
-                self.main_window.startup_checkbox.setChecked(self.config_manager.auto_start)
-            if hasattr(self.main_window, "tray_manager") and self.main_window.tray_manager.startup_action:
-                self.main_window.tray_manager.startup_action.setChecked(self.config_manager.auto_start)
-
-            # 设置检查更新选项
-            if hasattr(self.main_window, "check_update_on_start_checkbox"):
-                self.main_window.check_update_on_start_checkbox.setChecked(self.config_manager.check_update_on_start)
+            # 批量恢复界面状态，不播放开关等动画
+            with animation_manager.suppressed():
+                # 设置通知选项
+                if hasattr(self.main_window, "notify_checkbox"):
+                    self.main_window.notify_checkbox.setChecked(self.config_manager.show_notifications)
+                if hasattr(self.main_window, "tray_manager") and self.main_window.tray_manager.notify_action:
+                    self.main_window.tray_manager.notify_action.setChecked(self.config_manager.show_notifications)
 
-            # 设置调试模式选项
-            if hasattr(self.main_window, "debug_checkbox"):
-                self.main_window.debug_checkbox.setChecked(self.config_manager.debug_mode)
+                # 设置开机自启动选项
+                if hasattr(self.main_window, "startup_checkbox"):
+                    self.main_window.startup_checkbox.setChecked(self.config_manager.auto_start)
+                if hasattr(self.main_window, "tray_manager") and self.main_window.tray_manager.startup_action:
+                    self.main_window.tray_manager.startup_action.setChecked(self.config_manager.auto_start)
 
-            # 设置关闭行为选项
-            if hasattr(self.main_window, "close_behavior_combo"):
-                close_to_tray = self.config_manager.close_to_tray
-                for i in range(self.main_window.close_behavior_combo.count()):
-                    if self.main_window.close_behavior_combo.itemData(i) == close_to_tray:
-                        self.main_window.close_behavior_combo.setCurrentIndex(i)
-                        break
+                # 设置检查更新选项
+                if hasattr(self.main_window, "check_update_on_start_checkbox"):
+                    self.main_window.check_update_on_start_checkbox.setChecked(
+                        self.config_manager.check_update_on_start
+                    )
+
+                # 设置调试模式选项
+                if hasattr(self.main_window, "debug_checkbox"):
+                    self.main_window.debug_checkbox.setChecked(self.config_manager.debug_mode)
+
+                # 设置关闭行为选项
+                if hasattr(self.main_window, "close_behavior_combo"):
+                    close_to_tray = self.config_manager.close_to_tray
+                    for i in range(self.main_window.close_behavior_combo.count()):
+                        if self.main_window.close_behavior_combo.itemData(i) == close_to_tray:
+                            self.main_window.close_behavior_combo.setCurrentIndex(i)
+                            break
+
+                # 设置选项卡切换方式选项
+                if hasattr(self.main_window, "tab_transition_combo"):
+                    index = self.main_window.tab_transition_combo.findData(self.config_manager.tab_transition)
+                    if index >= 0:
+                        self.main_window.tab_transition_combo.setCurrentIndex(index)
+
+                # 设置减少动画选项
+                if hasattr(self.main_window, "reduced_motion_checkbox"):
+                    self.main_window.reduced_motion_checkbox.setChecked(self.config_manager.reduced_motion)
 
             logger.debug("界面设置加载完成")
 
@@ -62,6 +77,10 @@ class SettingsManager:
             self.main_window.debug_checkbox.stateChanged.connect(self.toggle_debug_mode)
         if hasattr(self.main_window, "close_behavior_combo"):
             self.main_window.close_behavior_combo.currentIndexChanged.connect(self.on_close_behavior_changed)
+        if hasattr(self.main_window, "tab_transition_combo"):
+            self.main_window.tab_transition_combo.currentIndexChanged.connect(self.on_tab_transition_changed)
+        if hasattr(self.main_window, "reduced_motion_checkbox"):
+            self.main_window.reduced_motion_checkbox.stateChanged.connect(self.toggle_reduced_motion)
 
     def toggle_notifications(self):
         """切换通知开关"""
@@ -150,6 +169,17 @@ class SettingsManager:
         else:
             logger.warning(f"调试模式已更改但保存失败: {'开启' if new_debug_mode else '关闭'}")
 
+        # 关闭调试模式时隐藏绘制性能浮层
+        paint_hud = getattr(self.main_window, "paint_hud", None)
+        if not new_debug_mode and paint_hud is not None:
+            paint_hud.hide()
+
+        # 卡顿监测随调试模式开关
+        if new_debug_mode:
+            self.main_window.event_handler.start_stall_watchdog()
+        else:
+            get_stall_watchdog().stop()
+
         # 重新初始化日志系统
         from utils.logger import setup_logger
 
@@ -175,6 +205,40 @@ class SettingsManager:
             else:
                 logger.warning(f"关闭行为设置已更改但保存失败: {'最小化到后台' if close_to_tray else '直接退出'}")
 
+    def on_tab_transition_changed(self):
+        """选项卡切换方式变化时的处理"""
+        if not hasattr(self.main_window, "tab_transition_combo"):
+            return
+
+        tab_transition = self.main_window.tab_transition_combo.currentData()
+        if tab_transition is None:
+            return
+
+        self.config_manager.tab_transition = tab_transition
+        if hasattr(self.main_window, "tabs"):
+            self.main_window.tabs.setTransitionMode(tab_transition)
+
+        # 保存配置
+        if self.config_manager.save_config():
+            logger.debug(f"选项卡切换方式已更改并保存: {tab_transition}")
+        else:
+            logger.warning(f"选项卡切换方式已更改但保存失败: {tab_transition}")
+
+    def toggle_reduced_motion(self):
+        """切换减少动画效果设置"""
+        if not hasattr(self.main_window, "reduced_motion_checkbox"):
+            return
+
+        reduced_motion = self.main_window.reduced_motion_checkbox.isChecked()
+        self.config_manager.reduced_motion = reduced_motion
+        animation_manager.set_reduced_motion(reduced_motion)
+
+        # 保存配置
+        if self.config_manager.save_config():
+            logger.debug(f"减少动画效果设置已保存: {reduced_motion}")
+        else:
+            logger.warning("减少动画效果设置保存失败")
+
     def toggle_check_update_on_start(self):
         """切换启动时检查更新设置"""
         try:
@@ -5,6 +5,7 @@
 
 from PyQt6.QtCore import pyqtSlot
 from ui.styles import StyleHelper, theme_manager
+from ui.signal_registry import signal_registry
 from utils import logger
 
 
@@ -18,8 +19,10 @@ class WindowThemeManager:
 
     def initialize_theme(self):
         """初始化主题系统"""
-        # 连接主题切换信号
-        theme_manager.theme_changed.connect(self.apply_component_properties)
+        # 连接主题切换信号，主窗口销毁时自动断开
+        signal_registry.connect(
+            theme_manager, "theme_changed", self.apply_component_properties, owner=self.main_window
+        )
 
         # 应用初始主题
         theme_manager.set_theme(self.current_theme)
@@ -43,13 +46,10 @@ class WindowThemeManager:
             else:
                 logger.warning(f"主题设置保存失败: {theme}")
 
-            # 使用指定主题
+            # 使用指定主题，组件属性在主题信号中随批量切换一并应用
             theme_manager.set_theme(theme)
             logger.debug(f"主题已设置为: {theme}")
 
-            # 应用组件属性
-            self.apply_component_properties()
-
     def apply_component_properties(self):
         """应用组件属性"""
         try:
@@ -7,7 +7,8 @@ import os
 from PyQt6.QtWidgets import QSystemTrayIcon, QMenu, QApplication
 from PyQt6.QtGui import QIcon, QAction
 from PyQt6.QtCore import pyqtSlot
-from utils import logger, send_notification
+from utils import logger, send_notification, get_cpu_profiler
+from ui.event_profiler import event_profiler
 
 
 class TrayManager:
@@ -24,6 +25,8 @@ class TrayManager:
         self.toggle_window_action = None
         self.notify_action = None
         self.startup_action = None
+        self.profile_events_action = None
+        self.profile_cpu_action = None
 
     def setup_tray(self):
         """设置系统托盘图标"""
@@ -88,6 +91,19 @@ class TrayManager:
         check_update_action.triggered.connect(self._on_check_update)
         tray_menu.addAction(check_update_action)
 
+        # 事件分析动作（统计固定时长后导出报告）
+        duration = self.config_manager.system_config.get("event_profile_duration", 10)
+        self.profile_events_action = QAction(f"事件分析 {duration}s", self.main_window)
+        self.profile_events_action.setEnabled(event_profiler.is_available())
+        self.profile_events_action.triggered.connect(self._on_profile_events)
+        tray_menu.addAction(self.profile_events_action)
+
+        # CPU分析动作（分析固定时长后输出到 profiles 目录）
+        duration = self.config_manager.system_config.get("cpu_profile_duration", 30)
+        self.profile_cpu_action = QAction(f"CPU分析 {duration}s", self.main_window)
+        self.profile_cpu_action.triggered.connect(self._on_profile_cpu)
+        tray_menu.addAction(self.profile_cpu_action)
+
         tray_menu.addSeparator()
 
         # 退出动作
@@ -207,6 +223,38 @@ class TrayManager:
         if hasattr(self.main_window, "version_manager"):
             self.main_window.version_manager.check_update()
 
+    def _on_profile_events(self):
+        """开始事件分析的回调"""
+        duration = self.config_manager.system_config.get("event_profile_duration", 10)
+        if event_profiler.start(duration, self.config_manager.profile_dir):
+            # 只在本次统计期间连接，避免全局分析器持有已销毁窗口的回调
+            event_profiler.finished.connect(self._on_event_profile_finished)
+            self.profile_events_action.setEnabled(False)
+            self.show_tray_message(self.app_name, f"事件分析已开始，{duration} 秒后导出报告")
+
+    def _on_event_profile_finished(self, path):
+        """事件分析结束的回调"""
+        event_profiler.finished.disconnect(self._on_event_profile_finished)
+        self.profile_events_action.setEnabled(True)
+        if path:
+            self.show_tray_message(self.app_name, f"事件分析报告已导出:\n{path}")
+
+    def _on_profile_cpu(self):
+        """开始CPU分析的回调"""
+        profiler = get_cpu_profiler()
+        if profiler.start_with_config(self.config_manager):
+            profiler.finished.connect(self._on_cpu_profile_finished)
+            self.profile_cpu_action.setEnabled(False)
+            duration = self.config_manager.system_config.get("cpu_profile_duration", 30)
+            self.show_tray_message(self.app_name, f"CPU分析已开始，{duration} 秒后输出结果")
+
+    def _on_cpu_profile_finished(self, paths):
+        """CPU分析结束的回调"""
+        get_cpu_profiler().finished.disconnect(self._on_cpu_profile_finished)
+        self.profile_cpu_action.setEnabled(True)
+        if paths:
+            self.show_tray_message(self.app_name, f"CPU分析结果已输出到:\n{os.path.dirname(paths[0])}")
+
     def _on_confirm_exit(self):
         """确认退出的回调"""
         if hasattr(self.main_window, "event_handler"):
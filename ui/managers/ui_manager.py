@@ -11,6 +11,7 @@ from PyQt6.QtWidgets import (
     QWidget,
     QComboBox,
     QFrame,
+    QProgressBar,
 )
 from PyQt6.QtCore import Qt
 from ui.styles import StyleHelper, TitleHelper
@@ -59,14 +60,10 @@ class UIManager:
         from ui.components.navigation_tabs import NavigationTabWidget
 
         self.main_window.tabs = NavigationTabWidget()
+        self.main_window.tabs.setTransitionMode(self.main_window.config_manager.tab_transition)
 
-        # 设置Logo - 使用favicon.ico
-        import os
-
-        icon_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "assets", "icon", "tray.png"
-        )
-        self.main_window.tabs.setLogo(icon_path=icon_path, logo_text=self.main_window.app_name)
+        # 设置Logo - 使用tray.png，由资源缓存解析路径
+        self.main_window.tabs.setLogo(icon_path="assets/icon/tray.png", logo_text=self.main_window.app_name)
 
         content_layout.addWidget(self.main_window.tabs)
 
@@ -300,6 +297,31 @@ class UIManager:
         StyleHelper.set_label_type(close_behavior_info, "info")
         window_group.addWidget(close_behavior_info)
 
+        # 选项卡切换方式选择
+        tab_transition_layout = QHBoxLayout()
+        tab_transition_label = QLabel("选项卡切换:")
+        tab_transition_layout.addWidget(tab_transition_label)
+
+        self.main_window.tab_transition_combo = QComboBox()
+        self.main_window.tab_transition_combo.addItem("淡入淡出", "fade")
+        self.main_window.tab_transition_combo.addItem("立即切换", "instant")
+        self.main_window.tab_transition_combo.setToolTip("立即切换不播放动画，点击后内容立刻显示")
+        tab_transition_layout.addWidget(self.main_window.tab_transition_combo)
+
+        tab_transition_layout.addStretch()
+        window_group.addLayout(tab_transition_layout)
+
+        # 减少动画效果设置
+        reduced_motion_layout = QHBoxLayout()
+        reduced_motion_label = QLabel("减少动画效果")
+        self.main_window.reduced_motion_checkbox = ModernSwitch()
+        self.main_window.reduced_motion_checkbox.setToolTip("开启后开关、导航和窗口动画直接显示最终状态")
+
+        reduced_motion_layout.addWidget(reduced_motion_label)
+        reduced_motion_layout.addStretch()
+        reduced_motion_layout.addWidget(self.main_window.reduced_motion_checkbox)
+        window_group.addLayout(reduced_motion_layout)
+
         parent_layout.addWidget(window_group)
 
     def _create_log_group(self, parent_layout):
@@ -394,6 +416,12 @@ class UIManager:
         StyleHelper.set_label_type(self.main_window.version_label, "info")
         version_group.addWidget(self.main_window.version_label)
 
+        # 更新包下载进度条（下载时显示）
+        self.main_window.download_progress = QProgressBar()
+        self.main_window.download_progress.setRange(0, 100)
+        self.main_window.download_progress.hide()
+        version_group.addWidget(self.main_window.download_progress)
+
         parent_layout.addWidget(version_group)
 
     def setup_button_properties(self, current_theme):
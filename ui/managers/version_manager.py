@@ -5,10 +5,28 @@
 
 import webbrowser
 import os
-from PyQt6.QtCore import pyqtSlot, Qt
-from PyQt6.QtWidgets import QSystemTrayIcon
+from functools import partial
+from PyQt6.QtCore import pyqtSlot, Qt, QTimer
+from PyQt6.QtWidgets import QSystemTrayIcon, QMessageBox
 from ui.styles import StyleHelper
-from utils import logger, get_version_checker, create_update_message
+from ui.signal_registry import signal_registry
+from utils import (
+    logger,
+    get_version_checker,
+    create_update_message,
+    get_install_dir,
+    get_scheduler,
+    is_delta_supported,
+    is_network_available,
+    is_on_battery,
+    UpdateDownloadController,
+    UpdateStager,
+    UpdateStageController,
+)
+
+# 改为下载完整更新包时，等待上一个下载/暂存任务结束的重试间隔（毫秒）和最大重试次数
+FULL_DOWNLOAD_RETRY_INTERVAL = 50
+FULL_DOWNLOAD_RETRY_LIMIT = 100
 
 
 class VersionManager:
@@ -22,11 +40,92 @@ class VersionManager:
         
         # 版本检查器
         self.version_checker = get_version_checker(self.config_manager)
+        # 最近一次发现新版本的检查结果
+        self.update_result = None
         self.download_url = None
+
+        # 更新包下载控制器
+        self.download_controller = UpdateDownloadController(
+            self.config_manager.update_dir,
+            workers=self.config_manager.system_config.get("download_workers", 4),
+            max_bytes_per_sec=self.config_manager.download_rate_limit_kb * 1024,
+            timeout=self.config_manager.system_config.get("network_timeout", 10),
+            user_agent=f"{self.app_name}/{self.config_manager.get_app_version()}",
+            mirror_racer=self.version_checker.mirror_racer,
+        )
+        self._active_download_url = None
+        self._active_download_is_delta = False
+        # 当前下载对应的检查结果（下载期间可能有新的检查结果）
+        self._active_update = None
+
+        # 更新暂存器，仅打包运行时可用
+        install_dir = get_install_dir()
+        self.stager = None
+        self.stage_controller = None
+        if install_dir:
+            self.stager = UpdateStager(
+                install_dir,
+                f"{self.app_name}.exe",
+                workers=self.config_manager.system_config.get("download_workers", 4),
+            )
+            self.stage_controller = UpdateStageController(self.stager)
+        # 退出后是否启动新版本
+        self.restart_after_update = False
+        # 已通过托盘提示过的版本
+        self._notified_version = None
         
     def initialize_version_checker(self):
         """初始化版本检查器"""
-        self.version_checker.check_finished.connect(self._on_version_check_finished)
+        # 版本检查器为全局单例，主窗口销毁时自动断开
+        signal_registry.connect(
+            self.version_checker, "check_finished", self._on_version_check_finished, owner=self.main_window
+        )
+
+        # 版本标签中的下载链接只连接一次，每次检查只更新文本
+        if hasattr(self.main_window, "version_label"):
+            self.main_window.version_label.linkActivated.connect(self._open_download_page)
+
+        # 连接下载信号
+        self.download_controller.progress.connect(self._on_download_progress)
+        self.download_controller.finished.connect(self._on_download_finished)
+        self.download_controller.failed.connect(self._on_download_failed)
+        self.download_controller.cancelled.connect(self._on_download_cancelled)
+        if self.stage_controller:
+            self.stage_controller.finished.connect(self._on_update_staged)
+            self.stage_controller.failed.connect(self._on_stage_failed)
+
+        self.setup_periodic_check()
+
+    def setup_periodic_check(self):
+        """根据配置注册或移除定期检查更新任务"""
+        scheduler = get_scheduler()
+        interval_hours = self.config_manager.update_check_interval_hours
+        if not interval_hours:
+            scheduler.remove_job("update_check")
+            return
+
+        scheduler.add_job(
+            "update_check",
+            lambda: self.version_checker.check_for_updates_async(silent_mode=True),
+            interval=interval_hours * 3600,
+            jitter=self.config_manager.system_config.get("update_check_jitter", 0.1),
+            should_skip=self._should_skip_periodic_check,
+        )
+
+    def _should_skip_periodic_check(self):
+        """
+        判断本次定期检查是否需要跳过
+
+        Returns:
+            str or None: 跳过原因，不需要跳过时返回 None
+        """
+        if not is_network_available():
+            return "网络不可用"
+        if self.config_manager.update_check_skip_on_battery and is_on_battery():
+            return "正在使用电池供电"
+        if self.download_controller.is_downloading():
+            return "正在下载更新"
+        return None
         
     def check_update(self):
         """检查更新"""
@@ -40,36 +139,34 @@ class VersionManager:
         # 异步检查更新
         self.version_checker.check_for_updates_async()
         
-    def _on_version_check_finished(self, has_update, current_ver, latest_ver, update_info_str, error_msg):
-        """版本检查完成的处理函数"""
+    def _on_version_check_finished(self, result):
+        """
+        版本检查完成的处理函数
+
+        Args:
+            result (UpdateResult): 检查更新结果
+        """
         # 恢复按钮状态
         if hasattr(self.main_window, 'check_update_btn'):
             self.main_window.check_update_btn.setText("检查更新")
             self.main_window.check_update_btn.setEnabled(True)
-            
-        # 检测是否为静默模式
-        silent_mode = error_msg == "silent_mode"
-        
-        # 保存下载URL
+
+        # 保存下载信息
+        self.update_result = result if result.has_update else None
         self.download_url = None
-        if has_update and update_info_str:
-            try:
-                import json
-                update_info = json.loads(update_info_str)
-                self.download_url = update_info.get("download_url")
-                if not self.download_url:
-                    self.download_url = update_info.get("url", self.github_releases_url)
-            except:
-                self.download_url = self.github_releases_url
-                
+        if result.has_update:
+            self.download_url = result.download_url or result.release_url or self.github_releases_url
+
         # 更新版本显示标签
-        self._update_version_label(has_update, current_ver, latest_ver)
-        
+        self._update_version_label(result.has_update, result.current_version, result.latest_version)
+
         # 如果是静默模式，只更新界面不显示弹窗
-        if silent_mode:
-            logger.debug(f"静默检查更新中，有更新: {has_update}")
-            # 如果有更新，在托盘图标中显示简短提示
-            if has_update and self.config_manager.show_notifications:
+        if result.is_silent:
+            logger.debug(f"静默检查更新中，有更新: {result.has_update}")
+            latest_ver = result.latest_version
+            # 如果有更新，在托盘图标中显示简短提示（定期检查时同一版本只提示一次）
+            if result.has_update and self.config_manager.show_notifications and latest_ver != self._notified_version:
+                self._notified_version = latest_ver
                 if hasattr(self.main_window, 'tray_manager') and self.main_window.tray_manager.tray_icon:
                     self.main_window.tray_manager.show_tray_message(
                         self.app_name,
@@ -78,10 +175,10 @@ class VersionManager:
                         3000
                     )
             return
-            
+
         # 显示更新对话框
-        self._show_update_dialog(has_update, current_ver, latest_ver, update_info_str, error_msg)
-        
+        self._show_update_dialog(result)
+
     def _update_version_label(self, has_update, current_ver, latest_ver):
         """更新版本显示标签"""
         if not hasattr(self.main_window, 'version_label'):
@@ -94,22 +191,15 @@ class VersionManager:
             )
             self.main_window.version_label.setOpenExternalLinks(False)
             self.main_window.version_label.setTextInteractionFlags(Qt.TextInteractionFlag.LinksAccessibleByMouse)
-            # 连接到下载函数
-            self.main_window.version_label.linkActivated.connect(self._open_download_page)
             StyleHelper.set_label_type(self.main_window.version_label, "warning")
         else:
             self.main_window.version_label.setText(f"当前版本: v{current_ver}")
             StyleHelper.set_label_type(self.main_window.version_label, "info")
             
-    def _show_update_dialog(self, has_update, current_ver, latest_ver, update_info_str, error_msg):
+    def _show_update_dialog(self, result):
         """显示更新对话框"""
         # 创建并显示消息
-        result = create_update_message(
-            has_update, current_ver, latest_ver, update_info_str, error_msg, self.github_releases_url
-        )
-        
-        # 解包结果
-        title, message, msg_type, extra_data = result
+        title, message, msg_type, extra_data = create_update_message(result, self.github_releases_url)
         
         if hasattr(self.main_window, 'dialog_manager'):
             if msg_type == "error":
@@ -131,13 +221,9 @@ class VersionManager:
             # 确定最终使用的下载URL
             final_url = download_url if download_url else self.github_releases_url
             
-            # 如果是直接下载链接
+            # 如果是直接下载链接，使用内置下载器在后台下载
             if is_direct_download:
-                # 在Windows上使用默认浏览器下载
-                if os.name == "nt":
-                    os.startfile(final_url)
-                else:
-                    webbrowser.open(final_url)
+                self._start_download(final_url)
                 logger.debug(f"用户直接下载新版本: {final_url}")
             else:
                 # 如果不是直接下载链接，打开网页
@@ -161,4 +247,196 @@ class VersionManager:
         if self.download_url:
             self._open_download_url(self.download_url, is_direct_download=True)
         else:
-            self._open_download_url(self.github_releases_url, is_direct_download=False)
\ No newline at end of file
+            self._open_download_url(self.github_releases_url, is_direct_download=False)
+
+    def _open_in_browser(self, download_url):
+        """
+        使用系统默认方式打开下载链接（内置下载失败时的后备方案）
+
+        Args:
+            download_url: 下载链接
+        """
+        if os.name == "nt":
+            os.startfile(download_url)
+        else:
+            webbrowser.open(download_url)
+
+    def _start_download(self, download_url, allow_delta=True):
+        """
+        使用内置下载器下载更新包
+
+        Args:
+            download_url: 更新包下载链接
+            allow_delta: 是否允许优先下载差异包
+
+        Returns:
+            bool: 是否已开始下载
+        """
+        if self._is_update_task_running():
+            logger.debug("更新包正在下载中，忽略重复请求")
+            return False
+
+        # 打包运行且发布了对应的差异包时，优先下载差异包
+        if allow_delta and download_url == self.download_url and self._can_use_delta():
+            result = self.update_result
+            self._active_update = result
+            logger.debug(f"使用增量更新: {result.delta_name}")
+            self._active_download_url = result.delta_url
+            self._active_download_is_delta = True
+            self._show_download_progress()
+            handle = self.download_controller.start(
+                result.delta_url, file_name=result.delta_name, expected_sha256=result.delta_sha256
+            )
+            return handle is not None
+
+        self._active_download_url = download_url
+        self._active_download_is_delta = False
+        self._active_update = None
+        expected_sha256 = None
+        file_name = None
+        if self.update_result and download_url == self.update_result.download_url:
+            self._active_update = self.update_result
+            expected_sha256 = self.update_result.download_sha256
+            file_name = self.update_result.download_name
+
+        self._show_download_progress()
+        handle = self.download_controller.start(download_url, file_name=file_name, expected_sha256=expected_sha256)
+        return handle is not None
+
+    def _is_update_task_running(self):
+        """是否有更新包下载或暂存任务尚未结束"""
+        return self.download_controller.is_downloading() or bool(
+            self.stage_controller and self.stage_controller.is_staging()
+        )
+
+    def _can_use_delta(self):
+        """是否可以使用差异包更新"""
+        return (
+            self.update_result is not None
+            and bool(self.update_result.delta_url)
+            and is_delta_supported()
+            and self.stager is not None
+        )
+
+    def _start_full_download(self, attempt=0):
+        """
+        差异包不可用时改为下载完整更新包
+
+        失败信号在上一个任务结束前发出，任务结束前新的下载会被当作重复请求忽略，
+        因此通过定时器稍后重试，不在界面线程中阻塞等待
+
+        Args:
+            attempt: 已重试次数
+        """
+        if self._is_update_task_running():
+            if attempt < FULL_DOWNLOAD_RETRY_LIMIT:
+                QTimer.singleShot(FULL_DOWNLOAD_RETRY_INTERVAL, partial(self._start_full_download, attempt + 1))
+                return
+            logger.warning("上一个更新任务仍未结束，无法改为下载完整更新包")
+            self._hide_download_progress()
+            return
+
+        self._active_download_is_delta = False
+        if not self._start_download(self.download_url, allow_delta=False):
+            logger.warning("完整更新包下载请求被拒绝")
+            self._hide_download_progress()
+
+    def _show_download_progress(self):
+        """显示下载进度条"""
+        if hasattr(self.main_window, "download_progress"):
+            self.main_window.download_progress.setValue(0)
+            self.main_window.download_progress.setFormat("正在准备下载...")
+            self.main_window.download_progress.show()
+
+    def _on_download_progress(self, downloaded, total):
+        """下载进度更新"""
+        if not hasattr(self.main_window, "download_progress"):
+            return
+
+        progress_bar = self.main_window.download_progress
+        if total:
+            progress_bar.setValue(int(downloaded * 100 / total))
+            progress_bar.setFormat(f"正在下载 {downloaded / 1048576:.1f} / {total / 1048576:.1f} MB (%p%)")
+        else:
+            progress_bar.setFormat(f"正在下载 {downloaded / 1048576:.1f} MB")
+
+    def _hide_download_progress(self):
+        """隐藏下载进度条"""
+        if hasattr(self.main_window, "download_progress"):
+            self.main_window.download_progress.hide()
+
+    def _on_download_finished(self, file_path):
+        """下载完成的处理函数"""
+        logger.info(f"更新包下载完成: {file_path}")
+
+        # 打包运行时在后台解压并暂存，退出时再切换
+        if self.stage_controller and self._active_update is not None:
+            if hasattr(self.main_window, "download_progress"):
+                self.main_window.download_progress.setFormat("正在准备新版本...")
+            self.stage_controller.start(
+                file_path, self._active_update.latest_version, is_delta=self._active_download_is_delta
+            )
+            return
+
+        self._hide_download_progress()
+        if hasattr(self.main_window, "dialog_manager"):
+            self.main_window.dialog_manager.show_info_dialog("下载完成", f"新版本已下载到：\n{file_path}")
+
+    def _on_update_staged(self, version):
+        """新版本暂存完成的处理函数"""
+        self._hide_download_progress()
+
+        if not hasattr(self.main_window, "dialog_manager"):
+            return
+
+        reply = self.main_window.dialog_manager.show_question_dialog(
+            "更新已就绪", f"新版本 v{version} 已准备就绪，退出程序时将自动完成更新。\n\n是否立即重启以完成更新？"
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.restart_after_update = True
+            self.main_window.event_handler.exit_app()
+
+    def _on_stage_failed(self, error_msg):
+        """新版本暂存失败的处理函数"""
+        if self._active_download_is_delta:
+            # 差异包无法还原（如安装目录文件被修改），改为下载完整更新包
+            logger.warning(f"增量更新失败，改为下载完整更新包: {error_msg}")
+            self._start_full_download()
+            return
+
+        self._hide_download_progress()
+        if hasattr(self.main_window, "dialog_manager"):
+            self.main_window.dialog_manager.show_warning_dialog("更新失败", f"准备新版本失败: {error_msg}")
+
+    def apply_pending_update(self):
+        """
+        程序退出时切换到已暂存的新版本
+
+        Returns:
+            bool: 是否已启动切换
+        """
+        if not self.stager or not self.stager.get_pending():
+            return False
+        return self.stager.launch_apply(os.getpid(), self.config_manager.update_dir, relaunch=self.restart_after_update)
+
+    def _on_download_failed(self, error_msg):
+        """下载失败的处理函数，回退到浏览器下载"""
+        if self._active_download_is_delta:
+            logger.warning(f"差异包下载失败，改为下载完整更新包: {error_msg}")
+            self._start_full_download()
+            return
+
+        self._hide_download_progress()
+        logger.warning(f"内置下载失败，改用浏览器下载: {error_msg}")
+
+        try:
+            self._open_in_browser(self._active_download_url or self.github_releases_url)
+        except Exception as e:
+            logger.error(f"打开下载链接失败: {str(e)}")
+            if hasattr(self.main_window, "dialog_manager"):
+                self.main_window.dialog_manager.show_warning_dialog("错误", f"下载更新失败: {error_msg}")
+
+    def _on_download_cancelled(self):
+        """下载取消的处理函数"""
+        self._hide_download_progress()
+        logger.debug("更新包下载已取消，已下载的部分将在下次继续")
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+绘制性能分析器
+
+调试模式下安装在 QApplication 上的事件过滤器，统计每个控件处理 QEvent.Paint 的耗时：
+- 绘制事件经过滤器重新分发（含控件自身的事件过滤器，如卡片阴影），前后计时
+- 同一次界面刷新中的所有绘制事件归为一帧，统计每帧绘制耗时和绘制的控件数量
+- 按控件类名累计绘制耗时，用于找出导致卡顿的组件
+- 只记录时间戳和累加数值，未启用时不安装过滤器，没有任何开销
+"""
+
+import time
+from collections import deque
+from PyQt6.QtCore import QObject, QEvent, QTimer
+from PyQt6.QtWidgets import QApplication, QWidget
+from utils.logger import logger
+
+# 计算帧率和平均值使用的时间窗口（秒）
+STATS_WINDOW = 1.0
+
+
+class PaintProfiler(QObject):
+    """绘制性能分析器"""
+
+    def __init__(self):
+        super().__init__()
+        self._active = False
+        self._dispatching = set()  # 正在重新分发绘制事件的控件 id
+        self._depth = 0  # 绘制事件嵌套深度，只有最外层计入帧耗时
+        self._excluded = set()  # 不参与统计的控件 id（如 HUD 自身）
+
+        # 当前帧
+        self._frame_open = False
+        self._frame_paint_time = 0.0
+        self._frame_widgets = 0
+
+        # 最近的帧 (结束时间, 绘制耗时, 控件数量)
+        self._frames = deque()
+        self._last_frame = (0.0, 0)
+        # 按类名累计 {类名: [次数, 总耗时, 最大耗时]}
+        self._classes = {}
+
+    def start(self):
+        """安装事件过滤器，开始统计"""
+        app = QApplication.instance()
+        if self._active or app is None:
+            return
+        self.reset()
+        app.installEventFilter(self)
+        self._active = True
+        logger.debug("绘制性能分析已开启")
+
+    def stop(self):
+        """移除事件过滤器，停止统计"""
+        app = QApplication.instance()
+        if not self._active:
+            return
+        if app is not None:
+            app.removeEventFilter(self)
+        self._active = False
+        logger.debug("绘制性能分析已关闭")
+
+    def is_active(self):
+        """是否正在统计"""
+        return self._active
+
+    def exclude(self, widget):
+        """
+        不统计指定控件的绘制
+
+        Args:
+            widget (QWidget): 控件
+        """
+        self._excluded.add(id(widget))
+
+    def reset(self):
+        """清空统计数据"""
+        self._frames.clear()
+        self._classes.clear()
+        self._last_frame = (0.0, 0)
+        self._frame_paint_time = 0.0
+        self._frame_widgets = 0
+
+    def eventFilter(self, obj, event):
+        if event.type() != QEvent.Type.Paint or not isinstance(obj, QWidget):
+            return False
+
+        key = id(obj)
+        if key in self._dispatching or key in self._excluded:
+            return False
+
+        # 重新分发绘制事件，再次进入本过滤器时直接放行，控件自身的事件过滤器照常执行
+        self._dispatching.add(key)
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            QApplication.sendEvent(obj, event)
+        finally:
+            elapsed = time.perf_counter() - start
+            self._depth -= 1
+            self._dispatching.discard(key)
+
+        self._record(type(obj).__name__, elapsed)
+        return True
+
+    def _record(self, class_name, elapsed):
+        """记录一次绘制"""
+        stats = self._classes.get(class_name)
+        if stats is None:
+            self._classes[class_name] = [1, elapsed, elapsed]
+        else:
+            stats[0] += 1
+            stats[1] += elapsed
+            if elapsed > stats[2]:
+                stats[2] = elapsed
+
+        self._frame_widgets += 1
+        if self._depth == 0:
+            self._frame_paint_time += elapsed
+        if not self._frame_open:
+            # 同一次刷新中的绘制事件同步分发，返回事件循环后即为帧结束
+            self._frame_open = True
+            QTimer.singleShot(0, self._end_frame)
+
+    def _end_frame(self):
+        """结束当前帧"""
+        self._frame_open = False
+        now = time.perf_counter()
+        self._frames.append((now, self._frame_paint_time, self._frame_widgets))
+        self._last_frame = (self._frame_paint_time, self._frame_widgets)
+        self._frame_paint_time = 0.0
+        self._frame_widgets = 0
+        self._trim(now)
+
+    def _trim(self, now):
+        """移除时间窗口之外的帧"""
+        while self._frames and now - self._frames[0][0] > STATS_WINDOW:
+            self._frames.popleft()
+
+    def get_stats(self, top_n=5):
+        """
+        获取统计信息
+
+        Args:
+            top_n (int): 返回累计绘制耗时最高的类数量
+
+        Returns:
+            dict: 帧率、每帧绘制耗时（毫秒）、每帧绘制控件数量及耗时最高的控件类
+        """
+        self._trim(time.perf_counter())
+        frames = list(self._frames)
+        frame_count = len(frames)
+        top = sorted(self._classes.items(), key=lambda item: item[1][1], reverse=True)[:top_n]
+        return {
+            "fps": frame_count / STATS_WINDOW,
+            "frame_ms": self._last_frame[0] * 1000,
+            "avg_frame_ms": sum(frame[1] for frame in frames) / frame_count * 1000 if frame_count else 0.0,
+            "max_frame_ms": max((frame[1] for frame in frames), default=0.0) * 1000,
+            "widgets": self._last_frame[1],
+            "avg_widgets": sum(frame[2] for frame in frames) / frame_count if frame_count else 0.0,
+            "top": [
+                {"class": name, "count": count, "total_ms": total * 1000, "max_ms": longest * 1000}
+                for name, (count, total, longest) in top
+            ],
+        }
+
+
+# 全局绘制性能分析器实例
+paint_profiler = PaintProfiler()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+绘制资源缓存
+
+自绘组件在 paintEvent 中共享的 QColor / QBrush / QPen 和路径模板：
+- 颜色、画刷、画笔按颜色值缓存，主题颜色按 (主题, 颜色名) 缓存
+- 路径模板按尺寸缓存，使用逻辑坐标，与设备像素比无关
+- 主题切换时清空主题相关的缓存，其余缓存一直保留
+"""
+
+from PyQt6.QtCore import QRectF
+from PyQt6.QtGui import QColor, QBrush, QPen, QPainterPath
+from ui.styles import AntColors, AntColorsDark, theme_manager
+from ui.signal_registry import signal_registry
+
+
+class PaintResources:
+    """绘制资源缓存"""
+
+    def __init__(self):
+        self._colors = {}  # {颜色值: QColor}
+        self._brushes = {}  # {(rgba): QBrush}
+        self._pens = {}  # {(rgba, 宽度): QPen}
+        self._theme_colors = {}  # {(颜色名, 透明度): QColor}
+        self._theme_brushes = {}  # {(颜色名, 透明度): QBrush}
+        self._paths = {}  # {(类型, 尺寸参数...): QPainterPath}
+
+        signal_registry.connect(theme_manager, "theme_changed", self._on_theme_changed)
+
+    def color(self, value):
+        """
+        获取缓存的颜色
+
+        Args:
+            value (str | QColor | Qt.GlobalColor): 颜色值
+
+        Returns:
+            QColor: 共享的颜色对象，调用方不应修改
+        """
+        key = value.rgba() if isinstance(value, QColor) else value
+        color = self._colors.get(key)
+        if color is None:
+            color = QColor(value)
+            self._colors[key] = color
+        return color
+
+    def brush(self, value):
+        """
+        获取缓存的纯色画刷
+
+        Args:
+            value (str | QColor): 颜色值
+
+        Returns:
+            QBrush: 共享的画刷对象
+        """
+        color = self.color(value)
+        key = color.rgba()
+        brush = self._brushes.get(key)
+        if brush is None:
+            brush = QBrush(color)
+            self._brushes[key] = brush
+        return brush
+
+    def pen(self, value, width=1):
+        """
+        获取缓存的画笔
+
+        Args:
+            value (str | QColor): 颜色值
+            width (float): 画笔宽度
+
+        Returns:
+            QPen: 共享的画笔对象
+        """
+        color = self.color(value)
+        key = (color.rgba(), width)
+        pen = self._pens.get(key)
+        if pen is None:
+            pen = QPen(color, width)
+            self._pens[key] = pen
+        return pen
+
+    def theme_color(self, name, alpha=255):
+        """
+        获取当前主题的颜色
+
+        Args:
+            name (str): AntColors 中的颜色名，如 "PRIMARY_6"
+            alpha (int): 透明度 0-255
+
+        Returns:
+            QColor: 共享的颜色对象
+        """
+        key = (name, alpha)
+        color = self._theme_colors.get(key)
+        if color is None:
+            colors = AntColorsDark if theme_manager.is_dark_theme() else AntColors
+            color = QColor(getattr(colors, name))
+            color.setAlpha(alpha)
+            self._theme_colors[key] = color
+        return color
+
+    def theme_brush(self, name, alpha=255):
+        """
+        获取当前主题颜色的画刷
+
+        Args:
+            name (str): AntColors 中的颜色名
+            alpha (int): 透明度 0-255
+
+        Returns:
+            QBrush: 共享的画刷对象
+        """
+        key = (name, alpha)
+        brush = self._theme_brushes.get(key)
+        if brush is None:
+            brush = QBrush(self.theme_color(name, alpha))
+            self._theme_brushes[key] = brush
+        return brush
+
+    def rounded_rect_path(self, width, height, radius):
+        """
+        获取原点在左上角的圆角矩形路径
+
+        Args:
+            width (float): 宽度
+            height (float): 高度
+            radius (float): 圆角半径
+
+        Returns:
+            QPainterPath: 共享的路径对象
+        """
+        key = ("rounded_rect", width, height, radius)
+        path = self._paths.get(key)
+        if path is None:
+            path = QPainterPath()
+            path.addRoundedRect(QRectF(0, 0, width, height), radius, radius)
+            self._paths[key] = path
+        return path
+
+    def ellipse_path(self, width, height):
+        """
+        获取原点在左上角的椭圆路径
+
+        Args:
+            width (float): 宽度
+            height (float): 高度
+
+        Returns:
+            QPainterPath: 共享的路径对象
+        """
+        key = ("ellipse", width, height)
+        path = self._paths.get(key)
+        if path is None:
+            path = QPainterPath()
+            path.addEllipse(0, 0, width, height)
+            self._paths[key] = path
+        return path
+
+    def clear(self):
+        """清空所有缓存"""
+        self._colors.clear()
+        self._brushes.clear()
+        self._pens.clear()
+        self._paths.clear()
+        self._on_theme_changed()
+
+    def _on_theme_changed(self, *args):
+        """主题切换时清空主题颜色缓存"""
+        self._theme_colors.clear()
+        self._theme_brushes.clear()
+
+
+# 全局绘制资源缓存实例
+paint_resources = PaintResources()
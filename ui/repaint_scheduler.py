@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+重绘调度器
+
+动画属性的 setter 不直接调用 update()，而是通过 repaint_scheduler.schedule() 登记需要重绘的控件和区域，
+同一帧内的多次登记合并为一次，每个显示帧只刷新一次：
+- 距上次刷新已超过一帧时，在下一次事件循环立即刷新，不增加延迟
+- 否则等到下一帧开始时刷新
+- 同一控件的多个区域合并后只调用一次 update()
+"""
+
+import time
+from functools import partial
+from PyQt6.QtCore import QObject, QTimer, Qt
+from PyQt6.QtGui import QGuiApplication, QRegion
+from utils.logger import logger
+
+# 无法获取屏幕刷新率时使用的默认值
+DEFAULT_REFRESH_RATE = 60.0
+
+
+class RepaintScheduler(QObject):
+    """按显示帧合并控件重绘请求"""
+
+    def __init__(self):
+        super().__init__()
+        self._pending = {}  # {id: [控件, 区域]}，区域为 None 表示整个控件
+        self._tracked = set()  # 已连接 destroyed 信号的控件 id
+        self._frame_interval = None
+        self._last_flush = 0.0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self.flush)
+
+        # 统计信息
+        self._requests = 0
+        self._flushes = 0
+        self._updates = 0
+
+    def frame_interval(self):
+        """
+        获取帧间隔，按主屏幕刷新率计算
+
+        Returns:
+            float: 帧间隔（秒）
+        """
+        if self._frame_interval is None:
+            screen = QGuiApplication.primaryScreen()
+            refresh_rate = screen.refreshRate() if screen is not None else 0
+            if refresh_rate <= 0:
+                refresh_rate = DEFAULT_REFRESH_RATE
+            self._frame_interval = 1.0 / refresh_rate
+            logger.debug(f"重绘调度器帧间隔: {self._frame_interval * 1000:.2f}ms")
+        return self._frame_interval
+
+    def schedule(self, widget, rect=None):
+        """
+        登记需要重绘的控件，在下一帧统一刷新
+
+        Args:
+            widget (QWidget): 需要重绘的控件
+            rect (QRect): 需要重绘的区域（控件坐标），为 None 时重绘整个控件
+        """
+        self._requests += 1
+        key = id(widget)
+        entry = self._pending.get(key)
+        if entry is None:
+            self._pending[key] = [widget, None if rect is None else QRegion(rect)]
+            if key not in self._tracked:
+                self._tracked.add(key)
+                widget.destroyed.connect(partial(self._forget, key))
+        elif entry[1] is not None:
+            # 已登记整个控件时无需再合并区域
+            entry[1] = None if rect is None else entry[1].united(rect)
+
+        if not self._timer.isActive():
+            elapsed = time.perf_counter() - self._last_flush
+            delay = max(0.0, self.frame_interval() - elapsed)
+            self._timer.start(int(delay * 1000))
+
+    def flush(self):
+        """立即刷新所有登记的重绘请求"""
+        self._timer.stop()
+        pending, self._pending = self._pending, {}
+        self._last_flush = time.perf_counter()
+        if not pending:
+            return
+
+        self._flushes += 1
+        for widget, region in pending.values():
+            if region is None:
+                widget.update()
+            else:
+                widget.update(region)
+            self._updates += 1
+
+    def get_stats(self):
+        """
+        获取调度统计信息
+
+        Returns:
+            dict: 登记次数、刷新次数和实际调用 update() 的次数
+        """
+        return {
+            "requests": self._requests,
+            "flushes": self._flushes,
+            "updates": self._updates,
+            "pending": len(self._pending),
+        }
+
+    def reset_stats(self):
+        """重置统计信息"""
+        self._requests = 0
+        self._flushes = 0
+        self._updates = 0
+
+    def _forget(self, key, *args):
+        """控件销毁时移除未刷新的请求"""
+        self._pending.pop(key, None)
+        self._tracked.discard(key)
+
+
+# 全局重绘调度器实例
+repaint_scheduler = RepaintScheduler()
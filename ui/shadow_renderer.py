@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+九宫格阴影渲染器
+
+按 (圆角半径, 模糊半径, 颜色, 设备像素比) 只模糊一次最小尺寸的圆角矩形，
+缓存为九宫格图片，绘制任意尺寸的阴影时将四角原样绘制、四边和中心拉伸，
+避免每个控件使用 QGraphicsDropShadowEffect 在每次重绘时离屏渲染并模糊整个控件。
+"""
+
+from PyQt6.QtCore import Qt, QRectF, QPointF
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap
+from PyQt6.QtWidgets import QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect
+
+
+class ShadowRenderer:
+    """九宫格阴影渲染器"""
+
+    def __init__(self):
+        self._cache = {}
+
+    def get_nine_patch(self, radius, blur, color, dpr=1.0):
+        """
+        获取阴影九宫格图片，不存在时生成并缓存
+
+        图片逻辑尺寸为 2 * (radius + 2 * blur) + 1，四角各占 radius + 2 * blur，中间1像素用于拉伸。
+
+        Args:
+            radius (int): 圆角半径
+            blur (int): 模糊半径
+            color (QColor): 阴影颜色
+            dpr (float): 设备像素比
+
+        Returns:
+            QPixmap: 九宫格图片
+        """
+        key = (radius, blur, QColor(color).rgba(), dpr)
+        pixmap = self._cache.get(key)
+        if pixmap is None:
+            pixmap = self._build_nine_patch(radius, blur, QColor(color), dpr)
+            self._cache[key] = pixmap
+        return pixmap
+
+    def _build_nine_patch(self, radius, blur, color, dpr):
+        """绘制最小尺寸的圆角矩形并模糊"""
+        shape_size = 2 * (radius + blur) + 1
+        full_size = shape_size + 2 * blur
+        device_size = max(1, round(full_size * dpr))
+
+        image = QImage(device_size, device_size, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(color)
+        painter.drawRoundedRect(
+            QRectF(blur * dpr, blur * dpr, shape_size * dpr, shape_size * dpr), radius * dpr, radius * dpr
+        )
+        painter.end()
+
+        if blur > 0:
+            image = self._blur_image(image, blur * dpr)
+
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(dpr)
+        return pixmap
+
+    @staticmethod
+    def _blur_image(image, blur_radius):
+        """使用与 QGraphicsDropShadowEffect 相同的模糊算法模糊图片"""
+        scene = QGraphicsScene()
+        item = QGraphicsPixmapItem(QPixmap.fromImage(image))
+        effect = QGraphicsBlurEffect()
+        effect.setBlurRadius(blur_radius)
+        effect.setBlurHints(QGraphicsBlurEffect.BlurHint.QualityHint)
+        item.setGraphicsEffect(effect)
+        scene.addItem(item)
+
+        result = QImage(image.size(), QImage.Format.Format_ARGB32_Premultiplied)
+        result.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(result)
+        scene.render(painter, QRectF(result.rect()), QRectF(image.rect()))
+        painter.end()
+        return result
+
+    @staticmethod
+    def shadow_rect(rect, blur, offset=QPointF(0, 0)):
+        """
+        计算阴影覆盖的区域
+
+        Args:
+            rect (QRectF): 投射阴影的矩形
+            blur (int): 模糊半径
+            offset (QPointF): 阴影偏移
+
+        Returns:
+            QRectF: 阴影区域
+        """
+        return QRectF(rect).translated(offset).adjusted(-blur, -blur, blur, blur)
+
+    def draw(self, painter, rect, radius, blur, color, offset=QPointF(0, 0)):
+        """
+        在指定矩形下方绘制阴影
+
+        Args:
+            painter (QPainter): 绘制器
+            rect (QRectF): 投射阴影的矩形
+            radius (int): 圆角半径
+            blur (int): 模糊半径
+            color (QColor): 阴影颜色
+            offset (QPointF): 阴影偏移
+        """
+        dpr = painter.device().devicePixelRatioF()
+        pixmap = self.get_nine_patch(radius, blur, color, dpr)
+        target = self.shadow_rect(rect, blur, offset)
+
+        corner = radius + 2 * blur
+        full = 2 * corner + 1
+
+        # 区域太小时无法分割九宫格，直接整体缩放
+        if target.width() < 2 * corner or target.height() < 2 * corner:
+            painter.drawPixmap(target, pixmap, QRectF(0, 0, full * dpr, full * dpr))
+            return
+
+        # 目标与源图片中三列/三行的起点和尺寸（源图片使用设备像素）
+        xs = (target.left(), target.left() + corner, target.right() - corner)
+        ws = (corner, target.width() - 2 * corner, corner)
+        ys = (target.top(), target.top() + corner, target.bottom() - corner)
+        hs = (corner, target.height() - 2 * corner, corner)
+        src_pos = (0, corner * dpr, (corner + 1) * dpr)
+        src_len = (corner * dpr, dpr, corner * dpr)
+
+        for row in range(3):
+            for col in range(3):
+                painter.drawPixmap(
+                    QRectF(xs[col], ys[row], ws[col], hs[row]),
+                    pixmap,
+                    QRectF(src_pos[col], src_pos[row], src_len[col], src_len[row]),
+                )
+
+    def clear(self):
+        """清空缓存"""
+        self._cache.clear()
+
+    def cache_size(self):
+        """缓存的九宫格数量"""
+        return len(self._cache)
+
+
+# 全局阴影渲染器实例
+shadow_renderer = ShadowRenderer()
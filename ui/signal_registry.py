@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+信号连接登记
+
+连接到全局对象（如 theme_manager、版本检查器）信号的槽通过 signal_registry.connect() 登记：
+- 指定所属对象（QObject）后，所属对象销毁时自动断开，避免普通 Python 对象的槽在窗口销毁后残留
+- 槽为 QObject 的方法时默认以该 QObject 为所属对象，对象销毁时由 PyQt 断开
+- 按信号统计当前登记的连接数量和发送者的实际接收者数量，用于排查连接泄漏
+
+登记本身不延长任何对象的生命周期：与 PyQt 一致，绑定方法的槽和发送者只保存弱引用，所属对象只保存 id。
+槽所属的对象销毁后 PyQt 仍保留内部的槽代理，登记在数量增长和统计时清除已失效的连接并断开这些代理。
+"""
+
+import weakref
+from functools import partial
+from PyQt6 import sip
+from PyQt6.QtCore import QObject
+
+
+# 清除已失效连接的最小登记数量
+PRUNE_MIN_SIZE = 64
+
+
+def _slot_name(slot):
+    """槽的显示名称，如 "CardGroupBox._on_theme_changed" """
+    owner = getattr(slot, "__self__", None)
+    name = getattr(slot, "__name__", None) or type(slot).__name__
+    return f"{type(owner).__name__}.{name}" if owner is not None else getattr(slot, "__qualname__", name)
+
+
+class _WeakSlot:
+    """
+    绑定方法的弱引用
+
+    不使用 weakref.WeakMethod：它在对象上登记了回调，控件与父控件形成引用环被垃圾回收时触发回调会导致崩溃
+    """
+
+    __slots__ = ("_obj", "_func")
+
+    def __init__(self, slot):
+        self._obj = weakref.ref(slot.__self__)
+        self._func = slot.__func__
+
+    def __call__(self):
+        obj = self._obj()
+        # C++ 对象已随父对象销毁而 Python 对象尚未回收时，PyQt 已断开连接
+        if obj is None or (isinstance(obj, sip.simplewrapper) and sip.isdeleted(obj)):
+            return None
+        return self._func.__get__(obj)
+
+
+def _slot_ref(slot):
+    """
+    槽的引用：绑定方法使用弱引用（PyQt 对绑定方法同样只保存弱引用），其他可调用对象由 PyQt 强引用，这里同样保存
+
+    Returns:
+        callable: 调用后返回槽，槽已被回收时返回 None
+    """
+    if getattr(slot, "__self__", None) is not None and hasattr(slot, "__func__"):
+        return _WeakSlot(slot)
+    return lambda: slot
+
+
+class SignalRegistry(QObject):
+    """信号连接登记"""
+
+    def __init__(self):
+        super().__init__()
+        # {连接id: (发送者弱引用, 信号名, 槽引用, 槽名称, 所属对象id, 槽是否为所属对象的方法, QMetaObject.Connection)}
+        self._connections = {}
+        self._owners = {}  # {所属对象id: {连接id}}
+        self._watched = set()  # 已监听 destroyed 信号的所属对象id
+        self._next_id = 1
+        self._prune_at = PRUNE_MIN_SIZE  # 登记数量达到该值时清除已失效的连接
+
+    def connect(self, sender, signal_name, slot, owner=None):
+        """
+        连接并登记信号
+
+        Args:
+            sender (QObject): 发送者
+            signal_name (str): 信号名称，如 "theme_changed"
+            slot (callable): 槽
+            owner (QObject): 所属对象，销毁时自动断开；为 None 且槽为 QObject 的方法时使用该 QObject，
+                否则连接一直保留
+
+        Returns:
+            int: 连接 id，可用于 disconnect()
+        """
+        if len(self._connections) >= self._prune_at:
+            self._live_connections()
+            self._prune_at = max(PRUNE_MIN_SIZE, len(self._connections) * 2)
+        connection = getattr(sender, signal_name).connect(slot)
+
+        if owner is None and isinstance(getattr(slot, "__self__", None), QObject):
+            owner = slot.__self__
+        self_owned = owner is not None and getattr(slot, "__self__", None) is owner
+
+        connection_id = self._next_id
+        self._next_id += 1
+        owner_key = id(owner) if owner is not None else None
+        self._connections[connection_id] = (
+            weakref.ref(sender),
+            signal_name,
+            _slot_ref(slot),
+            _slot_name(slot),
+            owner_key,
+            self_owned,
+            connection,
+        )
+
+        if owner_key is not None:
+            self._owners.setdefault(owner_key, set()).add(connection_id)
+            # 槽为所属对象自身的方法时 PyQt 会随对象销毁断开连接，登记在统计时清除，不需要监听 destroyed：
+            # 控件与父控件形成引用环被垃圾回收时，PyQt 向 Python 槽发送 destroyed 会导致崩溃
+            if not self_owned and owner_key not in self._watched:
+                self._watched.add(owner_key)
+                owner.destroyed.connect(partial(self._on_owner_destroyed, owner_key))
+        return connection_id
+
+    def disconnect(self, connection_id):
+        """
+        断开并移除登记
+
+        Args:
+            connection_id (int): connect() 返回的连接 id
+        """
+        entry = self._connections.pop(connection_id, None)
+        if entry is None:
+            return
+        sender_ref, _, _, _, owner_key, _, connection = entry
+        if owner_key is not None:
+            self._owners.get(owner_key, set()).discard(connection_id)
+        self._disconnect(sender_ref, connection)
+
+    @staticmethod
+    def _disconnect(sender_ref, connection):
+        """按连接句柄断开，不需要访问槽所属的对象"""
+        sender = sender_ref()
+        # 发送者已销毁时连接已随之断开
+        if sender is None or sip.isdeleted(sender):
+            return
+        try:
+            QObject.disconnect(connection)
+        except (RuntimeError, TypeError):
+            # 连接已断开
+            pass
+
+    def disconnect_owner(self, owner):
+        """
+        断开所属对象的所有连接
+
+        Args:
+            owner (QObject): 所属对象
+        """
+        for connection_id in self._owners.pop(id(owner), set()):
+            self.disconnect(connection_id)
+
+    def _on_owner_destroyed(self, owner_key, *args):
+        self._watched.discard(owner_key)
+        for connection_id in self._owners.pop(owner_key, set()):
+            self.disconnect(connection_id)
+
+    def _live_connections(self):
+        """
+        清除发送者或槽已失效的连接，并断开 PyQt 残留的槽代理
+
+        Returns:
+            list: [(发送者, 信号名, 槽名称)]
+        """
+        live = []
+        for connection_id, entry in list(self._connections.items()):
+            sender_ref, signal_name, slot_ref, name, owner_key, _, connection = entry
+            sender = sender_ref()
+            if sender is None or sip.isdeleted(sender) or slot_ref() is None:
+                del self._connections[connection_id]
+                self._disconnect(sender_ref, connection)
+                connections = self._owners.get(owner_key)
+                if connections is not None:
+                    connections.discard(connection_id)
+                    if not connections and owner_key not in self._watched:
+                        del self._owners[owner_key]
+                continue
+            live.append((sender, signal_name, name))
+        return live
+
+    def get_connections(self):
+        """
+        获取当前登记的连接
+
+        Returns:
+            dict: {"类名.信号名": [槽名称, ...]}
+        """
+        result = {}
+        for sender, signal_name, name in self._live_connections():
+            result.setdefault(f"{type(sender).__name__}.{signal_name}", []).append(name)
+        return result
+
+    def report(self):
+        """
+        按信号统计连接数量
+
+        Returns:
+            dict: {"类名.信号名": {"registered": 登记的连接数量, "receivers": 发送者的实际接收者数量}}
+        """
+        live = self._live_connections()
+        senders = {}
+        for sender, signal_name, _ in live:
+            senders[(id(sender), signal_name)] = sender
+
+        result = {}
+        for (_, signal_name), sender in senders.items():
+            key = f"{type(sender).__name__}.{signal_name}"
+            stats = result.setdefault(key, {"registered": 0, "receivers": 0})
+            try:
+                stats["receivers"] += sender.receivers(getattr(sender, signal_name))
+            except RuntimeError:
+                pass
+        for sender, signal_name, _ in live:
+            result[f"{type(sender).__name__}.{signal_name}"]["registered"] += 1
+        return result
+
+
+# 全局信号连接登记实例
+signal_registry = SignalRegistry()
@@ -6,7 +6,9 @@ Ant Design风格UI样式定义
 """
 
 from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtWidgets import QApplication
 from utils.logger import logger
+from ui.asset_cache import asset_cache
 
 
 class AntColors:
@@ -154,6 +156,8 @@ class ThemeManager(QObject):
         self._current_theme = "light"
         self._light_stylesheet = None
         self._dark_stylesheet = None
+        self._app = None
+        self._batch_depth = 0
         self._generate_stylesheets()
 
     def _generate_stylesheets(self):
@@ -166,6 +170,9 @@ class ThemeManager(QObject):
 
     def _build_complete_stylesheet(self, colors):
         """构建完整的样式表"""
+        # 样式表中的图标路径由资源缓存解析（资源包中的 ":/" 路径或绝对路径），与工作目录无关
+        arrow_down = asset_cache.url("assets/icon/arrow-down.svg")
+        arrow_up = asset_cache.url("assets/icon/arrow-up.svg")
         return f"""
         /* === 全局样式 === */
         * {{
@@ -353,7 +360,7 @@ class ThemeManager(QObject):
         }}
         
         QComboBox::down-arrow {{
-            image: url(assets/icon/arrow-down.svg);
+            image: url({arrow_down});
             width: 8px;
             height: 6px;
         }}
@@ -494,6 +501,25 @@ class ThemeManager(QObject):
             color: {colors.GRAY_9};
         }}
 
+        /* === 卡片样式 === */
+        CardGroupBox {{
+            background-color: transparent;
+            border: none;
+            margin: 0px;
+            padding: 0px;
+        }}
+
+        /* 卡片背景和边框由 CardGroupBox 自行绘制，主容器保留1px透明边框维持内容边距 */
+        CardGroupBox > QWidget {{
+            background-color: transparent;
+            border: 1px solid transparent;
+        }}
+
+        /* 确保容器内的布局容器背景透明，但不影响UI控件 */
+        CardGroupBox QWidget[objectName=""] {{
+            background-color: transparent;
+        }}
+
         /* === 导航按钮样式 === */
         /* NavigationButton 基础样式 - Fluent Design风格 */
 
@@ -553,6 +579,20 @@ class ThemeManager(QObject):
             font-size: 14px;  /* 与未激活状态保持一致 */
         }}
 
+        /* NavigationButton 内部标签颜色 */
+        NavigationButton[buttonState="inactive"] QLabel#nav_icon_label {{
+            color: {colors.GRAY_7};
+        }}
+
+        NavigationButton[buttonState="inactive"] QLabel#nav_text_label {{
+            color: {colors.GRAY_9};
+        }}
+
+        NavigationButton[buttonState="active"] QLabel#nav_icon_label,
+        NavigationButton[buttonState="active"] QLabel#nav_text_label {{
+            color: {colors.PRIMARY_6};
+        }}
+
         /* 导航容器样式 - Fluent Design风格 */
         QWidget[navType="vertical"] {{
             background-color: {colors.GRAY_1};
@@ -602,6 +642,7 @@ class ThemeManager(QObject):
             font-weight: 700; /* 更粗的字体突出Logo */
             text-align: center;
             background-color: transparent;
+            color: {colors.PRIMARY_6};
         }}
 
         /* Logo图标样式 */
@@ -728,23 +769,23 @@ class ThemeManager(QObject):
         }}
         
         QSpinBox::up-arrow {{
-            image: url(assets/icon/arrow-up.svg);
+            image: url({arrow_up});
             width: 8px;
             height: 6px;
         }}
         
         QSpinBox::down-arrow {{
-            image: url(assets/icon/arrow-down.svg);
+            image: url({arrow_down});
             width: 8px;
             height: 6px;
         }}
         
         QSpinBox::up-arrow:hover {{
-            image: url(assets/icon/arrow-up.svg);
+            image: url({arrow_up});
         }}
         
         QSpinBox::down-arrow:hover {{
-            image: url(assets/icon/arrow-down.svg);
+            image: url({arrow_down});
         }}
         
         /* === 表格样式 === */
@@ -891,11 +932,52 @@ class ThemeManager(QObject):
         }}
         """
 
+    def attach_application(self, app):
+        """
+        绑定应用程序实例，由主题管理器统一设置全局样式表
+
+        Args:
+            app: QApplication实例
+        """
+        self._app = app
+        app.setStyleSheet(self.get_stylesheet())
+
+    def is_batch_updating(self) -> bool:
+        """是否正在批量切换主题，此时组件无需单独刷新样式"""
+        return self._batch_depth > 0
+
     def set_theme(self, theme: str):
         """设置主题并发送信号"""
         if theme != self._current_theme:
             self._current_theme = theme
+            self._apply_theme(theme)
+
+    def _apply_theme(self, theme: str):
+        """
+        批量切换主题
+
+        冻结所有可见窗口的绘制，先发送主题信号让各组件只更新自身属性，
+        再统一设置一次全局样式表，使每个控件只重新polish一次，最后恢复绘制统一重绘。
+
+        Args:
+            theme: 主题名称
+        """
+        windows = []
+        if self._app is not None:
+            windows = [w for w in QApplication.topLevelWidgets() if w.isVisible() and w.updatesEnabled()]
+
+        for window in windows:
+            window.setUpdatesEnabled(False)
+
+        self._batch_depth += 1
+        try:
             self.theme_changed.emit(theme)
+            if self._app is not None:
+                self._app.setStyleSheet(self.get_stylesheet(theme))
+        finally:
+            self._batch_depth -= 1
+            for window in windows:
+                window.setUpdatesEnabled(True)
 
     def get_current_theme(self) -> str:
         """获取当前主题"""
@@ -925,6 +1007,20 @@ theme_manager = ThemeManager()
 class StyleHelper:
     """样式辅助类"""
 
+    @staticmethod
+    def repolish(widget):
+        """重新应用控件样式
+
+        批量切换主题期间跳过，由全局样式表统一刷新
+
+        Args:
+            widget: QWidget实例
+        """
+        if theme_manager.is_batch_updating():
+            return
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+
     @staticmethod
     def set_frameless_window_properties(window):
         """设置无边框窗口属性
@@ -937,8 +1033,7 @@ class StyleHelper:
             window.setProperty("windowType", "frameless")
 
             # 刷新样式
-            window.style().unpolish(window)
-            window.style().polish(window)
+            StyleHelper.repolish(window)
         except Exception as e:
             logger.error(f"设置无边框窗口属性失败: {e}")
 
@@ -951,8 +1046,7 @@ class StyleHelper:
             button_type: 按钮类型 ('primary', 'success', 'warning', 'danger', 'default')
         """
         button.setProperty("buttonType", button_type)
-        button.style().unpolish(button)
-        button.style().polish(button)
+        StyleHelper.repolish(button)
 
     @staticmethod
     def set_label_type(label, label_type: str):
@@ -963,8 +1057,7 @@ class StyleHelper:
             label_type: 标签类型 ('info', 'success', 'warning', 'error', 'secondary', 'small')
         """
         label.setProperty("labelType", label_type)
-        label.style().unpolish(label)
-        label.style().polish(label)
+        StyleHelper.repolish(label)
 
     @staticmethod
     def set_progress_type(progressbar, progress_type: str):
@@ -975,8 +1068,7 @@ class StyleHelper:
             progress_type: 进度条类型 ('memory-low', 'memory-medium', 'memory-high')
         """
         progressbar.setProperty("progressType", progress_type)
-        progressbar.style().unpolish(progressbar)
-        progressbar.style().polish(progressbar)
+        StyleHelper.repolish(progressbar)
 
     @staticmethod
     def set_checkbox_style(checkbox, check_style: str = "default"):
@@ -993,8 +1085,7 @@ class StyleHelper:
             checkbox.setProperty("checkStyle", check_style)
         else:
             checkbox.setProperty("checkStyle", None)
-        checkbox.style().unpolish(checkbox)
-        checkbox.style().polish(checkbox)
+        StyleHelper.repolish(checkbox)
 
 
 class StatusHTMLGenerator:
@@ -1186,11 +1277,8 @@ class StyleApplier:
     @staticmethod
     def apply_ant_design_theme(app):
         """应用Ant Design主题到整个应用"""
-        stylesheet = theme_manager.get_stylesheet()
-        app.setStyleSheet(stylesheet)
-
-        # 连接主题变化信号
-        theme_manager.theme_changed.connect(lambda theme: app.setStyleSheet(theme_manager.get_stylesheet(theme)))
+        # 由主题管理器在切换主题时统一设置样式表
+        theme_manager.attach_application(app)
 
 
 class TitleHelper:
@@ -3,10 +3,33 @@
 
 """工具类模块"""
 
-from utils.system_utils import run_as_admin, check_single_instance, enable_auto_start, disable_auto_start
+from utils.system_utils import (
+    run_as_admin,
+    check_single_instance,
+    enable_auto_start,
+    disable_auto_start,
+    is_frozen_build,
+    get_install_dir,
+    is_network_available,
+    is_on_battery,
+)
 from utils.logger import logger, setup_logger
 from utils.notification import send_notification, create_notification_thread, find_icon_path
-from utils.version_checker import get_version_checker, get_app_version, create_update_message, check_for_update
+from utils.version_checker import (
+    get_version_checker,
+    get_app_version,
+    create_update_message,
+    check_for_update,
+    CheckMode,
+    UpdateResult,
+)
+from utils.task_executor import get_task_executor, TaskPriority, CancellationToken, TaskCancelledError
+from utils.update_downloader import UpdateDownloader, UpdateDownloadController, DownloadError
+from utils.delta_update import DeltaError, is_delta_supported
+from utils.update_stager import UpdateStager, UpdateStageController, StagingError
+from utils.scheduler import get_scheduler
+from utils.stall_watchdog import get_stall_watchdog
+from utils.cpu_profiler import get_cpu_profiler
 
 
 __all__ = [
@@ -14,6 +37,10 @@ __all__ = [
     "check_single_instance",
     "enable_auto_start",
     "disable_auto_start",
+    "is_frozen_build",
+    "get_install_dir",
+    "is_network_available",
+    "is_on_battery",
     "logger",
     "setup_logger",
     "send_notification",
@@ -23,4 +50,21 @@ __all__ = [
     "get_app_version",
     "create_update_message",
     "check_for_update",
+    "CheckMode",
+    "UpdateResult",
+    "get_task_executor",
+    "TaskPriority",
+    "CancellationToken",
+    "TaskCancelledError",
+    "UpdateDownloader",
+    "UpdateDownloadController",
+    "DownloadError",
+    "DeltaError",
+    "is_delta_supported",
+    "UpdateStager",
+    "UpdateStageController",
+    "StagingError",
+    "get_scheduler",
+    "get_stall_watchdog",
+    "get_cpu_profiler",
 ]
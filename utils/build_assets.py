@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+资源包生成工具
+
+将 assets 目录下的所有资源（SVG、图片、样式表模板等）连同 SVG 的预栅格化 PNG 图片
+编译为单个 Qt 二进制资源包 assets.rcc，并在包内生成清单 assets/manifest.json。
+程序启动时通过 QResource.registerResource 以内存映射方式加载，查找资源无需访问文件系统，
+打包后也只需携带一个资源文件。
+
+资源包使用 Qt rcc 二进制格式（版本 3）直接写出，不依赖 rcc 工具。
+
+用法:
+    python -m utils.build_assets
+    python -m utils.build_assets --sizes 12 16 --dprs 1 1.25 1.5 2 --output assets.rcc
+"""
+
+import os
+import sys
+import json
+import zlib
+import struct
+import hashlib
+import argparse
+
+# 设置标准输出编码为UTF-8，解决Windows环境下中文输出问题
+if sys.stdout.encoding != 'utf-8':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except AttributeError:
+        import io
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+# 项目根目录
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+from ui.asset_cache import ASSET_BUNDLE_NAME, ASSET_MANIFEST_PATH, variant_key  # noqa: E402
+
+# 资源目录（相对项目根目录）
+ASSETS_DIR = "assets"
+# 预栅格化图片所在的包内目录
+RASTER_DIR = "assets/raster"
+# 默认预栅格化的逻辑尺寸和设备像素比
+DEFAULT_RASTER_SIZES = [12, 16]
+DEFAULT_RASTER_DPRS = [1, 1.25, 1.5, 2]
+# 压缩后小于原大小的该比例时才压缩（与 rcc 默认阈值一致）
+COMPRESS_THRESHOLD = 0.7
+
+# rcc 格式常量
+RCC_VERSION = 3
+RCC_FLAG_COMPRESSED = 0x01
+RCC_FLAG_DIRECTORY = 0x02
+RCC_LANGUAGE_C = 1
+RCC_TERRITORY_ANY = 0
+
+
+def qt_hash(name):
+    """Qt 资源名称哈希，与 QResource 内部的 qt_hash 一致"""
+    h = 0
+    encoded = name.encode("utf-16-be")
+    for unit in struct.unpack(f">{len(encoded) // 2}H", encoded):
+        h = ((h << 4) + unit) & 0xFFFFFFFF
+        h ^= (h & 0xF0000000) >> 23
+        h &= 0x0FFFFFFF
+    return h
+
+
+class RccWriter:
+    """Qt 二进制资源包（rcc 格式版本 3）写入器"""
+
+    def __init__(self, compress_threshold=COMPRESS_THRESHOLD):
+        self.compress_threshold = compress_threshold
+        self._root = {}  # 目录树 {名称: 子目录 dict 或文件数据 bytes}
+
+    def add_file(self, resource_path, data):
+        """
+        添加文件
+
+        Args:
+            resource_path (str): 包内路径，如 "assets/icon/minus.svg"
+            data (bytes): 文件内容
+        """
+        parts = [part for part in resource_path.split("/") if part]
+        node = self._root
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        node[parts[-1]] = data
+
+    @staticmethod
+    def _sorted_children(directory):
+        """按名称哈希排序子节点，QResource 使用二分查找定位"""
+        return sorted(directory.items(), key=lambda item: qt_hash(item[0]))
+
+    def _encode_data(self, data):
+        """编码文件数据，返回 (标志, 数据块)"""
+        flags = 0
+        payload = data
+        if data:
+            compressed = zlib.compress(data, 9)
+            # qCompress 格式：4字节大端原始长度 + zlib 数据
+            if len(compressed) + 4 < len(data) * self.compress_threshold:
+                flags = RCC_FLAG_COMPRESSED
+                payload = struct.pack(">I", len(data)) + compressed
+        return flags, struct.pack(">I", len(payload)) + payload
+
+    def build(self):
+        """
+        生成资源包内容
+
+        Returns:
+            bytes: rcc 二进制数据
+        """
+        names = bytearray()
+        name_offsets = {}
+        data = bytearray()
+
+        def name_offset(name):
+            if name not in name_offsets:
+                name_offsets[name] = len(names)
+                encoded = name.encode("utf-16-be")
+                names.extend(struct.pack(">HI", len(encoded) // 2, qt_hash(name)))
+                names.extend(encoded)
+            return name_offsets[name]
+
+        # 按广度优先顺序为节点编号，同一目录的子节点连续存放
+        queue = [self._root]
+        next_index = 1
+        child_offsets = {}
+        while queue:
+            directory = queue.pop(0)
+            child_offsets[id(directory)] = next_index
+            for _, child in self._sorted_children(directory):
+                next_index += 1
+                if isinstance(child, dict):
+                    queue.append(child)
+
+        tree = bytearray()
+
+        def write_node(name, content):
+            offset = name_offset(name) if name else 0
+            if isinstance(content, dict):
+                tree.extend(struct.pack(">IH", offset, RCC_FLAG_DIRECTORY))
+                tree.extend(struct.pack(">II", len(content), child_offsets[id(content)]))
+            else:
+                flags, block = self._encode_data(content)
+                tree.extend(struct.pack(">IH", offset, flags))
+                tree.extend(struct.pack(">HHI", RCC_TERRITORY_ANY, RCC_LANGUAGE_C, len(data)))
+                data.extend(block)
+            # 最后修改时间（版本 2 起），固定为 0 使生成结果可重现
+            tree.extend(struct.pack(">Q", 0))
+
+        write_node("", self._root)
+        queue = [self._root]
+        while queue:
+            directory = queue.pop(0)
+            for child_name, child in self._sorted_children(directory):
+                write_node(child_name, child)
+                if isinstance(child, dict):
+                    queue.append(child)
+
+        header_size = 24
+        tree_offset = header_size
+        data_offset = tree_offset + len(tree)
+        names_offset = data_offset + len(data)
+        header = b"qres" + struct.pack(">IIIII", RCC_VERSION, tree_offset, data_offset, names_offset, 0)
+        return bytes(header + tree + data + names)
+
+
+def collect_assets(assets_dir):
+    """
+    收集资源目录下的所有文件
+
+    Returns:
+        list: [(包内路径, 绝对路径)]
+    """
+    files = []
+    for current_dir, _, file_names in os.walk(assets_dir):
+        for file_name in sorted(file_names):
+            abs_path = os.path.join(current_dir, file_name)
+            rel_path = os.path.relpath(abs_path, root_dir).replace(os.sep, "/")
+            files.append((rel_path, abs_path))
+    return sorted(files)
+
+
+def rasterize_variants(svg_path, resource_path, sizes, dprs):
+    """
+    将 SVG 预栅格化为各尺寸和设备像素比的 PNG 图片
+
+    Returns:
+        list: [(清单中的键, 包内路径, PNG 数据)]
+    """
+    from PyQt6.QtCore import QBuffer, QIODevice
+    from PyQt6.QtSvg import QSvgRenderer
+    from ui.asset_cache import rasterize_svg
+
+    renderer = QSvgRenderer(svg_path)
+    if not renderer.isValid():
+        print(f"无法加载SVG，跳过预栅格化: {resource_path}")
+        return []
+
+    stem = os.path.splitext(os.path.basename(resource_path))[0]
+    variants = []
+    for size in sizes:
+        for dpr in dprs:
+            device_size = max(1, round(size * dpr))
+            image = rasterize_svg(renderer, device_size, device_size)
+
+            buffer = QBuffer()
+            buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+            image.save(buffer, "PNG")
+            key = variant_key(size, size, dpr)
+            variants.append((key, f"{RASTER_DIR}/{stem}-{key}.png", bytes(buffer.data())))
+    return variants
+
+
+def build_bundle(output_path, sizes, dprs):
+    """
+    生成资源包
+
+    Args:
+        output_path (str): 输出文件路径
+        sizes (list): 预栅格化的逻辑尺寸
+        dprs (list): 预栅格化的设备像素比
+
+    Returns:
+        dict: 资源清单
+    """
+    writer = RccWriter()
+    manifest = {"version": 1, "files": {}}
+
+    for resource_path, abs_path in collect_assets(os.path.join(root_dir, ASSETS_DIR)):
+        with open(abs_path, "rb") as f:
+            content = f.read()
+        writer.add_file(resource_path, content)
+
+        entry = {"size": len(content), "sha256": hashlib.sha256(content).hexdigest()}
+        if resource_path.lower().endswith(".svg"):
+            entry["variants"] = {}
+            for key, variant_path, png in rasterize_variants(abs_path, resource_path, sizes, dprs):
+                writer.add_file(variant_path, png)
+                entry["variants"][key] = variant_path
+        manifest["files"][resource_path] = entry
+
+    writer.add_file(
+        ASSET_MANIFEST_PATH, json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8")
+    )
+
+    with open(output_path, "wb") as f:
+        f.write(writer.build())
+    return manifest
+
+
+def parse_arguments():
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description='资源包生成工具')
+    parser.add_argument('--output', default=os.path.join(root_dir, ASSET_BUNDLE_NAME),
+                        help=f'资源包输出路径 (默认: {ASSET_BUNDLE_NAME})')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_RASTER_SIZES,
+                        help='SVG 预栅格化的逻辑尺寸 (默认: 12 16)')
+    parser.add_argument('--dprs', type=float, nargs='+', default=DEFAULT_RASTER_DPRS,
+                        help='SVG 预栅格化的设备像素比 (默认: 1 1.25 1.5 2)')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+
+    # 预栅格化需要 QGuiApplication，使用离屏平台避免依赖显示环境
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtGui import QGuiApplication
+    app = QGuiApplication.instance() or QGuiApplication(sys.argv[:1])  # noqa: F841
+
+    manifest = build_bundle(args.output, args.sizes, args.dprs)
+
+    variant_count = sum(len(entry.get("variants", {})) for entry in manifest["files"].values())
+    size_kb = os.path.getsize(args.output) / 1024
+    print(f"资源包已生成: {args.output}")
+    print(f"资源文件: {len(manifest['files'])} 个，预栅格化图片: {variant_count} 个，大小: {size_kb:.1f} KB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
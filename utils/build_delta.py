@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+差异包生成工具
+
+将本次打包的 main.dist 与之前若干个版本的完整压缩包逐一比较，
+生成 {app}-v{旧版本}-to-v{新版本}-x64.delta.zip 差异包，并输出相对完整包节省的下载大小。
+
+用法:
+    python -m utils.build_delta --releases previous_releases
+    python -m utils.build_delta --releases previous_releases --version 1.2.3 --count 5
+"""
+
+import os
+import re
+import sys
+import json
+import zipfile
+import argparse
+import tempfile
+from packaging import version
+from utils.delta_update import build_delta, delta_package_name, is_delta_supported
+from config import ConfigManager
+
+# 设置标准输出编码为UTF-8，解决Windows环境下中文输出问题
+if sys.stdout.encoding != 'utf-8':
+    try:
+        sys.stdout.reconfigure(encoding='utf-8')
+    except AttributeError:
+        import io
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+# 项目根目录
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def find_previous_releases(releases_dir, app_name, current_version, count):
+    """
+    查找之前版本的完整压缩包
+
+    Args:
+        releases_dir (str): 存放历史完整压缩包的目录
+        app_name (str): 应用名称
+        current_version (str): 当前版本号
+        count (int): 最多返回的版本数量
+
+    Returns:
+        list: [(版本号, 压缩包路径)]，按版本从新到旧排列
+    """
+    pattern = re.compile(rf"^{re.escape(app_name)}-v(.+)-x64\.zip$")
+    releases = []
+    for file_name in os.listdir(releases_dir):
+        match = pattern.match(file_name)
+        if not match:
+            continue
+        try:
+            release_version = version.parse(match.group(1))
+        except version.InvalidVersion:
+            continue
+        if release_version < version.parse(current_version):
+            releases.append((release_version, match.group(1), os.path.join(releases_dir, file_name)))
+
+    releases.sort(reverse=True)
+    return [(ver_str, path) for _, ver_str, path in releases[:count]]
+
+
+def build_deltas(dist_dir, releases_dir, output_dir, app_name, current_version, count):
+    """
+    生成当前版本相对之前各版本的差异包
+
+    Returns:
+        list: 每个差异包的统计信息
+    """
+    full_zip = os.path.join(output_dir, f"{app_name}-v{current_version}-x64.zip")
+    full_size = os.path.getsize(full_zip) if os.path.exists(full_zip) else None
+
+    reports = []
+    for old_version, old_zip in find_previous_releases(releases_dir, app_name, current_version, count):
+        output_path = os.path.join(output_dir, delta_package_name(app_name, old_version, current_version))
+        print(f"正在生成差异包: v{old_version} -> v{current_version}")
+
+        with tempfile.TemporaryDirectory() as old_dir:
+            with zipfile.ZipFile(old_zip) as package:
+                package.extractall(old_dir)
+            stats = build_delta(old_dir, dist_dir, output_path, app_name, old_version, current_version)
+
+        stats.update({
+            "from_version": old_version,
+            "to_version": current_version,
+            "delta_name": os.path.basename(output_path),
+            "full_size": full_size,
+        })
+        reports.append(stats)
+
+    return reports
+
+
+def print_report(reports):
+    """输出差异包大小与节省的下载量"""
+    print("\n" + "=" * 72)
+    print(f"{'版本':<20}{'差异包':>12}{'完整包':>12}{'节省':>12}  文件(保留/差异/新增/删除)")
+    print("=" * 72)
+    for item in reports:
+        delta_mb = item["size"] / (1024 * 1024)
+        if item["full_size"]:
+            full_mb = item["full_size"] / (1024 * 1024)
+            saved = f"{(1 - item['size'] / item['full_size']) * 100:.1f}%"
+            full_text = f"{full_mb:.2f} MB"
+        else:
+            full_text, saved = "-", "-"
+        print(
+            f"{'v' + item['from_version'] + ' -> v' + item['to_version']:<20}"
+            f"{delta_mb:>9.2f} MB{full_text:>12}{saved:>12}  "
+            f"{item['kept']}/{item['patched']}/{item['added']}/{item['removed']}"
+        )
+    print("=" * 72)
+
+
+def parse_arguments(app_name, current_version):
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description=f'{app_name} 差异包生成工具')
+    parser.add_argument('--dist', default=os.path.join(root_dir, "main.dist"),
+                        help='本次打包输出目录 (默认: main.dist)')
+    parser.add_argument('--releases', required=True,
+                        help='存放历史版本完整压缩包的目录')
+    parser.add_argument('--output', default=root_dir,
+                        help='差异包输出目录 (默认: 项目根目录)')
+    parser.add_argument('--version', default=current_version,
+                        help=f'当前版本号 (默认: {current_version})')
+    parser.add_argument('--count', type=int, default=3,
+                        help='生成差异包的历史版本数量 (默认: 3)')
+    return parser.parse_args()
+
+
+def main():
+    config_manager = ConfigManager()
+    app_name = config_manager.get_app_name()
+    args = parse_arguments(app_name, config_manager.get_app_version())
+
+    if not is_delta_supported():
+        print("未安装 zstandard，跳过差异包生成")
+        return 0
+
+    if not os.path.isdir(args.dist):
+        print(f"打包输出目录不存在: {args.dist}")
+        return 1
+
+    if not os.path.isdir(args.releases):
+        print(f"历史版本目录不存在，跳过差异包生成: {args.releases}")
+        return 0
+
+    reports = build_deltas(args.dist, args.releases, args.output, app_name, args.version, args.count)
+    if not reports:
+        print("未找到可用的历史版本，跳过差异包生成")
+        return 0
+
+    print_report(reports)
+
+    report_path = os.path.join(args.output, f"{app_name}-v{args.version}-delta-report.json")
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(reports, f, ensure_ascii=False, indent=2)
+    print(f"差异包报告已保存: {report_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
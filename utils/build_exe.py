@@ -5,6 +5,7 @@ import shutil
 import argparse
 import re
 from utils import get_app_version
+from ui.asset_cache import ASSET_BUNDLE_NAME
 from config import ConfigManager
 
 # 设置标准输出编码为UTF-8，解决Windows环境下中文输出问题
@@ -56,6 +57,13 @@ def parse_arguments():
     parser.add_argument('--no-version-update', 
                        action='store_true',
                        help='跳过版本号更新')
+    parser.add_argument('--previous-releases',
+                       help='存放历史版本完整压缩包的目录，指定后同时生成差异包',
+                       type=str)
+    parser.add_argument('--delta-count',
+                       help='生成差异包的历史版本数量 (默认: 3)',
+                       type=int,
+                       default=3)
     return parser.parse_args()
 
 # 解析命令行参数
@@ -71,6 +79,15 @@ except ImportError:
     print("正在安装 Nuitka...")
     subprocess.check_call([sys.executable, "-m", "pip", "install", "nuitka"])
 
+# 生成资源包，代替逐个携带图标资源文件
+asset_bundle_path = os.path.join(root_dir, ASSET_BUNDLE_NAME)
+print("正在生成资源包...")
+try:
+    subprocess.check_call([sys.executable, "-m", "utils.build_assets", "--output", asset_bundle_path], cwd=root_dir)
+except subprocess.CalledProcessError as e:
+    print(f"资源包生成失败: {e}")
+    sys.exit(1)
+
 # 构建Nuitka打包命令
 cmd = [
     sys.executable,
@@ -78,7 +95,8 @@ cmd = [
     "--standalone",  # 生成独立可执行文件
     "--windows-console-mode=disable",  # 禁用控制台
     "--windows-icon-from-ico=" + icon_path,  # 设置图标
-    "--include-data-dir=%s=assets/icon" % assets_icon_dir,  # 包含整个图标资源目录
+    "--include-data-files=%s=%s" % (asset_bundle_path, ASSET_BUNDLE_NAME),  # 资源包（包含全部图标资源）
+    "--include-data-files=%s=favicon.ico" % icon_path,  # 通知和托盘需要独立的图标文件
     "--windows-uac-admin",  # 请求管理员权限
     "--remove-output",  # 在重新构建前移除输出目录
     
@@ -147,6 +165,22 @@ else:
     print("未找到可执行文件目录，无法压缩")
     sys.exit(1)
 
+# 生成相对历史版本的差异包
+if args.previous_releases:
+    print("正在生成差异包...")
+    delta_cmd = [
+        sys.executable, "-m", "utils.build_delta",
+        "--dist", dist_dir,
+        "--releases", args.previous_releases,
+        "--output", root_dir,
+        "--version", current_version,
+        "--count", str(args.delta_count),
+    ]
+    try:
+        subprocess.check_call(delta_cmd)
+    except subprocess.CalledProcessError as e:
+        print(f"差异包生成失败: {e}")
+
 print(f"{app_name} v{current_version} Nuitka 打包和压缩完成！")
 
 # 显示使用说明
@@ -164,7 +198,10 @@ def show_usage():
     print("3. 跳过版本号更新:")
     print("   python utils/build_exe.py --no-version-update")
     print()
-    print("4. 显示帮助:")
+    print("4. 同时生成相对最近3个版本的差异包:")
+    print("   python utils/build_exe.py --previous-releases previous_releases --delta-count 3")
+    print()
+    print("5. 显示帮助:")
     print("   python utils/build_exe.py -h")
     print("="*60)
 
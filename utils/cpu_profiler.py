@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CPU 性能分析模块
+
+在运行中的程序上按需进行固定时长的 CPU 性能分析，无需安装额外工具：
+- cprofile: 使用 cProfile 对 GUI 线程做确定性分析，输出 pstats 文件
+- sampling: 后台线程按固定频率通过 sys._current_frames() 采样所有线程的调用栈，开销低，
+  输出折叠栈文本（可用 flamegraph.pl 等生成火焰图）和 speedscope JSON（可在 speedscope.app 中查看）
+"""
+
+import os
+import sys
+import json
+import time
+import cProfile
+import threading
+from collections import Counter
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from .logger import logger
+
+# 分析模式
+MODE_CPROFILE = "cprofile"
+MODE_SAMPLING = "sampling"
+PROFILE_MODES = (MODE_CPROFILE, MODE_SAMPLING)
+
+# 默认分析时长（秒）和采样频率（次/秒）
+DEFAULT_DURATION = 30
+DEFAULT_SAMPLE_RATE = 100
+
+# 项目根目录，调用栈中的文件路径相对该目录显示
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _frame_label(code):
+    """
+    调用栈帧的显示名称，按函数（而非行号）聚合
+
+    Returns:
+        tuple: (名称, 文件, 函数起始行号)
+    """
+    path = code.co_filename
+    if path.startswith(_project_root):
+        path = os.path.relpath(path, _project_root).replace(os.sep, "/")
+    return (code.co_name, path, code.co_firstlineno)
+
+
+class SamplingProfiler:
+    """基于 sys._current_frames() 的多线程采样分析器"""
+
+    def __init__(self, sample_rate=DEFAULT_SAMPLE_RATE):
+        self.interval = 1.0 / max(1, sample_rate)
+        self.samples = Counter()  # {(线程名, (帧, ...)): 次数}，帧从最外层到最内层
+        self.sample_count = 0
+        self.duration = 0.0
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """开始采样"""
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="SamplingProfiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """停止采样并等待采样线程结束"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def _run(self):
+        own_id = threading.get_ident()
+        started_at = time.perf_counter()
+        next_sample = started_at
+        while not self._stop_event.is_set():
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                stack.reverse()
+                self.samples[(names.get(thread_id, f"Thread-{thread_id}"), tuple(stack))] += 1
+            self.sample_count += 1
+
+            # 按固定节拍采样，采样本身的耗时不累积到间隔中
+            next_sample += self.interval
+            self._stop_event.wait(max(0.0, next_sample - time.perf_counter()))
+        self.duration = time.perf_counter() - started_at
+
+    def write_collapsed(self, path):
+        """
+        输出折叠栈格式：每行为 "线程;最外层帧;...;最内层帧 次数"
+
+        Args:
+            path (str): 输出路径
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            for (thread_name, stack), count in sorted(self.samples.items()):
+                frames = [thread_name] + [f"{name} ({file}:{line})" for name, file, line in stack]
+                f.write(";".join(frame.replace(";", ":") for frame in frames) + f" {count}\n")
+
+    def write_speedscope(self, path, name):
+        """
+        输出 speedscope 采样格式，每个线程一个 profile，相同调用栈合并为一条带权重的样本
+
+        Args:
+            path (str): 输出路径
+            name (str): 分析名称
+        """
+        frames = []
+        frame_index = {}
+        profiles = {}
+        for (thread_name, stack), count in self.samples.items():
+            indices = []
+            for label in stack:
+                index = frame_index.get(label)
+                if index is None:
+                    index = frame_index[label] = len(frames)
+                    frames.append({"name": label[0], "file": label[1], "line": label[2]})
+                indices.append(index)
+
+            profile = profiles.setdefault(
+                thread_name,
+                {
+                    "type": "sampled",
+                    "name": thread_name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": self.duration,
+                    "samples": [],
+                    "weights": [],
+                },
+            )
+            profile["samples"].append(indices)
+            profile["weights"].append(count * self.interval)
+
+        # 主线程排在最前，默认显示
+        ordered = sorted(profiles.values(), key=lambda profile: (profile["name"] != "MainThread", profile["name"]))
+        document = {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "ACE-PyQt",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": ordered,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(document, f, ensure_ascii=False)
+
+
+class CpuProfiler(QObject):
+    """按需 CPU 性能分析"""
+
+    # 分析结束信号，参数为输出文件路径列表（失败时为空列表）
+    finished = pyqtSignal(list)
+
+    def __init__(self):
+        super().__init__()
+        self._mode = None
+        self._output_dir = None
+        self._profile = None
+        self._sampler = None
+        self._started_at = 0.0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.stop)
+
+    def is_running(self):
+        """是否正在分析"""
+        return self._mode is not None
+
+    def start(self, mode=MODE_SAMPLING, duration=DEFAULT_DURATION, output_dir=None, sample_rate=DEFAULT_SAMPLE_RATE):
+        """
+        开始分析，到时后自动停止并输出结果，必须在 GUI 线程中调用
+
+        Args:
+            mode (str): 分析模式，cprofile 或 sampling
+            duration (float): 分析时长（秒），为 0 时需手动调用 stop()
+            output_dir (str): 输出目录
+            sample_rate (int): sampling 模式的采样频率（次/秒）
+
+        Returns:
+            bool: 是否已开始
+        """
+        if self.is_running():
+            logger.warning("CPU性能分析正在进行中")
+            return False
+        if mode not in PROFILE_MODES:
+            logger.error(f"未知的CPU性能分析模式: {mode}")
+            return False
+
+        if mode == MODE_CPROFILE:
+            self._profile = cProfile.Profile()
+            try:
+                self._profile.enable()
+            except ValueError as e:
+                # 已有其他分析器（如调试器）在运行
+                logger.error(f"无法开启cProfile: {e}")
+                self._profile = None
+                return False
+        else:
+            self._sampler = SamplingProfiler(sample_rate)
+            self._sampler.start()
+
+        self._mode = mode
+        self._output_dir = output_dir
+        self._started_at = time.perf_counter()
+        if duration > 0:
+            self._timer.start(int(duration * 1000))
+        logger.info(f"CPU性能分析已开始 - 模式: {mode}, 时长: {duration}s")
+        return True
+
+    def start_with_config(self, config_manager, mode=None):
+        """
+        按配置开始分析，结果输出到配置目录下的 profiles 目录
+
+        Args:
+            config_manager (ConfigManager): 配置管理器
+            mode (str): 分析模式，为 None 时使用配置中的模式
+
+        Returns:
+            bool: 是否已开始
+        """
+        system_config = config_manager.system_config
+        return self.start(
+            mode=mode or system_config.get("cpu_profile_mode", MODE_SAMPLING),
+            duration=system_config.get("cpu_profile_duration", DEFAULT_DURATION),
+            output_dir=config_manager.profile_dir,
+            sample_rate=system_config.get("cpu_profile_sample_rate", DEFAULT_SAMPLE_RATE),
+        )
+
+    def stop(self):
+        """
+        停止分析并输出结果
+
+        Returns:
+            list: 输出文件路径
+        """
+        if not self.is_running():
+            return []
+        self._timer.stop()
+        if self._profile is not None:
+            self._profile.disable()
+        if self._sampler is not None:
+            self._sampler.stop()
+        elapsed = time.perf_counter() - self._started_at
+
+        paths = []
+        try:
+            paths = self._write_results()
+        except OSError as e:
+            logger.error(f"输出CPU性能分析结果失败: {e}")
+        finally:
+            self._mode = None
+            self._profile = None
+            self._sampler = None
+
+        logger.info(f"CPU性能分析已结束，用时 {elapsed:.1f}s，结果: {', '.join(paths) or '无'}")
+        self.finished.emit(paths)
+        return paths
+
+    def _write_results(self):
+        """按分析模式写出结果文件"""
+        if not self._output_dir:
+            return []
+        os.makedirs(self._output_dir, exist_ok=True)
+        name = f"cpu-{time.strftime('%Y%m%d-%H%M%S')}-{self._mode}"
+        base = os.path.join(self._output_dir, name)
+
+        if self._profile is not None:
+            path = base + ".pstats"
+            self._profile.dump_stats(path)
+            return [path]
+
+        collapsed_path = base + ".collapsed.txt"
+        speedscope_path = base + ".speedscope.json"
+        self._sampler.write_collapsed(collapsed_path)
+        self._sampler.write_speedscope(speedscope_path, name)
+        logger.debug(f"采样次数: {self._sampler.sample_count}, 不同调用栈: {len(self._sampler.samples)}")
+        return [collapsed_path, speedscope_path]
+
+
+# 单例CPU性能分析实例
+_cpu_profiler_instance = None
+
+
+def get_cpu_profiler():
+    """
+    获取CPU性能分析实例（单例模式）
+
+    Returns:
+        CpuProfiler: CPU性能分析实例
+    """
+    global _cpu_profiler_instance
+    if _cpu_profiler_instance is None:
+        _cpu_profiler_instance = CpuProfiler()
+    return _cpu_profiler_instance
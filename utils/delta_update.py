@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+增量更新模块
+
+在两个版本的程序目录之间生成按文件的二进制差异包，并在客户端用已安装的目录还原出新版本：
+- 未变化的文件只记录哈希，直接从已安装目录复制
+- 变化的文件使用 zstd 的 patch-from 模式（以旧文件为原始字典压缩新文件）生成差异
+- 新增的文件以 zstd 压缩后存入差异包
+- 每个文件都记录 SHA-256，还原时逐一校验
+
+差异包为 zip 文件，命名为 {app}-v{旧版本}-to-v{新版本}-x64.delta.zip，
+根目录下的 delta_manifest.json 描述所有文件。
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import zipfile
+from .logger import logger
+from .task_executor import CancellationToken
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+DELTA_FORMAT_VERSION = 1
+DELTA_MANIFEST_NAME = "delta_manifest.json"
+DELTA_SUFFIX = "-x64.delta.zip"
+# 差异压缩级别
+PATCH_LEVEL = 19
+# 还原时允许的最大窗口（与生成时的窗口大小对应）
+MAX_WINDOW_LOG = 31
+
+
+class DeltaError(Exception):
+    """差异包生成或还原失败异常"""
+
+
+def is_delta_supported():
+    """
+    判断当前环境是否支持增量更新
+
+    Returns:
+        bool: zstandard 可用时返回 True
+    """
+    return zstandard is not None
+
+
+def delta_package_name(app_name, from_version, to_version):
+    """
+    获取差异包文件名
+
+    Args:
+        app_name (str): 应用名称
+        from_version (str): 旧版本号
+        to_version (str): 新版本号
+
+    Returns:
+        str: 差异包文件名
+    """
+    return f"{app_name}-v{from_version}-to-v{to_version}{DELTA_SUFFIX}"
+
+
+def _sha256_bytes(data):
+    """计算字节数据的SHA-256值"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _walk_files(root_dir):
+    """
+    遍历目录下的所有文件
+
+    Returns:
+        dict: 相对路径（使用/分隔） -> 绝对路径
+    """
+    files = {}
+    for current_dir, _, file_names in os.walk(root_dir):
+        for file_name in file_names:
+            abs_path = os.path.join(current_dir, file_name)
+            rel_path = os.path.relpath(abs_path, root_dir).replace(os.sep, "/")
+            files[rel_path] = abs_path
+    return files
+
+
+def _window_log(*sizes):
+    """计算覆盖旧文件和新文件所需的窗口大小"""
+    return max(10, min(MAX_WINDOW_LOG, sum(sizes).bit_length()))
+
+
+def _make_patch(old_data, new_data):
+    """以旧文件为原始字典压缩新文件"""
+    dict_data = zstandard.ZstdCompressionDict(old_data, dict_type=zstandard.DICT_TYPE_RAWCONTENT)
+    params = zstandard.ZstdCompressionParameters.from_level(
+        PATCH_LEVEL, window_log=_window_log(len(old_data), len(new_data)), enable_ldm=True
+    )
+    return zstandard.ZstdCompressor(dict_data=dict_data, compression_params=params).compress(new_data)
+
+
+def _apply_patch(old_data, patch_data):
+    """使用旧文件还原新文件"""
+    dict_data = zstandard.ZstdCompressionDict(old_data, dict_type=zstandard.DICT_TYPE_RAWCONTENT)
+    decompressor = zstandard.ZstdDecompressor(dict_data=dict_data, max_window_size=1 << MAX_WINDOW_LOG)
+    return decompressor.decompress(patch_data)
+
+
+def _compress(data):
+    """压缩新增文件"""
+    params = zstandard.ZstdCompressionParameters.from_level(PATCH_LEVEL, window_log=_window_log(len(data)))
+    return zstandard.ZstdCompressor(compression_params=params).compress(data)
+
+
+def _decompress(data):
+    """解压新增文件"""
+    return zstandard.ZstdDecompressor(max_window_size=1 << MAX_WINDOW_LOG).decompress(data)
+
+
+def build_delta(old_dir, new_dir, output_path, app_name, from_version, to_version):
+    """
+    生成两个版本目录之间的差异包
+
+    Args:
+        old_dir (str): 旧版本程序目录
+        new_dir (str): 新版本程序目录
+        output_path (str): 差异包输出路径
+        app_name (str): 应用名称
+        from_version (str): 旧版本号
+        to_version (str): 新版本号
+
+    Returns:
+        dict: 统计信息 (files, kept, patched, added, removed, size)
+
+    Raises:
+        DeltaError: zstandard 不可用
+    """
+    if not is_delta_supported():
+        raise DeltaError("未安装 zstandard，无法生成差异包")
+
+    old_files = _walk_files(old_dir)
+    new_files = _walk_files(new_dir)
+    entries = []
+    stats = {"files": len(new_files), "kept": 0, "patched": 0, "added": 0, "removed": 0}
+
+    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_STORED) as package:
+        for index, rel_path in enumerate(sorted(new_files)):
+            with open(new_files[rel_path], "rb") as f:
+                new_data = f.read()
+            new_sha256 = _sha256_bytes(new_data)
+            entry = {"path": rel_path, "sha256": new_sha256, "size": len(new_data)}
+
+            old_data = None
+            if rel_path in old_files:
+                with open(old_files[rel_path], "rb") as f:
+                    old_data = f.read()
+
+            if old_data is not None and _sha256_bytes(old_data) == new_sha256:
+                entry["action"] = "keep"
+                stats["kept"] += 1
+            else:
+                # 差异不比直接压缩更小时按新增文件处理
+                compressed = _compress(new_data)
+                patch = _make_patch(old_data, new_data) if old_data else None
+                if patch is not None and len(patch) < len(compressed):
+                    entry["action"] = "patch"
+                    entry["base_sha256"] = _sha256_bytes(old_data)
+                    entry["data"] = f"patches/{index:05d}.zst"
+                    package.writestr(entry["data"], patch)
+                    stats["patched"] += 1
+                else:
+                    entry["action"] = "add"
+                    entry["data"] = f"files/{index:05d}.zst"
+                    package.writestr(entry["data"], compressed)
+                    stats["added"] += 1
+
+            entries.append(entry)
+
+        stats["removed"] = len(set(old_files) - set(new_files))
+        manifest = {
+            "format": DELTA_FORMAT_VERSION,
+            "app": app_name,
+            "from_version": from_version,
+            "to_version": to_version,
+            "files": entries,
+        }
+        package.writestr(DELTA_MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=2))
+
+    stats["size"] = os.path.getsize(output_path)
+    return stats
+
+
+def read_delta_manifest(delta_path):
+    """
+    读取差异包清单
+
+    Args:
+        delta_path (str): 差异包路径
+
+    Returns:
+        dict: 清单内容
+
+    Raises:
+        DeltaError: 差异包无效
+    """
+    try:
+        with zipfile.ZipFile(delta_path) as package:
+            manifest = json.loads(package.read(DELTA_MANIFEST_NAME).decode("utf-8"))
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+        raise DeltaError(f"差异包无效: {str(e)}")
+
+    if manifest.get("format") != DELTA_FORMAT_VERSION:
+        raise DeltaError(f"不支持的差异包格式: {manifest.get('format')}")
+    return manifest
+
+
+def apply_delta(delta_path, base_dir, target_dir, token=None):
+    """
+    使用已安装目录和差异包还原出新版本目录
+
+    Args:
+        delta_path (str): 差异包路径
+        base_dir (str): 已安装的旧版本目录
+        target_dir (str): 新版本输出目录（必须不存在或为空）
+        token (CancellationToken, optional): 取消令牌
+
+    Returns:
+        dict: 差异包清单
+
+    Raises:
+        DeltaError: 差异包无效、旧版本文件不匹配或校验失败
+        TaskCancelledError: 还原被取消
+    """
+    if not is_delta_supported():
+        raise DeltaError("未安装 zstandard，无法应用差异包")
+
+    token = token or CancellationToken()
+    manifest = read_delta_manifest(delta_path)
+    os.makedirs(target_dir, exist_ok=True)
+
+    with zipfile.ZipFile(delta_path) as package:
+        for entry in manifest["files"]:
+            token.raise_if_cancelled()
+
+            rel_path = entry["path"]
+            target_path = os.path.join(target_dir, *rel_path.split("/"))
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            base_path = os.path.join(base_dir, *rel_path.split("/"))
+            action = entry["action"]
+
+            if action == "keep":
+                _copy_verified(base_path, target_path, entry["sha256"])
+                continue
+
+            if action == "patch":
+                try:
+                    with open(base_path, "rb") as f:
+                        base_data = f.read()
+                except OSError as e:
+                    raise DeltaError(f"缺少旧版本文件 {rel_path}: {str(e)}")
+                if _sha256_bytes(base_data) != entry["base_sha256"]:
+                    raise DeltaError(f"旧版本文件已被修改: {rel_path}")
+                data = _apply_patch(base_data, package.read(entry["data"]))
+            elif action == "add":
+                data = _decompress(package.read(entry["data"]))
+            else:
+                raise DeltaError(f"未知的差异操作: {action}")
+
+            if _sha256_bytes(data) != entry["sha256"]:
+                raise DeltaError(f"还原后的文件校验失败: {rel_path}")
+            with open(target_path, "wb") as f:
+                f.write(data)
+
+    logger.debug(f"差异包已应用: v{manifest['from_version']} -> v{manifest['to_version']}，共 {len(manifest['files'])} 个文件")
+    return manifest
+
+
+def _copy_verified(source_path, target_path, expected_sha256):
+    """复制文件并在复制过程中校验哈希"""
+    sha256 = hashlib.sha256()
+    try:
+        with open(source_path, "rb") as src, open(target_path, "wb") as dst:
+            for chunk in iter(lambda: src.read(1024 * 1024), b""):
+                sha256.update(chunk)
+                dst.write(chunk)
+    except OSError as e:
+        raise DeltaError(f"复制旧版本文件失败: {str(e)}")
+
+    if sha256.hexdigest() != expected_sha256:
+        raise DeltaError(f"旧版本文件已被修改: {os.path.basename(source_path)}")
+    shutil.copystat(source_path, target_path)
+
@@ -0,0 +1,375 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+发布镜像竞速模块
+
+在多个镜像之间并发请求同一资源，使用最先返回有效结果的镜像：
+- 镜像以模板配置，{url} 会被替换为原始地址，"{url}" 本身表示直连
+- 按历史统计排序，最快且可靠的镜像最先发起请求，其余镜像错开一小段时间依次发起
+- 某个镜像失败时立即发起下一个，不必等待错开时间
+- 出现有效结果后不再发起新的请求，仍在进行的请求在读取响应体前放弃
+- 每个镜像的成功次数、失败次数和延迟（指数移动平均）保存在配置目录中
+"""
+
+import os
+import json
+import time
+import threading
+import requests
+from .logger import logger
+from .task_executor import CancellationToken, TaskCancelledError
+
+# 直连模板
+DIRECT_MIRROR = "{url}"
+# 延迟指数移动平均的权重
+LATENCY_EWMA_ALPHA = 0.3
+# 失败率超过该值（且至少尝试过若干次）的镜像排在最后
+UNRELIABLE_FAILURE_RATE = 0.5
+UNRELIABLE_MIN_ATTEMPTS = 3
+
+
+class MirrorRaceError(Exception):
+    """所有镜像均失败异常，original 为排名最靠前的镜像的错误"""
+
+    def __init__(self, message, original=None):
+        super().__init__(message)
+        self.original = original
+
+
+class _MirrorCancelled(Exception):
+    """竞速已有结果，放弃当前请求"""
+
+
+class MirrorStats:
+    """镜像统计信息，保存在 JSON 文件中"""
+
+    def __init__(self, path=None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._data = {}
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._data = data
+        except (OSError, ValueError) as e:
+            logger.warning(f"读取镜像统计失败: {str(e)}")
+
+    def save(self):
+        """保存统计信息"""
+        if not self.path:
+            return
+        with self._lock:
+            data = json.dumps(self._data, ensure_ascii=False, indent=2)
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"保存镜像统计失败: {str(e)}")
+
+    def get(self, mirror):
+        """获取镜像统计的副本"""
+        with self._lock:
+            return dict(self._data.get(mirror, {}))
+
+    def record_success(self, mirror, latency):
+        """
+        记录一次成功请求
+
+        Args:
+            mirror (str): 镜像模板
+            latency (float): 请求延迟（秒）
+        """
+        with self._lock:
+            item = self._data.setdefault(mirror, {"success": 0, "failure": 0, "latency": None})
+            item["success"] += 1
+            previous = item.get("latency")
+            item["latency"] = latency if previous is None else previous + LATENCY_EWMA_ALPHA * (latency - previous)
+            item["last_success"] = time.time()
+
+    def record_failure(self, mirror):
+        """
+        记录一次失败请求
+
+        Args:
+            mirror (str): 镜像模板
+        """
+        with self._lock:
+            item = self._data.setdefault(mirror, {"success": 0, "failure": 0, "latency": None})
+            item["failure"] += 1
+
+    def sort_key(self, mirror, index):
+        """
+        镜像排序键：可靠的镜像按延迟排序，没有记录的镜像按配置顺序排在其后，不可靠的镜像排在最后
+
+        Args:
+            mirror (str): 镜像模板
+            index (int): 镜像在配置中的位置
+        """
+        item = self.get(mirror)
+        attempts = item.get("success", 0) + item.get("failure", 0)
+        unreliable = (
+            attempts >= UNRELIABLE_MIN_ATTEMPTS and item.get("failure", 0) / attempts > UNRELIABLE_FAILURE_RATE
+        )
+        latency = item.get("latency")
+        return (unreliable, latency is None, latency or 0.0, index)
+
+
+class MirrorRacer:
+    """镜像竞速器"""
+
+    def __init__(self, mirrors=None, stats_path=None, stagger=0.3, timeout=10, max_concurrent=3, user_agent=None):
+        """
+        Args:
+            mirrors (list): 镜像模板列表
+            stats_path (str, optional): 统计文件路径
+            stagger (float): 相邻镜像发起请求的间隔（秒）
+            timeout (float): 单个请求超时时间（秒）
+            max_concurrent (int): 最多同时进行的请求数
+            user_agent (str, optional): 请求的 User-Agent
+        """
+        self.mirrors = [m for m in (mirrors or []) if "{url}" in m] or [DIRECT_MIRROR]
+        self.stats = MirrorStats(stats_path)
+        self.stagger = stagger
+        self.timeout = timeout
+        self.max_concurrent = max(1, max_concurrent)
+        self.user_agent = user_agent
+
+    def ordered_mirrors(self):
+        """按历史统计排序的镜像列表"""
+        indexed = list(enumerate(self.mirrors))
+        indexed.sort(key=lambda item: self.stats.sort_key(item[1], item[0]))
+        return [mirror for _, mirror in indexed]
+
+    def race(self, url, probe, token=None):
+        """
+        在所有镜像间竞速请求
+
+        Args:
+            url (str): 原始地址
+            probe (callable): probe(session, mirror_url, is_cancelled) -> value，
+                请求并校验结果，无效时抛出异常；is_cancelled() 为 True 时应尽快放弃
+            token (CancellationToken, optional): 取消令牌
+
+        Returns:
+            tuple: (镜像模板, 镜像地址, probe 返回值)
+
+        Raises:
+            MirrorRaceError: 所有镜像均失败
+            TaskCancelledError: 竞速被取消
+        """
+        token = token or CancellationToken()
+        mirrors = self.ordered_mirrors()
+        condition = threading.Condition()
+        state = {"winner": None, "running": 0, "errors": {}}
+
+        def is_cancelled():
+            return state["winner"] is not None or token.is_cancelled
+
+        def attempt(mirror):
+            mirror_url = mirror.replace("{url}", url)
+            session = requests.Session()
+            if self.user_agent:
+                session.headers["User-Agent"] = self.user_agent
+            started = time.perf_counter()
+            try:
+                value = probe(session, mirror_url, is_cancelled)
+                latency = time.perf_counter() - started
+                self.stats.record_success(mirror, latency)
+                with condition:
+                    if state["winner"] is None and not token.is_cancelled:
+                        state["winner"] = (mirror, mirror_url, value)
+                        logger.debug(f"镜像竞速胜出: {mirror_url} ({latency * 1000:.0f}ms)")
+            except _MirrorCancelled:
+                pass
+            except Exception as e:
+                if not is_cancelled():
+                    self.stats.record_failure(mirror)
+                    logger.debug(f"镜像请求失败: {mirror_url}: {str(e)}")
+                with condition:
+                    state["errors"][mirror] = e
+            finally:
+                session.close()
+                with condition:
+                    state["running"] -= 1
+                    condition.notify_all()
+
+        def start(mirror):
+            state["running"] += 1
+            threading.Thread(target=attempt, args=(mirror,), daemon=True, name="MirrorRace").start()
+
+        pending = list(mirrors)
+        with condition:
+            start(pending.pop(0))
+            while True:
+                if state["winner"] is not None:
+                    break
+                if token.is_cancelled:
+                    raise TaskCancelledError()
+                if state["running"] == 0 and not pending:
+                    break
+
+                # 错开时间到达或正在进行的请求全部失败时发起下一个
+                if pending and state["running"] < self.max_concurrent:
+                    deadline = time.perf_counter() + (self.stagger if state["running"] else 0)
+                    running = state["running"]
+                    while state["winner"] is None and state["running"] >= running and state["running"] > 0:
+                        remaining = deadline - time.perf_counter()
+                        if remaining <= 0 or token.is_cancelled:
+                            break
+                        condition.wait(min(remaining, 0.05))
+                    if state["winner"] is None and not token.is_cancelled:
+                        start(pending.pop(0))
+                else:
+                    condition.wait(0.05)
+
+        self.stats.save()
+
+        if state["winner"] is not None:
+            return state["winner"]
+
+        # 全部失败时返回排名最靠前的镜像的错误，保留原有的错误处理分支
+        errors = state["errors"]
+        original = next((errors[m] for m in mirrors if m in errors), None)
+        raise MirrorRaceError(f"所有镜像均请求失败: {original}", original)
+
+    def fetch_json(self, url, headers=None, validate=None, token=None):
+        """
+        竞速获取 JSON 数据
+
+        Args:
+            url (str): 原始地址
+            headers (dict, optional): 请求头
+            validate (callable, optional): 校验解析后的数据，无效时抛出异常
+            token (CancellationToken, optional): 取消令牌
+
+        Returns:
+            tuple: (镜像地址, JSON 数据)
+        """
+
+        def probe(session, mirror_url, is_cancelled):
+            with session.get(mirror_url, headers=headers, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                # 已有其他镜像返回结果，不再读取响应体
+                if is_cancelled():
+                    raise _MirrorCancelled()
+                data = response.json()
+            if validate:
+                validate(data)
+            return data
+
+        _, mirror_url, data = self.race(url, probe, token)
+        return mirror_url, data
+
+    def resolve_asset(self, url, token=None):
+        """
+        竞速选择可用的资源下载地址（请求首字节确认镜像可用）
+
+        Args:
+            url (str): 原始资源地址
+            token (CancellationToken, optional): 取消令牌
+
+        Returns:
+            str: 最快可用的镜像资源地址
+        """
+        if self.mirrors == [DIRECT_MIRROR]:
+            return url
+
+        def probe(session, mirror_url, is_cancelled):
+            headers = {"Range": "bytes=0-0"}
+            with session.get(mirror_url, headers=headers, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                # 部分代理会返回错误页面，确认返回的是二进制内容
+                if "text/html" in response.headers.get("Content-Type", ""):
+                    raise ValueError("镜像返回了网页而不是文件")
+
+        # 返回跳转前的地址，跳转后的签名地址可能很快过期
+        _, mirror_url, _ = self.race(url, probe, token)
+        return mirror_url
+
+
+if __name__ == "__main__":
+    """使用多个注入延迟的本地服务器测试镜像竞速"""
+    import tempfile
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+    release = {"tag_name": "v9.9.9", "assets": []}
+
+    def make_server(delay, status=200):
+        """创建一个延迟响应的本地镜像，路径中携带原始地址"""
+
+        class MirrorHandler(BaseHTTPRequestHandler):
+            requests_served = 0
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                MirrorHandler.requests_served += 1
+                time.sleep(delay)
+                body = json.dumps(release).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), MirrorHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server, MirrorHandler, f"http://127.0.0.1:{server.server_address[1]}/{{url}}"
+
+    def validate(data):
+        if not data.get("tag_name"):
+            raise ValueError("缺少版本号")
+
+    slow, slow_handler, slow_mirror = make_server(1.5)
+    fast, fast_handler, fast_mirror = make_server(0.2)
+    broken, broken_handler, broken_mirror = make_server(0.0, status=403)
+    original_url = "https://api.github.com/repos/test/test/releases/latest"
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        stats_path = os.path.join(temp_dir, "mirror_stats.json")
+
+        # 第一次：按配置顺序，失败的镜像立即让位，较快的镜像胜出
+        racer = MirrorRacer([slow_mirror, broken_mirror, fast_mirror], stats_path, stagger=0.3, timeout=5)
+        started = time.perf_counter()
+        winner_url, data = racer.fetch_json(original_url, validate=validate)
+        elapsed = time.perf_counter() - started
+        assert winner_url.startswith(fast_mirror.split("{")[0]) and data["tag_name"] == "v9.9.9"
+        assert elapsed < 1.5, elapsed
+        print(f"✅ 第一次竞速由快速镜像胜出，耗时 {elapsed:.2f}s")
+
+        # 等待慢速镜像的请求结束；已有结果后它在读取响应体前被放弃，不计入成功或失败统计，
+        # 因此下一次排序时快速镜像有延迟记录，排在没有记录的慢速镜像之前
+        time.sleep(1.6)
+
+        # 第二次：统计已持久化，新实例优先请求最快的镜像，慢速镜像不会被请求
+        slow_before = slow_handler.requests_served
+        racer = MirrorRacer([slow_mirror, broken_mirror, fast_mirror], stats_path, stagger=0.5, timeout=5)
+        assert racer.ordered_mirrors()[0] == fast_mirror, racer.ordered_mirrors()
+        started = time.perf_counter()
+        racer.fetch_json(original_url, validate=validate)
+        elapsed = time.perf_counter() - started
+        assert slow_handler.requests_served == slow_before
+        print(f"✅ 第二次优先使用最快镜像，耗时 {elapsed:.2f}s，顺序: {[m.split('/')[2] for m in racer.ordered_mirrors()]}")
+
+        # 全部失败时抛出排名最靠前的镜像的错误
+        racer = MirrorRacer([broken_mirror], None, timeout=5)
+        try:
+            racer.fetch_json(original_url)
+            raise AssertionError("应当失败")
+        except MirrorRaceError as e:
+            assert isinstance(e.original, requests.exceptions.HTTPError)
+            print(f"✅ 全部失败时保留原始错误: {type(e.original).__name__}")
+
+    for server in (slow, fast, broken):
+        server.shutdown()
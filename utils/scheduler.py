@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+定时任务调度模块
+
+由主窗口的 update_timer 每秒驱动一次 tick()，统一管理周期性任务：
+- 每次计算下次执行时间时加入随机抖动，避免大量客户端在同一时刻请求服务器
+- 任务回调返回 TaskHandle 时，在任务结束后根据结果决定下次执行时间，失败时指数退避
+- 可以为任务设置跳过条件（如离线、使用电池供电），满足条件时稍后再试
+"""
+
+import time
+import random
+from .logger import logger
+
+# 跳过执行后的重试间隔（秒）
+SKIP_RETRY_INTERVAL = 10 * 60
+# 失败后的首次重试间隔（秒）
+FAILURE_RETRY_INTERVAL = 10 * 60
+# 默认最大退避间隔（秒）
+DEFAULT_MAX_BACKOFF = 24 * 60 * 60
+
+
+class ScheduledJob:
+    """周期性任务"""
+
+    def __init__(self, name, callback, interval, jitter, max_backoff, should_skip):
+        self.name = name
+        self.callback = callback
+        self.interval = interval
+        self.jitter = jitter
+        self.max_backoff = max_backoff
+        self.should_skip = should_skip
+        self.next_run = 0.0
+        self.failures = 0
+        self.pending = None  # 正在执行的 TaskHandle
+
+    def schedule_in(self, delay, now):
+        """
+        设置下次执行时间，按比例加入随机抖动
+
+        Args:
+            delay (float): 基础延迟（秒）
+            now (float): 当前时间
+        """
+        spread = delay * self.jitter
+        self.next_run = now + max(1.0, delay + random.uniform(-spread, spread))
+
+    def failure_delay(self):
+        """失败后的退避延迟，从首次重试间隔开始逐次翻倍"""
+        delay = min(self.interval, FAILURE_RETRY_INTERVAL) * (2 ** (self.failures - 1))
+        return min(delay, self.max_backoff)
+
+
+class Scheduler:
+    """共享定时任务调度器"""
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._jobs = {}
+
+    def add_job(self, name, callback, interval, jitter=0.1, initial_delay=None, max_backoff=DEFAULT_MAX_BACKOFF, should_skip=None):
+        """
+        添加或替换周期性任务
+
+        Args:
+            name (str): 任务名称，同名任务会被替换
+            callback (callable): 任务回调，可以返回 TaskHandle 以便根据执行结果退避
+            interval (float): 执行间隔（秒）
+            jitter (float): 随机抖动比例，0.1 表示间隔上下浮动10%
+            initial_delay (float, optional): 首次执行延迟（秒），默认等于执行间隔
+            max_backoff (float): 失败退避的最大间隔（秒）
+            should_skip (callable, optional): 返回跳过原因字符串时本次不执行
+        """
+        job = ScheduledJob(name, callback, interval, jitter, max_backoff, should_skip)
+        job.schedule_in(interval if initial_delay is None else initial_delay, self._clock())
+        self._jobs[name] = job
+        logger.debug(f"已添加定时任务: {name}，间隔 {interval / 3600:.2f} 小时")
+
+    def remove_job(self, name):
+        """
+        移除周期性任务
+
+        Args:
+            name (str): 任务名称
+
+        Returns:
+            bool: 是否找到并移除了任务
+        """
+        return self._jobs.pop(name, None) is not None
+
+    def has_job(self, name):
+        """是否存在指定名称的任务"""
+        return name in self._jobs
+
+    def next_run_in(self, name):
+        """
+        获取任务距下次执行的秒数
+
+        Args:
+            name (str): 任务名称
+
+        Returns:
+            float or None: 剩余秒数，任务不存在时返回 None
+        """
+        job = self._jobs.get(name)
+        if job is None:
+            return None
+        return max(0.0, job.next_run - self._clock())
+
+    def tick(self):
+        """检查并执行到期任务，由主线程定时器调用"""
+        now = self._clock()
+        for job in list(self._jobs.values()):
+            if job.pending is not None:
+                self._collect_result(job, now)
+            elif now >= job.next_run:
+                self._run_job(job, now)
+
+    def _run_job(self, job, now):
+        """执行到期任务"""
+        if job.should_skip:
+            reason = job.should_skip()
+            if reason:
+                logger.debug(f"跳过定时任务 {job.name}: {reason}")
+                job.schedule_in(min(job.interval, SKIP_RETRY_INTERVAL), now)
+                return
+
+        try:
+            result = job.callback()
+        except Exception as e:
+            logger.error(f"定时任务 {job.name} 执行失败: {str(e)}")
+            self._on_job_done(job, False, now)
+            return
+
+        # 返回任务句柄时等待任务结束再安排下次执行
+        if result is not None and hasattr(result, "is_done"):
+            job.pending = result
+        else:
+            self._on_job_done(job, result is not False, now)
+
+    def _collect_result(self, job, now):
+        """检查后台任务是否结束"""
+        handle = job.pending
+        if not handle.is_done():
+            return
+        job.pending = None
+        success = handle.error is None and not handle.is_cancelled() and handle.result is not False
+        self._on_job_done(job, success, now)
+
+    def _on_job_done(self, job, success, now):
+        """根据执行结果安排下次执行时间"""
+        if success:
+            job.failures = 0
+            job.schedule_in(job.interval, now)
+            return
+
+        job.failures += 1
+        delay = job.failure_delay()
+        job.schedule_in(delay, now)
+        logger.debug(f"定时任务 {job.name} 第 {job.failures} 次失败，{delay / 60:.0f} 分钟后重试")
+
+
+# 单例调度器实例
+_scheduler_instance = None
+
+
+def get_scheduler():
+    """
+    获取调度器实例（单例模式）
+
+    Returns:
+        Scheduler: 调度器实例
+    """
+    global _scheduler_instance
+    if _scheduler_instance is None:
+        _scheduler_instance = Scheduler()
+    return _scheduler_instance
@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+GUI 线程卡顿监测模块
+
+GUI 线程中的心跳定时器定期记录时间，监测线程检查心跳间隔：
+- 心跳超过阈值未更新时，通过 sys._current_frames() 抓取 GUI 线程当前的 Python 调用栈并记录日志
+- 心跳恢复后由 GUI 线程计算本次卡顿的实际时长
+- 按调用位置（调用栈中最内层的项目代码）汇总卡顿次数、总时长和最长时长
+- 嵌套事件循环（如 QMessageBox.exec）期间心跳照常触发，不会被视为卡顿
+"""
+
+import os
+import sys
+import time
+import threading
+import traceback
+from PyQt6.QtCore import QObject, QTimer, Qt
+from .logger import logger
+
+# 默认卡顿阈值（毫秒）
+DEFAULT_THRESHOLD_MS = 200
+# 心跳间隔相对阈值的比例
+HEARTBEAT_RATIO = 0.25
+# 超过该时长的间隔视为系统休眠，不计为卡顿（秒）
+SUSPEND_GAP = 30.0
+# 日志中输出的汇总条目数量
+SUMMARY_TOP_N = 10
+
+# 项目根目录，用于定位调用位置
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _call_site(frames):
+    """
+    从调用栈中找出最内层的项目代码位置
+
+    Args:
+        frames (list): traceback.extract_stack() 的结果，最外层在前
+
+    Returns:
+        str: 如 "config/config_manager.py:210 save_config"
+    """
+    fallback = None
+    for frame in reversed(frames):
+        location = f"{frame.filename}:{frame.lineno} {frame.name}"
+        fallback = fallback or location
+        path = os.path.abspath(frame.filename)
+        if path.startswith(_project_root) and "site-packages" not in path:
+            return f"{os.path.relpath(path, _project_root).replace(os.sep, '/')}:{frame.lineno} {frame.name}"
+    return fallback or "未知"
+
+
+class StallWatchdog(QObject):
+    """GUI 线程卡顿监测"""
+
+    def __init__(self):
+        super().__init__()
+        self._threshold = DEFAULT_THRESHOLD_MS / 1000
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._gui_thread_id = None
+        self._last_beat = 0.0
+
+        # 监测线程抓取到的当前卡顿 (心跳时间, 调用位置)
+        self._captured = None
+        # 按调用位置汇总 {调用位置: [次数, 总时长, 最长时长]}
+        self._sites = {}
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._heartbeat)
+
+    def start(self, threshold_ms=DEFAULT_THRESHOLD_MS):
+        """
+        开始监测，必须在 GUI 线程中调用
+
+        Args:
+            threshold_ms (int): 卡顿阈值（毫秒）
+        """
+        if self.is_running():
+            return
+        self._threshold = threshold_ms / 1000
+        self._gui_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._captured = None
+
+        self._timer.start(max(1, int(threshold_ms * HEARTBEAT_RATIO)))
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._monitor, name="StallWatchdog", daemon=True)
+        self._thread.start()
+        logger.debug(f"GUI线程卡顿监测已开启，阈值 {threshold_ms}ms")
+
+    def stop(self):
+        """停止监测并输出卡顿汇总"""
+        if not self.is_running():
+            return
+        self._timer.stop()
+        self._stop_event.set()
+        self._thread.join(timeout=1.0)
+        self._thread = None
+
+        summary = self.get_stats()
+        if summary:
+            lines = [
+                f"  {item['site']} x{item['count']} 总 {item['total_ms']:.0f}ms 最长 {item['max_ms']:.0f}ms"
+                for item in summary[:SUMMARY_TOP_N]
+            ]
+            logger.info("GUI线程卡顿汇总:\n" + "\n".join(lines))
+        logger.debug("GUI线程卡顿监测已关闭")
+
+    def is_running(self):
+        """是否正在监测"""
+        return self._thread is not None
+
+    def _heartbeat(self):
+        """GUI 线程心跳，心跳间隔超过阈值时记录一次卡顿"""
+        now = time.perf_counter()
+        with self._lock:
+            gap = now - self._last_beat
+            last_beat = self._last_beat
+            self._last_beat = now
+            captured = self._captured
+            self._captured = None
+
+        # 心跳本身有一个间隔的延迟，超出部分才是阻塞时长
+        stall = gap - self._timer.interval() / 1000
+        if stall < self._threshold or gap > SUSPEND_GAP:
+            return
+
+        site = captured[1] if captured is not None and captured[0] == last_beat else "未知"
+        stats = self._sites.setdefault(site, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += stall
+        stats[2] = max(stats[2], stall)
+        logger.warning(f"GUI线程卡顿 {stall * 1000:.0f}ms，调用位置: {site}")
+
+    def _monitor(self):
+        """监测线程，心跳超时后抓取 GUI 线程调用栈"""
+        poll_interval = self._threshold / 2
+        while not self._stop_event.wait(poll_interval):
+            with self._lock:
+                last_beat = self._last_beat
+                already_captured = self._captured is not None and self._captured[0] == last_beat
+            lag = time.perf_counter() - last_beat
+            if lag < self._threshold or already_captured:
+                continue
+
+            frame = sys._current_frames().get(self._gui_thread_id)
+            if frame is None:
+                continue
+            frames = traceback.extract_stack(frame)
+            del frame
+            site = _call_site(frames)
+
+            with self._lock:
+                # 抓取期间心跳已恢复则丢弃
+                if self._last_beat != last_beat:
+                    continue
+                self._captured = (last_beat, site)
+
+            stack = "".join(traceback.format_list(frames))
+            logger.warning(f"GUI线程已阻塞 {lag * 1000:.0f}ms，调用位置: {site}\n{stack}")
+
+    def get_stats(self):
+        """
+        获取按调用位置汇总的卡顿统计
+
+        Returns:
+            list: [{"site", "count", "total_ms", "max_ms"}]，按总时长降序
+        """
+        items = [
+            {"site": site, "count": count, "total_ms": total * 1000, "max_ms": longest * 1000}
+            for site, (count, total, longest) in self._sites.items()
+        ]
+        items.sort(key=lambda item: item["total_ms"], reverse=True)
+        return items
+
+    def reset_stats(self):
+        """清空统计"""
+        self._sites.clear()
+
+
+# 单例卡顿监测实例
+_stall_watchdog_instance = None
+
+
+def get_stall_watchdog():
+    """
+    获取GUI线程卡顿监测实例（单例模式）
+
+    Returns:
+        StallWatchdog: 卡顿监测实例
+    """
+    global _stall_watchdog_instance
+    if _stall_watchdog_instance is None:
+        _stall_watchdog_instance = StallWatchdog()
+    return _stall_watchdog_instance
@@ -8,9 +8,12 @@
 """
 
 import ctypes
+import ipaddress
 import os
+import socket
 import sys
 import winreg
+import psutil
 from .logger import logger
 
 
@@ -87,6 +90,83 @@ def show_already_running_dialog(app_name):
         print(f"{app_name} 已经在运行中，无法启动多个实例！")
 
 
+def is_frozen_build():
+    """
+    判断是否为打包后的程序（兼容 Nuitka 与 PyInstaller）
+
+    Returns:
+        bool: 打包运行返回 True，直接运行脚本返回 False
+    """
+    return bool(getattr(sys, "frozen", False) or "__compiled__" in globals())
+
+
+def get_install_dir():
+    """
+    获取打包程序的安装目录
+
+    Returns:
+        str or None: 安装目录，直接运行脚本时返回 None
+    """
+    if not is_frozen_build():
+        return None
+    return os.path.dirname(os.path.abspath(sys.executable))
+
+
+def _is_loopback_address(address):
+    """
+    判断接口地址是否为回环地址
+
+    Args:
+        address (str): 接口地址，IPv6 地址可能带有 "%接口" 后缀
+
+    Returns:
+        bool: 回环地址或无法解析的地址返回 True
+    """
+    try:
+        return ipaddress.ip_address(address.split("%", 1)[0]).is_loopback
+    except ValueError:
+        return True
+
+
+def is_network_available():
+    """
+    判断是否存在已连接的非回环网络接口
+
+    按接口地址判断回环接口，不依赖接口名称（如 Windows 的 "Local Area Connection" 并非回环接口）
+
+    Returns:
+        bool: 存在已启用且拥有非回环 IPv4/IPv6 地址的网络接口时返回 True
+    """
+    try:
+        stats = psutil.net_if_stats()
+        for name, addrs in psutil.net_if_addrs().items():
+            if name not in stats or not stats[name].isup:
+                continue
+            for addr in addrs:
+                if addr.family in (socket.AF_INET, socket.AF_INET6) and not _is_loopback_address(addr.address):
+                    return True
+        return False
+    except Exception as e:
+        logger.debug(f"获取网络接口状态失败: {str(e)}")
+        # 无法判断时按在线处理
+        return True
+
+
+def is_on_battery():
+    """
+    判断是否正在使用电池供电
+
+    Returns:
+        bool: 使用电池且未接通电源时返回 True，没有电池或无法获取时返回 False
+    """
+    try:
+        battery = psutil.sensors_battery()
+    except Exception as e:
+        logger.debug(f"获取电池状态失败: {str(e)}")
+        return False
+    return battery is not None and battery.power_plugged is False
+
+
 def get_program_path():
     """
     获取程序完整路径
@@ -94,7 +174,7 @@ def get_program_path():
     Returns:
         str: 程序完整路径
     """
-    if getattr(sys, "frozen", False):
+    if is_frozen_build():
         return sys.executable
     else:
         # 直接运行的python脚本
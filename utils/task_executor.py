@@ -0,0 +1,367 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+后台任务执行器模块
+
+基于 QThreadPool 的全局任务执行器，替代各处临时创建的 threading.Thread：
+- 支持任务优先级
+- 支持按 key 去重，相同 key 的任务在执行期间只会存在一个
+- 支持取消令牌，任务内部可以主动检查取消状态
+- 通过信号报告进度、完成和失败
+- 记录每个任务的排队等待时间和运行时间
+- 退出时统一取消并等待任务结束
+"""
+
+import threading
+import time
+from enum import IntEnum
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from .logger import logger
+
+
+class TaskPriority(IntEnum):
+    """任务优先级，数值越大越先执行"""
+
+    LOW = 0
+    NORMAL = 5
+    HIGH = 10
+
+
+class TaskCancelledError(Exception):
+    """任务被取消时抛出的异常"""
+
+
+class CancellationToken:
+    """取消令牌，在提交方和任务之间共享取消状态"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """请求取消任务"""
+        self._event.set()
+
+    @property
+    def is_cancelled(self):
+        """是否已请求取消"""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        """如果已请求取消则抛出 TaskCancelledError"""
+        if self._event.is_set():
+            raise TaskCancelledError()
+
+    def wait(self, timeout):
+        """
+        等待指定时间，期间如果被取消则提前返回
+
+        Args:
+            timeout (float): 等待秒数
+
+        Returns:
+            bool: 是否已被取消
+        """
+        return self._event.wait(timeout)
+
+
+class TaskHandle:
+    """任务句柄，提交任务后返回给调用方"""
+
+    def __init__(self, task_id, key, name, priority):
+        self.task_id = task_id
+        self.key = key
+        self.name = name
+        self.priority = priority
+        self.token = CancellationToken()
+        self.result = None
+        self.error = None
+        self.submitted_at = time.perf_counter()
+        self.started_at = None
+        self.finished_at = None
+        self._done = threading.Event()
+
+    @property
+    def queue_wait(self):
+        """排队等待时间（秒）"""
+        if self.started_at is None:
+            return None
+        return self.started_at - self.submitted_at
+
+    @property
+    def run_time(self):
+        """运行时间（秒）"""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    def cancel(self):
+        """请求取消任务"""
+        self.token.cancel()
+
+    def is_cancelled(self):
+        """是否已请求取消"""
+        return self.token.is_cancelled
+
+    def is_done(self):
+        """任务是否已结束（完成、失败或取消）"""
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """
+        阻塞等待任务结束
+
+        Args:
+            timeout (float, optional): 超时时间（秒）
+
+        Returns:
+            bool: 任务是否已结束
+        """
+        return self._done.wait(timeout)
+
+
+class TaskContext:
+    """传递给任务函数的上下文，提供取消检查和进度上报"""
+
+    def __init__(self, executor, handle):
+        self._executor = executor
+        self._handle = handle
+
+    @property
+    def token(self):
+        """任务的取消令牌"""
+        return self._handle.token
+
+    @property
+    def is_cancelled(self):
+        """是否已请求取消"""
+        return self._handle.token.is_cancelled
+
+    def raise_if_cancelled(self):
+        """如果已请求取消则抛出 TaskCancelledError"""
+        self._handle.token.raise_if_cancelled()
+
+    def report_progress(self, value, message=""):
+        """
+        上报任务进度
+
+        Args:
+            value (int): 进度值（0-100）
+            message (str): 进度描述
+        """
+        self._executor.task_progress.emit(self._handle.task_id, int(value), message)
+
+
+class _TaskRunnable(QRunnable):
+    """在线程池中执行任务的 QRunnable 包装"""
+
+    def __init__(self, executor, handle, func, args, kwargs):
+        super().__init__()
+        self.setAutoDelete(True)
+        self._executor = executor
+        self._handle = handle
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+
+    def run(self):
+        self._executor._run_task(self._handle, self._func, self._args, self._kwargs)
+
+
+class TaskExecutor(QObject):
+    """全局后台任务执行器"""
+
+    # 任务开始信号 - (任务ID, 任务名称)
+    task_started = pyqtSignal(int, str)
+    # 任务进度信号 - (任务ID, 进度值, 进度描述)
+    task_progress = pyqtSignal(int, int, str)
+    # 任务完成信号 - (任务ID, 返回值)
+    task_finished = pyqtSignal(int, object)
+    # 任务失败信号 - (任务ID, 错误信息)
+    task_failed = pyqtSignal(int, str)
+    # 任务取消信号 - (任务ID)
+    task_cancelled = pyqtSignal(int)
+
+    def __init__(self, max_workers=4):
+        super().__init__()
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(max_workers)
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self._active = {}  # task_id -> TaskHandle
+        self._keys = {}  # key -> TaskHandle
+        self._is_shutdown = False
+
+    def submit(self, func, *args, key=None, name=None, priority=TaskPriority.NORMAL, **kwargs):
+        """
+        提交后台任务
+
+        任务函数的第一个参数为 TaskContext，其余参数按原样传递。
+
+        Args:
+            func (callable): 任务函数
+            *args: 任务函数的位置参数
+            key (str, optional): 去重键，相同键的任务未结束时不会重复提交
+            name (str, optional): 任务名称，用于日志
+            priority (TaskPriority): 任务优先级
+            **kwargs: 任务函数的关键字参数
+
+        Returns:
+            TaskHandle or None: 任务句柄；执行器已关闭时返回 None
+        """
+        name = name or getattr(func, "__name__", "task")
+
+        with self._lock:
+            if self._is_shutdown:
+                logger.warning(f"任务执行器已关闭，忽略任务: {name}")
+                return None
+
+            # 相同key的任务仍在进行中，直接返回已有句柄
+            if key is not None:
+                existing = self._keys.get(key)
+                if existing is not None and not existing.is_done() and not existing.is_cancelled():
+                    logger.debug(f"任务 {name} 已在执行中，跳过重复提交 (key={key})")
+                    return existing
+
+            handle = TaskHandle(self._next_id, key, name, priority)
+            self._next_id += 1
+            self._active[handle.task_id] = handle
+            if key is not None:
+                self._keys[key] = handle
+
+        runnable = _TaskRunnable(self, handle, func, args, kwargs)
+        self._pool.start(runnable, int(priority))
+        return handle
+
+    def is_running(self, key):
+        """
+        判断指定键的任务是否正在排队或执行
+
+        Args:
+            key (str): 去重键
+
+        Returns:
+            bool: 是否存在未结束的任务
+        """
+        with self._lock:
+            handle = self._keys.get(key)
+            return handle is not None and not handle.is_done()
+
+    def cancel(self, key):
+        """
+        取消指定键的任务
+
+        Args:
+            key (str): 去重键
+
+        Returns:
+            bool: 是否找到并请求取消了任务
+        """
+        with self._lock:
+            handle = self._keys.get(key)
+        if handle is None or handle.is_done():
+            return False
+        handle.cancel()
+        return True
+
+    def active_count(self):
+        """获取未结束的任务数量"""
+        with self._lock:
+            return len(self._active)
+
+    def _run_task(self, handle, func, args, kwargs):
+        """在工作线程中执行任务"""
+        # 在锁内认领任务，与 shutdown() 互斥：已被 shutdown() 标记取消的任务不再执行
+        with self._lock:
+            if handle.task_id not in self._active:
+                return
+            handle.started_at = time.perf_counter()
+
+        try:
+            if handle.token.is_cancelled:
+                raise TaskCancelledError()
+
+            self.task_started.emit(handle.task_id, handle.name)
+            handle.result = func(TaskContext(self, handle), *args, **kwargs)
+            handle.finished_at = time.perf_counter()
+            self.task_finished.emit(handle.task_id, handle.result)
+
+        except TaskCancelledError:
+            handle.finished_at = time.perf_counter()
+            logger.debug(f"任务已取消: {handle.name}")
+            self.task_cancelled.emit(handle.task_id)
+
+        except Exception as e:
+            handle.finished_at = time.perf_counter()
+            handle.error = e
+            logger.error(f"任务执行失败: {handle.name}: {str(e)}")
+            self.task_failed.emit(handle.task_id, str(e))
+
+        finally:
+            with self._lock:
+                self._active.pop(handle.task_id, None)
+                if handle.key is not None and self._keys.get(handle.key) is handle:
+                    del self._keys[handle.key]
+            handle._done.set()
+
+            logger.debug(
+                f"任务 {handle.name} 结束 - 排队: {handle.queue_wait * 1000:.1f}ms, "
+                f"运行: {handle.run_time * 1000:.1f}ms"
+            )
+
+    def shutdown(self, timeout=3.0):
+        """
+        关闭执行器：取消所有任务并等待正在运行的任务结束
+
+        Args:
+            timeout (float): 最长等待时间（秒）
+
+        Returns:
+            bool: 是否所有任务都已在超时前结束
+        """
+        with self._lock:
+            if self._is_shutdown:
+                return True
+            self._is_shutdown = True
+            handles = list(self._active.values())
+
+        for handle in handles:
+            handle.cancel()
+
+        # 移除尚未开始的任务；已被工作线程认领（started_at 已设置）的任务由 waitForDone 等待结束，
+        # 已出队但尚未认领的任务在 _run_task 中发现句柄已移除后直接返回
+        self._pool.clear()
+        dropped = []
+        with self._lock:
+            for handle in handles:
+                if handle.started_at is None:
+                    self._active.pop(handle.task_id, None)
+                    if handle.key is not None and self._keys.get(handle.key) is handle:
+                        del self._keys[handle.key]
+                    dropped.append(handle)
+        for handle in dropped:
+            handle._done.set()
+
+        finished = self._pool.waitForDone(int(timeout * 1000))
+        if finished:
+            logger.debug("任务执行器已关闭")
+        else:
+            logger.warning(f"任务执行器关闭超时，仍有 {self.active_count()} 个任务未结束")
+        return finished
+
+
+# 单例任务执行器实例
+_task_executor_instance = None
+
+
+def get_task_executor():
+    """
+    获取任务执行器实例（单例模式）
+
+    Returns:
+        TaskExecutor: 任务执行器实例
+    """
+    global _task_executor_instance
+    if _task_executor_instance is None:
+        _task_executor_instance = TaskExecutor()
+    return _task_executor_instance
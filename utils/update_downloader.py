@@ -0,0 +1,739 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+更新包下载模块
+
+支持断点续传的分块并行下载器：
+- 将文件切分为固定大小的分块，多个工作线程按顺序领取分块并使用 HTTP Range 请求下载
+- 下载进度保存在 .part 文件旁边的清单文件中，中断后可从已完成的分块继续
+- 按文件顺序在下载过程中计算哈希，不需要在下载完成后重新读取整个文件
+- 支持限制下载带宽
+- 服务器不支持 Range 请求时退化为单连接流式下载
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from PyQt6.QtCore import QObject, pyqtSignal
+from .logger import logger
+from .task_executor import get_task_executor, TaskPriority, CancellationToken, TaskCancelledError
+
+
+# 默认分块大小（字节）
+DEFAULT_PIECE_SIZE = 2 * 1024 * 1024
+# 单次读取网络数据的大小（字节）
+STREAM_CHUNK_SIZE = 64 * 1024
+# 清单文件最短写入间隔（秒）
+MANIFEST_SAVE_INTERVAL = 0.5
+# 进度回调最短间隔（秒）
+PROGRESS_INTERVAL = 0.1
+# 单个分块失败后的最大重试次数
+PIECE_RETRIES = 3
+# 分块重试的初始等待时间（秒），每次重试翻倍
+PIECE_RETRY_DELAY = 0.5
+
+
+class DownloadError(Exception):
+    """下载失败异常"""
+
+
+class _RateLimiter:
+    """令牌桶限速器，多个下载线程共享"""
+
+    def __init__(self, bytes_per_sec):
+        self.bytes_per_sec = bytes_per_sec
+        self._allowance = float(bytes_per_sec)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, size, token):
+        """
+        消耗指定字节数的配额，配额不足时等待
+
+        Args:
+            size (int): 字节数
+            token: 取消令牌
+        """
+        if self.bytes_per_sec <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._allowance = min(float(self.bytes_per_sec), self._allowance + (now - self._last) * self.bytes_per_sec)
+            self._last = now
+            # 允许配额暂时为负，由本次调用等待补足
+            self._allowance -= size
+            wait_time = -self._allowance / self.bytes_per_sec if self._allowance < 0 else 0.0
+
+        if wait_time > 0 and token.wait(wait_time):
+            raise TaskCancelledError()
+
+
+class _LinkedToken(CancellationToken):
+    """关联外部取消令牌的内部令牌，用于在某个下载线程失败时停止其他线程"""
+
+    def __init__(self, parent):
+        super().__init__()
+        self._parent = parent
+
+    @property
+    def is_cancelled(self):
+        return self._event.is_set() or self._parent.is_cancelled
+
+    def wait(self, timeout):
+        deadline = time.monotonic() + timeout
+        while not self.is_cancelled:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._event.wait(min(remaining, 0.1))
+        return True
+
+
+class _DownloadManifest:
+    """断点续传清单，记录已完成的分块"""
+
+    def __init__(self, path, url, size, validator, piece_size, completed=None):
+        self.path = path
+        self.url = url
+        self.size = size
+        self.validator = validator
+        self.piece_size = piece_size
+        self.completed = set(completed or [])
+        self._last_saved = 0.0
+
+    @classmethod
+    def load(cls, path):
+        """
+        从文件加载清单
+
+        Args:
+            path (str): 清单文件路径
+
+        Returns:
+            _DownloadManifest or None: 清单对象，文件不存在或损坏时返回None
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return cls(
+                path,
+                data["url"],
+                data["size"],
+                data.get("validator"),
+                data["piece_size"],
+                data.get("completed", []),
+            )
+        except Exception as e:
+            logger.warning(f"下载清单损坏，将重新下载: {str(e)}")
+            return None
+
+    def matches(self, url, size, validator):
+        """判断清单是否对应同一个远程文件"""
+        return self.url == url and self.size == size and self.validator == validator
+
+    def save(self, force=False):
+        """
+        保存清单（写入临时文件后原子替换）
+
+        Args:
+            force (bool): 是否忽略写入间隔限制
+        """
+        now = time.monotonic()
+        if not force and now - self._last_saved < MANIFEST_SAVE_INTERVAL:
+            return
+        self._last_saved = now
+
+        data = {
+            "url": self.url,
+            "size": self.size,
+            "validator": self.validator,
+            "piece_size": self.piece_size,
+            "completed": sorted(self.completed),
+        }
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+
+class _OrderedHasher:
+    """
+    按文件顺序计算哈希
+
+    各线程下载的分块可能乱序到达，先到的分块暂存在内存中，
+    轮到它时再送入哈希；断点续传时已在磁盘上的分块在轮到时从文件读取。
+    """
+
+    def __init__(self, size, piece_size, part_path):
+        self._hash = hashlib.sha256()
+        self._size = size
+        self._piece_size = piece_size
+        self._piece_count = (size + piece_size - 1) // piece_size
+        self._part_path = part_path
+        self._pending = {}  # 分块索引 -> 数据
+        self._on_disk = set()  # 已在磁盘上但尚未计入哈希的分块
+        self._cursor = 0
+        self._cond = threading.Condition()
+
+    @property
+    def cursor(self):
+        """下一个需要计入哈希的分块索引"""
+        return self._cursor
+
+    def mark_on_disk(self, indexes):
+        """标记已在磁盘上的分块（断点续传时使用）"""
+        with self._cond:
+            self._on_disk.update(indexes)
+            self._advance()
+
+    def feed(self, index, data):
+        """
+        提交一个下载完成的分块
+
+        Args:
+            index (int): 分块索引
+            data (bytes): 分块数据
+        """
+        with self._cond:
+            self._pending[index] = data
+            self._advance()
+
+    def wait_for_window(self, index, window, token):
+        """
+        背压控制：等待哈希进度追上，避免暂存的分块过多
+
+        Args:
+            index (int): 即将下载的分块索引
+            window (int): 允许领先哈希进度的最大分块数
+            token (CancellationToken): 取消令牌
+        """
+        with self._cond:
+            while index - self._cursor >= window:
+                if token.is_cancelled:
+                    raise TaskCancelledError()
+                self._cond.wait(0.2)
+
+    def hexdigest(self):
+        """获取最终哈希值，要求所有分块都已计入"""
+        with self._cond:
+            if self._cursor < self._piece_count:
+                raise DownloadError("文件哈希计算不完整")
+            return self._hash.hexdigest()
+
+    def _advance(self):
+        """按顺序消费可用的分块"""
+        advanced = False
+        while self._cursor < self._piece_count:
+            data = self._pending.pop(self._cursor, None)
+            if data is None:
+                if self._cursor not in self._on_disk:
+                    break
+                data = self._read_piece_from_disk(self._cursor)
+                self._on_disk.discard(self._cursor)
+            self._hash.update(data)
+            self._cursor += 1
+            advanced = True
+        if advanced:
+            self._cond.notify_all()
+
+    def _read_piece_from_disk(self, index):
+        """从部分下载文件读取已完成的分块"""
+        with open(self._part_path, "rb") as f:
+            f.seek(index * self._piece_size)
+            return f.read(min(self._piece_size, self._size - index * self._piece_size))
+
+
+class UpdateDownloader:
+    """
+    分块并行下载器
+
+    Args:
+        workers (int): 并行连接数
+        max_bytes_per_sec (int): 带宽上限（字节/秒），0表示不限制
+        timeout (int): 网络超时时间（秒）
+        piece_size (int): 分块大小（字节）
+        user_agent (str, optional): 请求使用的User-Agent
+    """
+
+    def __init__(self, workers=4, max_bytes_per_sec=0, timeout=10, piece_size=DEFAULT_PIECE_SIZE, user_agent=None):
+        self.workers = max(1, workers)
+        self.max_bytes_per_sec = max_bytes_per_sec
+        self.timeout = timeout
+        self.piece_size = piece_size
+        self.headers = {"User-Agent": user_agent} if user_agent else {}
+
+    def download(self, url, dest_path, expected_sha256=None, token=None, progress_callback=None, fetch_url=None):
+        """
+        下载文件到目标路径（阻塞调用，应在工作线程中执行）
+
+        Args:
+            url (str): 资源的原始地址，断点续传清单以此为准
+            dest_path (str): 目标文件路径
+            expected_sha256 (str, optional): 期望的SHA-256值，提供时下载完成后校验
+            token (CancellationToken, optional): 取消令牌
+            progress_callback (callable, optional): 进度回调，参数为 (已下载字节数, 总字节数)
+            fetch_url (str, optional): 实际请求的地址（如镜像地址），默认为 url
+
+        Returns:
+            str: 下载完成的文件路径
+
+        Raises:
+            DownloadError: 下载或校验失败
+            TaskCancelledError: 下载被取消
+        """
+        token = token or CancellationToken()
+        expected_sha256 = expected_sha256.lower() if expected_sha256 else None
+
+        # 已存在完整且校验通过的文件时直接返回
+        if expected_sha256 and os.path.exists(dest_path) and _file_sha256(dest_path) == expected_sha256:
+            logger.debug(f"更新包已存在且校验通过: {dest_path}")
+            return dest_path
+
+        os.makedirs(os.path.dirname(dest_path) or ".", exist_ok=True)
+        part_path = dest_path + ".part"
+        manifest_path = part_path + ".json"
+
+        with requests.Session() as session:
+            session.headers.update(self.headers)
+            final_url, size, validator, accepts_ranges = self._probe(session, fetch_url or url)
+            # 已知哈希时以哈希作为校验标识，不同镜像的 ETag 不同，但下载的是同一个文件，可以互相续传
+            if expected_sha256:
+                validator = f"sha256:{expected_sha256}"
+
+            if accepts_ranges and size > 0:
+                digest = self._download_ranges(
+                    final_url, url, size, validator, part_path, manifest_path, token, progress_callback
+                )
+            else:
+                logger.debug("服务器不支持Range请求，使用单连接下载")
+                digest = self._download_stream(session, final_url, part_path, token, progress_callback)
+
+        if expected_sha256 and digest != expected_sha256:
+            _remove_quietly(part_path)
+            _remove_quietly(manifest_path)
+            raise DownloadError(f"文件校验失败，期望 {expected_sha256}，实际 {digest}")
+
+        os.replace(part_path, dest_path)
+        _remove_quietly(manifest_path)
+        logger.debug(f"下载完成: {dest_path} (sha256: {digest})")
+        return dest_path
+
+    def _probe(self, session, url):
+        """
+        探测远程文件信息
+
+        Returns:
+            tuple: (重定向后的URL, 文件大小, 校验标识, 是否支持Range)
+        """
+        response = session.head(url, allow_redirects=True, timeout=self.timeout)
+        response.raise_for_status()
+
+        size = int(response.headers.get("Content-Length", 0) or 0)
+        validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+        accepts_ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+        return response.url, size, validator, accepts_ranges
+
+    def _download_ranges(self, url, source_url, size, validator, part_path, manifest_path, token, progress_callback):
+        """
+        使用多个Range请求并行下载
+
+        Args:
+            url (str): 实际请求的地址
+            source_url (str): 资源的原始地址，作为清单的标识
+        """
+        manifest = _DownloadManifest.load(manifest_path)
+        if manifest is None or not manifest.matches(source_url, size, validator) or not os.path.exists(part_path):
+            manifest = _DownloadManifest(manifest_path, source_url, size, validator, self.piece_size)
+            with open(part_path, "wb") as f:
+                f.truncate(size)
+            manifest.save(force=True)
+        else:
+            logger.debug(f"从断点继续下载，已完成 {len(manifest.completed)} 个分块")
+
+        piece_size = manifest.piece_size
+        piece_count = (size + piece_size - 1) // piece_size
+        todo = [i for i in range(piece_count) if i not in manifest.completed]
+
+        hasher = _OrderedHasher(size, piece_size, part_path)
+        hasher.mark_on_disk(manifest.completed)
+
+        # 任意线程失败时通过内部令牌停止其他线程，不影响调用方的令牌
+        stop_token = _LinkedToken(token)
+
+        limiter = _RateLimiter(self.max_bytes_per_sec)
+        lock = threading.Lock()
+        state = {
+            "next": 0,
+            "downloaded": sum(min(piece_size, size - i * piece_size) for i in manifest.completed),
+            "reported": 0.0,
+        }
+        window = self.workers * 2
+
+        def report_progress(force=False):
+            if progress_callback is None:
+                return
+            now = time.monotonic()
+            if force or now - state["reported"] >= PROGRESS_INTERVAL:
+                state["reported"] = now
+                progress_callback(state["downloaded"], size)
+
+        def worker():
+            try:
+                with requests.Session() as session, open(part_path, "r+b") as f:
+                    session.headers.update(self.headers)
+                    while True:
+                        with lock:
+                            if state["next"] >= len(todo):
+                                return
+                            index = todo[state["next"]]
+                            state["next"] += 1
+
+                        hasher.wait_for_window(index, window, stop_token)
+                        data = self._fetch_piece(
+                            session, url, index, piece_size, size, limiter, stop_token, lock, state
+                        )
+
+                        f.seek(index * piece_size)
+                        f.write(data)
+                        hasher.feed(index, data)
+
+                        with lock:
+                            manifest.completed.add(index)
+                            manifest.save()
+                            report_progress()
+            except Exception:
+                # 失败的分块会使哈希进度停滞，必须立即停止其他线程，否则它们会一直等待哈希窗口
+                stop_token.cancel()
+                raise
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, max(1, len(todo)))) as pool:
+            futures = [pool.submit(worker) for _ in range(min(self.workers, max(1, len(todo))))]
+            errors = []
+            for future in futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    errors.append(e)
+
+        manifest.save(force=True)
+        if errors:
+            failures = [e for e in errors if not isinstance(e, TaskCancelledError)]
+            if not failures:
+                raise TaskCancelledError()
+            raise DownloadError(str(failures[0]))
+
+        report_progress(force=True)
+        return hasher.hexdigest()
+
+    def _fetch_piece(self, session, url, index, piece_size, size, limiter, token, lock, state):
+        """下载单个分块，网络错误或服务器错误时按指数退避重试"""
+        delay = PIECE_RETRY_DELAY
+        for attempt in range(PIECE_RETRIES + 1):
+            try:
+                return self._fetch_piece_once(session, url, index, piece_size, size, limiter, token, lock, state)
+            except (DownloadError, requests.RequestException) as e:
+                if attempt >= PIECE_RETRIES:
+                    raise DownloadError(f"分块 {index} 下载失败: {str(e)}") from e
+                logger.debug(f"分块 {index} 下载失败，{delay:.1f}s 后重试 ({attempt + 1}/{PIECE_RETRIES}): {str(e)}")
+                if token.wait(delay):
+                    raise TaskCancelledError()
+                delay *= 2
+
+    def _fetch_piece_once(self, session, url, index, piece_size, size, limiter, token, lock, state):
+        """发起一次分块请求"""
+        start = index * piece_size
+        end = min(start + piece_size, size) - 1
+        headers = {"Range": f"bytes={start}-{end}"}
+
+        with session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+            if response.status_code != 206:
+                raise DownloadError(f"服务器未返回分块数据: HTTP {response.status_code}")
+
+            buffer = bytearray()
+            try:
+                for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                    if token.is_cancelled:
+                        raise TaskCancelledError()
+                    limiter.consume(len(chunk), token)
+                    buffer.extend(chunk)
+                    with lock:
+                        state["downloaded"] += len(chunk)
+            except Exception:
+                # 未完成的分块不计入进度，续传时会重新下载
+                with lock:
+                    state["downloaded"] -= len(buffer)
+                raise
+
+        if len(buffer) != end - start + 1:
+            with lock:
+                state["downloaded"] -= len(buffer)
+            raise DownloadError(f"分块 {index} 大小不正确: {len(buffer)} != {end - start + 1}")
+        return bytes(buffer)
+
+    def _download_stream(self, session, url, part_path, token, progress_callback):
+        """单连接流式下载"""
+        limiter = _RateLimiter(self.max_bytes_per_sec)
+        sha256 = hashlib.sha256()
+        downloaded = 0
+        last_report = 0.0
+
+        with session.get(url, stream=True, timeout=self.timeout) as response:
+            response.raise_for_status()
+            total = int(response.headers.get("Content-Length", 0) or 0)
+            with open(part_path, "wb") as f:
+                for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                    if token.is_cancelled:
+                        raise TaskCancelledError()
+                    limiter.consume(len(chunk), token)
+                    f.write(chunk)
+                    sha256.update(chunk)
+                    downloaded += len(chunk)
+
+                    now = time.monotonic()
+                    if progress_callback and now - last_report >= PROGRESS_INTERVAL:
+                        last_report = now
+                        progress_callback(downloaded, total)
+
+        if progress_callback:
+            progress_callback(downloaded, total or downloaded)
+        return sha256.hexdigest()
+
+
+class UpdateDownloadController(QObject):
+    """更新包下载控制器，在后台任务中执行下载并通过信号通知界面"""
+
+    # 下载进度信号 - (已下载字节数, 总字节数)
+    progress = pyqtSignal(object, object)
+    # 下载完成信号 - (文件路径)
+    finished = pyqtSignal(str)
+    # 下载失败信号 - (错误信息)
+    failed = pyqtSignal(str)
+    # 下载取消信号
+    cancelled = pyqtSignal()
+
+    def __init__(self, download_dir, workers=4, max_bytes_per_sec=0, timeout=10, user_agent=None, mirror_racer=None):
+        super().__init__()
+        self.download_dir = download_dir
+        self.mirror_racer = mirror_racer
+        self.downloader = UpdateDownloader(
+            workers=workers, max_bytes_per_sec=max_bytes_per_sec, timeout=timeout, user_agent=user_agent
+        )
+        self._handle = None
+
+    def is_downloading(self):
+        """是否有下载任务正在进行"""
+        return self._handle is not None and not self._handle.is_done()
+
+    def start(self, url, file_name=None, expected_sha256=None):
+        """
+        开始下载
+
+        Args:
+            url (str): 下载地址
+            file_name (str, optional): 保存的文件名，默认取URL最后一段
+            expected_sha256 (str, optional): 期望的SHA-256值
+
+        Returns:
+            TaskHandle or None: 任务句柄
+        """
+        file_name = file_name or url.rstrip("/").rsplit("/", 1)[-1]
+        dest_path = os.path.join(self.download_dir, file_name)
+        self._handle = get_task_executor().submit(
+            self._download_task,
+            url,
+            dest_path,
+            expected_sha256,
+            key="update_download",
+            name="下载更新",
+            priority=TaskPriority.LOW,
+        )
+        return self._handle
+
+    def wait(self, timeout=None):
+        """
+        等待当前下载任务结束
+
+        Args:
+            timeout (float, optional): 超时时间（秒）
+
+        Returns:
+            bool: 任务是否已结束
+        """
+        return self._handle is None or self._handle.wait(timeout)
+
+    def cancel(self):
+        """取消当前下载，已下载的分块会保留用于续传"""
+        if self._handle is not None:
+            self._handle.cancel()
+
+    def _download_task(self, context, url, dest_path, expected_sha256):
+        """下载任务函数"""
+        try:
+            # 选择最快可用的镜像下载，清单仍以原始地址为准，换用其他镜像时可以继续下载
+            fetch_url = None
+            if self.mirror_racer is not None:
+                fetch_url = self.mirror_racer.resolve_asset(url, token=context.token)
+            path = self.downloader.download(
+                url,
+                dest_path,
+                expected_sha256=expected_sha256,
+                token=context.token,
+                progress_callback=lambda done, total: self.progress.emit(done, total),
+                fetch_url=fetch_url,
+            )
+            self.finished.emit(path)
+            return path
+        except TaskCancelledError:
+            self.cancelled.emit()
+            raise
+        except Exception as e:
+            logger.error(f"下载更新失败: {str(e)}")
+            self.failed.emit(str(e))
+            raise
+
+
+def _file_sha256(path):
+    """计算文件的SHA-256值"""
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _remove_quietly(path):
+    """删除文件，忽略不存在等错误"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+if __name__ == "__main__":
+    """使用本地支持Range请求的HTTP服务器测试下载器"""
+    import re
+    import tempfile
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+    payload = os.urandom(5 * 1024 * 1024 + 123)
+    payload_sha256 = hashlib.sha256(payload).hexdigest()
+
+    class RangeHandler(BaseHTTPRequestHandler):
+        """支持 HEAD 和单区间 Range 的测试服务器"""
+
+        # 按区间起始位置注入的失败次数 {起始位置: 剩余失败次数}，-1 表示一直失败
+        failures = {}
+        # 按路径统计的分块请求次数
+        range_requests = {}
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send_headers(self, status, start, end):
+            self.send_response(status)
+            self.send_header("Accept-Ranges", "bytes")
+            # 不同路径（模拟不同镜像）返回不同的 ETag
+            self.send_header("ETag", f'"{self.path}"')
+            self.send_header("Content-Length", str(end - start + 1))
+            if status == 206:
+                self.send_header("Content-Range", f"bytes {start}-{end}/{len(payload)}")
+            self.end_headers()
+
+        def do_HEAD(self):
+            self._send_headers(200, 0, len(payload) - 1)
+
+        def do_GET(self):
+            match = re.match(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+            if match:
+                start, end = int(match.group(1)), int(match.group(2))
+                self.range_requests[self.path] = self.range_requests.get(self.path, 0) + 1
+                remaining = self.failures.get(start, 0)
+                if remaining:
+                    self.failures[start] = remaining - 1 if remaining > 0 else remaining
+                    self.send_error(500)
+                    return
+                self._send_headers(206, start, end)
+            else:
+                start, end = 0, len(payload) - 1
+                self._send_headers(200, start, end)
+            self.wfile.write(payload[start : end + 1])
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    test_url = f"http://127.0.0.1:{server.server_address[1]}/update.zip"
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        target = os.path.join(temp_dir, "update.zip")
+        downloader = UpdateDownloader(workers=4, piece_size=512 * 1024, max_bytes_per_sec=2 * 1024 * 1024)
+
+        # 第一次下载在完成约一半时取消，模拟中断
+        interrupt_token = CancellationToken()
+
+        def interrupt(done, total):
+            if done > total // 2:
+                interrupt_token.cancel()
+
+        try:
+            downloader.download(test_url, target, payload_sha256, token=interrupt_token, progress_callback=interrupt)
+        except TaskCancelledError:
+            manifest = _DownloadManifest.load(target + ".part.json")
+            print(f"✅ 下载已中断，已完成 {len(manifest.completed)} 个分块")
+
+        # 第二次下载从断点继续并校验哈希
+        started = time.perf_counter()
+        downloader.download(test_url, target, payload_sha256)
+        with open(target, "rb") as f:
+            assert f.read() == payload
+        print(f"✅ 断点续传完成并校验通过，耗时 {time.perf_counter() - started:.2f}s")
+
+        # 非首个分块出现临时错误时重试后完成
+        os.remove(target)
+        piece_size = 512 * 1024
+        RangeHandler.failures = {3 * piece_size: 2}
+        fast_downloader = UpdateDownloader(workers=4, piece_size=piece_size)
+        fast_downloader.download(test_url, target, payload_sha256)
+        print("✅ 分块临时错误重试后下载完成")
+
+        # 非首个分块持续失败时所有线程及时停止并报告错误，而不是一直等待哈希窗口
+        os.remove(target)
+        RangeHandler.failures = {5 * piece_size: -1}
+        started = time.perf_counter()
+        try:
+            fast_downloader.download(test_url, target, payload_sha256)
+            raise AssertionError("分块持续失败时应抛出 DownloadError")
+        except DownloadError as e:
+            elapsed = time.perf_counter() - started
+            assert elapsed < 10, f"下载失败后未及时结束: {elapsed:.1f}s"
+            print(f"✅ 分块持续失败时 {elapsed:.2f}s 内结束: {e}")
+        RangeHandler.failures = {}
+
+        # 从镜像 A 下载中断后换用镜像 B，清单以原始地址和哈希为准，继续使用已完成的分块
+        for path in (target + ".part", target + ".part.json"):
+            _remove_quietly(path)
+        mirror_a = test_url.replace("/update.zip", "/mirror-a/update.zip")
+        mirror_b = test_url.replace("/update.zip", "/mirror-b/update.zip")
+        interrupt_token = CancellationToken()
+        try:
+            downloader.download(
+                test_url, target, payload_sha256, token=interrupt_token, progress_callback=interrupt, fetch_url=mirror_a
+            )
+        except TaskCancelledError:
+            pass
+        completed = len(_DownloadManifest.load(target + ".part.json").completed)
+        downloader.download(test_url, target, payload_sha256, fetch_url=mirror_b)
+        with open(target, "rb") as f:
+            assert f.read() == payload
+        piece_count = (len(payload) + downloader.piece_size - 1) // downloader.piece_size
+        fetched = RangeHandler.range_requests.get("/mirror-b/update.zip", 0)
+        assert completed > 0 and fetched == piece_count - completed, (completed, fetched, piece_count)
+        print(f"✅ 换用镜像后继续下载，镜像 B 只下载了剩余的 {fetched}/{piece_count} 个分块")
+
+    server.shutdown()
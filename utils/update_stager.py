@@ -0,0 +1,395 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+更新暂存模块
+
+下载完成的更新包不直接覆盖正在运行的程序，而是：
+1. 在后台任务中解压到安装目录旁的暂存目录（{安装目录}.staging），大文件使用多线程并行解压
+2. 校验解压结果（CRC、文件大小、主程序存在），最后写入暂存标记作为完成标志
+3. 程序退出或下次启动时由独立的脚本等待进程结束，通过两次目录重命名完成切换：
+   安装目录 -> {安装目录}.previous，暂存目录 -> 安装目录
+4. 旧版本保留在 {安装目录}.previous 中，可以用同样的方式回滚
+"""
+
+import os
+import json
+import time
+import shutil
+import zipfile
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import QObject, pyqtSignal
+from .logger import logger
+from .task_executor import get_task_executor, TaskPriority, TaskCancelledError, CancellationToken
+from .delta_update import apply_delta
+
+# 暂存完成标记文件
+STAGED_MARKER_NAME = ".staged.json"
+# 切换脚本文件名
+APPLY_SCRIPT_NAME = "apply_update.cmd"
+# 超过该解压后大小时使用多线程并行解压
+PARALLEL_EXTRACT_THRESHOLD = 32 * 1024 * 1024
+EXTRACT_CHUNK_SIZE = 1024 * 1024
+
+# 等待旧进程退出后通过重命名切换目录，失败时恢复原目录
+_SWITCH_SCRIPT = """@echo off
+chcp 65001 >nul
+:wait
+tasklist /FI "PID eq {pid}" 2>nul | find "{pid}" >nul
+if not errorlevel 1 (
+    timeout /t 1 /nobreak >nul
+    goto wait
+)
+if exist "{backup}" rmdir /s /q "{backup}"
+move "{install}" "{backup}" >nul || goto end
+move "{source}" "{install}" >nul || (
+    move "{backup}" "{install}" >nul
+    goto end
+)
+{relaunch}
+:end
+del "%~f0"
+"""
+
+
+class StagingError(Exception):
+    """更新暂存或切换失败异常"""
+
+
+def _safe_member_path(target_dir, member_name):
+    """获取压缩包成员的解压路径，拒绝指向目标目录之外的路径"""
+    target_path = os.path.normpath(os.path.join(target_dir, member_name))
+    if os.path.commonpath([os.path.abspath(target_dir), os.path.abspath(target_path)]) != os.path.abspath(target_dir):
+        raise StagingError(f"更新包包含非法路径: {member_name}")
+    return target_path
+
+
+def _extract_members(zip_path, target_dir, members, token):
+    """在当前线程中解压指定成员，读取时由 zipfile 校验 CRC"""
+    with zipfile.ZipFile(zip_path) as package:
+        for info in members:
+            token.raise_if_cancelled()
+            target_path = _safe_member_path(target_dir, info.filename)
+            if info.is_dir():
+                os.makedirs(target_path, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            with package.open(info) as src, open(target_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, EXTRACT_CHUNK_SIZE)
+
+
+def extract_archive(zip_path, target_dir, workers=4, token=None):
+    """
+    解压更新包，大文件按大小均分给多个线程并行解压
+
+    Args:
+        zip_path (str): 压缩包路径
+        target_dir (str): 解压目录
+        workers (int): 并行解压线程数
+        token (CancellationToken, optional): 取消令牌
+
+    Returns:
+        dict: 相对路径 -> 文件大小，用于解压后校验
+
+    Raises:
+        StagingError: 压缩包无效或包含非法路径
+        TaskCancelledError: 解压被取消
+    """
+    token = token or CancellationToken()
+    try:
+        with zipfile.ZipFile(zip_path) as package:
+            members = package.infolist()
+    except (OSError, zipfile.BadZipFile) as e:
+        raise StagingError(f"更新包无效: {str(e)}")
+
+    expected = {info.filename.rstrip("/"): info.file_size for info in members if not info.is_dir()}
+    total_size = sum(expected.values())
+
+    try:
+        if workers <= 1 or total_size < PARALLEL_EXTRACT_THRESHOLD:
+            _extract_members(zip_path, target_dir, members, token)
+        else:
+            # 从大到小依次分配给当前负载最小的线程
+            buckets = [[] for _ in range(workers)]
+            loads = [0] * workers
+            for info in sorted(members, key=lambda item: item.file_size, reverse=True):
+                index = loads.index(min(loads))
+                buckets[index].append(info)
+                loads[index] += info.file_size
+
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="UpdateExtract") as pool:
+                futures = [pool.submit(_extract_members, zip_path, target_dir, bucket, token) for bucket in buckets if bucket]
+                for future in futures:
+                    future.result()
+    except zipfile.BadZipFile as e:
+        raise StagingError(f"更新包校验失败: {str(e)}")
+
+    return expected
+
+
+class UpdateStager:
+    """更新暂存器，管理安装目录旁的暂存目录和旧版本目录"""
+
+    def __init__(self, install_dir, exe_name, workers=4):
+        """
+        Args:
+            install_dir (str): 当前安装目录
+            exe_name (str): 主程序文件名
+            workers (int): 并行解压线程数
+        """
+        self.install_dir = os.path.abspath(install_dir)
+        self.exe_name = exe_name
+        self.workers = workers
+        self.staging_dir = f"{self.install_dir}.staging"
+        self.previous_dir = f"{self.install_dir}.previous"
+
+    def prepare_staging(self):
+        """
+        清空并创建暂存目录
+
+        Returns:
+            str: 暂存目录
+        """
+        self.discard_pending()
+        os.makedirs(self.staging_dir)
+        return self.staging_dir
+
+    def stage_archive(self, zip_path, version, token=None):
+        """
+        将完整更新包解压到暂存目录并校验
+
+        Args:
+            zip_path (str): 更新包路径
+            version (str): 新版本号
+            token (CancellationToken, optional): 取消令牌
+
+        Returns:
+            dict: 暂存标记内容
+        """
+        staging_dir = self.prepare_staging()
+        expected = extract_archive(zip_path, staging_dir, workers=self.workers, token=token)
+
+        for rel_path, size in expected.items():
+            path = os.path.join(staging_dir, *rel_path.split("/"))
+            if not os.path.isfile(path) or os.path.getsize(path) != size:
+                raise StagingError(f"解压后的文件校验失败: {rel_path}")
+
+        return self.commit_staging(version, os.path.basename(zip_path))
+
+    def stage_delta(self, delta_path, version, token=None):
+        """
+        使用差异包和当前安装目录在暂存目录中还原新版本
+
+        Args:
+            delta_path (str): 差异包路径
+            version (str): 新版本号
+            token (CancellationToken, optional): 取消令牌
+
+        Returns:
+            dict: 暂存标记内容
+        """
+        staging_dir = self.prepare_staging()
+        apply_delta(delta_path, self.install_dir, staging_dir, token=token)
+        return self.commit_staging(version, os.path.basename(delta_path))
+
+    def commit_staging(self, version, package_name):
+        """
+        确认暂存目录可用并写入暂存标记
+
+        Args:
+            version (str): 新版本号
+            package_name (str): 来源更新包文件名
+
+        Returns:
+            dict: 暂存标记内容
+        """
+        if not os.path.isfile(os.path.join(self.staging_dir, self.exe_name)):
+            raise StagingError(f"更新包中缺少主程序: {self.exe_name}")
+
+        marker = {"version": version, "package": package_name, "staged_at": time.time()}
+        with open(os.path.join(self.staging_dir, STAGED_MARKER_NAME), "w", encoding="utf-8") as f:
+            json.dump(marker, f, ensure_ascii=False)
+
+        logger.info(f"新版本 v{version} 已暂存: {self.staging_dir}")
+        return marker
+
+    def get_pending(self):
+        """
+        获取已暂存、等待切换的更新
+
+        Returns:
+            dict or None: 暂存标记内容，没有完整的暂存更新时返回 None
+        """
+        return self._read_marker(self.staging_dir)
+
+    def discard_pending(self):
+        """删除暂存目录"""
+        if os.path.exists(self.staging_dir):
+            shutil.rmtree(self.staging_dir)
+
+    def finish_applied(self):
+        """
+        新版本启动后清理安装目录中的暂存标记
+
+        Returns:
+            dict or None: 刚完成切换的更新信息
+        """
+        marker = self._read_marker(self.install_dir)
+        if marker is not None:
+            os.remove(os.path.join(self.install_dir, STAGED_MARKER_NAME))
+            logger.info(f"已更新到 v{marker['version']}，旧版本保留在: {self.previous_dir}")
+        return marker
+
+    def has_previous(self):
+        """是否保留了可回滚的旧版本"""
+        return os.path.isfile(os.path.join(self.previous_dir, self.exe_name))
+
+    def launch_apply(self, pid, script_dir, relaunch=False):
+        """
+        启动切换脚本，在指定进程退出后用暂存目录替换安装目录
+
+        Args:
+            pid (int): 需要等待退出的进程ID
+            script_dir (str): 切换脚本存放目录
+            relaunch (bool): 切换完成后是否启动新版本
+
+        Returns:
+            bool: 是否已启动切换脚本
+        """
+        if self.get_pending() is None:
+            return False
+        return self._launch_switch(pid, script_dir, self.staging_dir, self.previous_dir, relaunch)
+
+    def launch_rollback(self, pid, script_dir, relaunch=False):
+        """
+        启动回滚脚本，在指定进程退出后恢复旧版本目录
+
+        Args:
+            pid (int): 需要等待退出的进程ID
+            script_dir (str): 切换脚本存放目录
+            relaunch (bool): 回滚完成后是否启动旧版本
+
+        Returns:
+            bool: 是否已启动回滚脚本
+        """
+        if not self.has_previous():
+            return False
+        return self._launch_switch(pid, script_dir, self.previous_dir, f"{self.install_dir}.rollback", relaunch)
+
+    def _launch_switch(self, pid, script_dir, source_dir, backup_dir, relaunch):
+        """生成并在后台启动目录切换脚本"""
+        if os.name != "nt":
+            logger.warning("当前系统不支持自动切换更新目录")
+            return False
+
+        relaunch_cmd = f'start "" "{os.path.join(self.install_dir, self.exe_name)}"' if relaunch else ""
+        script = _SWITCH_SCRIPT.format(
+            pid=pid, install=self.install_dir, source=source_dir, backup=backup_dir, relaunch=relaunch_cmd
+        )
+
+        os.makedirs(script_dir, exist_ok=True)
+        script_path = os.path.join(script_dir, APPLY_SCRIPT_NAME)
+        with open(script_path, "w", encoding="utf-8") as f:
+            f.write(script)
+
+        try:
+            subprocess.Popen(
+                ["cmd", "/c", script_path],
+                cwd=script_dir,
+                creationflags=subprocess.CREATE_NO_WINDOW | subprocess.DETACHED_PROCESS,
+                close_fds=True,
+            )
+        except OSError as e:
+            logger.error(f"启动更新切换脚本失败: {str(e)}")
+            return False
+
+        logger.info(f"已启动更新切换脚本: {source_dir} -> {self.install_dir}")
+        return True
+
+    def _read_marker(self, directory):
+        """读取目录中的暂存标记"""
+        try:
+            with open(os.path.join(directory, STAGED_MARKER_NAME), "r", encoding="utf-8") as f:
+                marker = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return marker if marker.get("version") else None
+
+
+class UpdateStageController(QObject):
+    """更新暂存控制器，在后台任务中暂存更新包并通过信号通知界面"""
+
+    # 暂存完成信号 - (新版本号)
+    finished = pyqtSignal(str)
+    # 暂存失败信号 - (错误信息)
+    failed = pyqtSignal(str)
+
+    def __init__(self, stager):
+        super().__init__()
+        self.stager = stager
+        self._handle = None
+
+    def is_staging(self):
+        """是否有更新包正在暂存"""
+        return self._handle is not None and not self._handle.is_done()
+
+    def wait(self, timeout=None):
+        """
+        等待当前暂存任务结束
+
+        Args:
+            timeout (float, optional): 超时时间（秒）
+
+        Returns:
+            bool: 任务是否已结束
+        """
+        return self._handle is None or self._handle.wait(timeout)
+
+    def start(self, package_path, version, is_delta=False):
+        """
+        开始暂存更新包
+
+        Args:
+            package_path (str): 完整更新包或差异包路径
+            version (str): 新版本号
+            is_delta (bool): 是否为差异包
+
+        Returns:
+            TaskHandle or None: 任务句柄
+        """
+        self._handle = get_task_executor().submit(
+            self._stage_task,
+            package_path,
+            version,
+            is_delta,
+            key="update_stage",
+            name="暂存更新",
+            priority=TaskPriority.LOW,
+        )
+        return self._handle
+
+    def _stage_task(self, context, package_path, version, is_delta):
+        """暂存任务函数"""
+        try:
+            if is_delta:
+                self.stager.stage_delta(package_path, version, token=context.token)
+            else:
+                self.stager.stage_archive(package_path, version, token=context.token)
+            self.finished.emit(version)
+            return version
+        except TaskCancelledError:
+            self._discard_quietly()
+            raise
+        except Exception as e:
+            self._discard_quietly()
+            logger.error(f"暂存更新失败: {str(e)}")
+            self.failed.emit(str(e))
+            raise
+
+    def _discard_quietly(self):
+        """删除未完成的暂存目录"""
+        try:
+            self.stager.discard_pending()
+        except OSError as e:
+            logger.warning(f"清理暂存目录失败: {str(e)}")
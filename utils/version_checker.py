@@ -5,21 +5,143 @@
 版本检查和更新模块
 """
 
-import os
-import json
 import re
-import threading
+from dataclasses import dataclass, field
+from enum import Enum
 import requests
 from packaging import version
 from PyQt6.QtCore import QObject, pyqtSignal
 from .logger import logger
+from .task_executor import get_task_executor, TaskPriority, TaskCancelledError
+from .mirror_race import MirrorRacer, MirrorRaceError
+
+
+class CheckMode(Enum):
+    """检查更新模式"""
+
+    INTERACTIVE = "interactive"  # 用户手动检查，显示结果对话框
+    SILENT = "silent"  # 启动或定期检查，只更新界面和托盘提示
+
+
+@dataclass(frozen=True, slots=True)
+class UpdateResult:
+    """
+    一次检查更新的结果
+
+    通过信号按引用传递，不做序列化。发布资源列表保持 GitHub 接口返回的原样，
+    只有在访问下载相关属性时才查找对应的资源，并缓存查找结果。
+    """
+
+    mode: CheckMode
+    current_version: str
+    latest_version: str = ""
+    has_update: bool = False
+    error: str = None
+    release_name: str = ""
+    release_body: str = ""
+    release_url: str = None
+    published_at: str = ""
+    assets: list = field(default=(), repr=False)
+    _asset_cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @property
+    def is_silent(self):
+        """是否为静默检查"""
+        return self.mode is CheckMode.SILENT
+
+    @property
+    def download_asset(self):
+        """
+        完整更新包资源
+
+        同一发布中还包含 *.delta.zip 差异包，必须排除；优先精确匹配 -v{最新版本}-x64.zip，
+        其次为其他x64的zip文件
+        """
+        if "download" not in self._asset_cache:
+            zips = [
+                asset
+                for asset in self.assets
+                if asset.get("name", "").lower().endswith(".zip")
+                and not asset.get("name", "").lower().endswith(".delta.zip")
+            ]
+            suffix = f"-v{self.latest_version}-x64.zip".lower()
+            exact = [asset for asset in zips if asset.get("name", "").lower().endswith(suffix)]
+            x64 = [asset for asset in zips if "x64" in asset.get("name", "").lower()]
+            self._asset_cache["download"] = (exact or x64 or zips or [None])[0]
+        return self._asset_cache["download"]
+
+    @property
+    def delta_asset(self):
+        """从当前版本到最新版本的差异包资源"""
+        if "delta" not in self._asset_cache:
+            suffix = f"-v{self.current_version}-to-v{self.latest_version}-x64.delta.zip".lower()
+            self._asset_cache["delta"] = next(
+                (asset for asset in self.assets if asset.get("name", "").lower().endswith(suffix)), None
+            )
+        return self._asset_cache["delta"]
+
+    @property
+    def download_url(self):
+        """完整更新包直接下载链接"""
+        return (self.download_asset or {}).get("browser_download_url")
+
+    @property
+    def download_name(self):
+        """完整更新包文件名"""
+        return (self.download_asset or {}).get("name")
+
+    @property
+    def download_size(self):
+        """完整更新包大小（字节）"""
+        return (self.download_asset or {}).get("size")
+
+    @property
+    def download_sha256(self):
+        """完整更新包SHA-256，用于校验下载文件"""
+        return _parse_asset_digest(self.download_asset)
+
+    @property
+    def delta_url(self):
+        """差异包下载链接"""
+        return (self.delta_asset or {}).get("browser_download_url")
+
+    @property
+    def delta_name(self):
+        """差异包文件名"""
+        return (self.delta_asset or {}).get("name")
+
+    @property
+    def delta_size(self):
+        """差异包大小（字节）"""
+        return (self.delta_asset or {}).get("size")
+
+    @property
+    def delta_sha256(self):
+        """差异包SHA-256"""
+        return _parse_asset_digest(self.delta_asset)
+
+
+def _parse_asset_digest(asset):
+    """
+    解析发布资源的SHA-256摘要
+
+    Args:
+        asset (dict): GitHub发布资源信息
+
+    Returns:
+        str or None: SHA-256十六进制字符串，没有摘要时返回None
+    """
+    digest = (asset or {}).get("digest") or ""
+    if digest.startswith("sha256:"):
+        return digest[len("sha256:") :]
+    return None
 
 
 class VersionChecker(QObject):
     """版本检查器"""
 
-    # 版本检查完成信号 - (有更新, 当前版本, 最新版本, 更新信息, 错误信息)
-    check_finished = pyqtSignal(bool, str, str, str, str)
+    # 版本检查完成信号 - (UpdateResult)
+    check_finished = pyqtSignal(object)
 
     def __init__(self, config_manager=None):
         super().__init__()
@@ -28,7 +150,15 @@ class VersionChecker(QObject):
         self.github_releases_url = config_manager.get_github_releases_url()
         self.app_name = config_manager.get_app_name()
         self.timeout = config_manager.system_config.get("network_timeout", 10)
-        self.silent_mode = False  # 默认非静默模式，显示更新弹窗
+
+        # 发布信息和更新包的镜像竞速器
+        self.mirror_racer = MirrorRacer(
+            config_manager.update_mirrors,
+            stats_path=config_manager.mirror_stats_file,
+            stagger=config_manager.system_config.get("mirror_race_stagger", 0.3),
+            timeout=self.timeout,
+            user_agent=f"{self.app_name}/{self.get_current_version()}",
+        )
 
     def get_current_version(self):
         """
@@ -50,15 +180,31 @@ class VersionChecker(QObject):
 
         Args:
             silent_mode (bool): 是否静默检查（不显示弹窗）
+
+        Returns:
+            TaskHandle or None: 任务句柄，检查已在进行中时返回已有任务的句柄
         """
-        self.silent_mode = silent_mode
-        thread = threading.Thread(target=self._check_for_updates_thread)
-        thread.daemon = True
-        thread.start()
+        mode = CheckMode.SILENT if silent_mode else CheckMode.INTERACTIVE
+
+        # 相同模式的检查正在进行时不会重复发起请求
+        return get_task_executor().submit(
+            self._check_for_updates_task,
+            mode,
+            key=f"version_check:{mode.value}",
+            name="检查更新",
+            priority=TaskPriority.NORMAL if silent_mode else TaskPriority.HIGH,
+        )
 
-    def _check_for_updates_thread(self):
+    def _check_for_updates_task(self, context, mode):
         """
-        检查更新的线程函数
+        检查更新的后台任务函数
+
+        Args:
+            context (TaskContext): 任务上下文
+            mode (CheckMode): 检查模式
+
+        Returns:
+            bool: 是否成功获取到版本信息
         """
         try:
             current_ver = self.get_current_version()
@@ -68,80 +214,58 @@ class VersionChecker(QObject):
 
             logger.debug(f"正在检查更新，当前版本: {current_ver}")
 
-            response = requests.get(self.github_api_url, headers=headers, timeout=self.timeout)
-            response.raise_for_status()
+            # 在所有镜像间竞速，使用最先返回有效发布信息的镜像
+            try:
+                _, release_data = self.mirror_racer.fetch_json(
+                    self.github_api_url, headers=headers, validate=self._validate_release, token=context.token
+                )
+            except MirrorRaceError as e:
+                # 使用首选镜像的原始错误，交给下面对应的错误处理分支
+                if e.original is not None:
+                    raise e.original
+                raise
 
-            # 请求成功
-            release_data = response.json()
+            # 退出程序时不再发送结果
+            context.raise_if_cancelled()
 
             # 解析最新版本信息
             latest_version = release_data.get("tag_name", "").lstrip("v")
-            release_name = release_data.get("name", "")
-            release_body = release_data.get("body", "")
-            release_url = release_data.get("html_url", self.github_releases_url)
-
             if not latest_version:
                 raise ValueError("无法获取最新版本号")
 
-            # 比较版本号
-            has_update = self._compare_versions(current_ver, latest_version)
-
-            # 查找下载链接（优先查找.zip文件）
-            assets = release_data.get("assets", [])
-            download_url = None
-            for asset in assets:
-                asset_name = asset.get("name", "").lower()
-                if asset_name.endswith(".zip") and "x64" in asset_name:
-                    download_url = asset.get("browser_download_url")
-                    break
-
-            # 如果没找到x64的zip，查找任何zip文件
-            if not download_url:
-                for asset in assets:
-                    asset_name = asset.get("name", "").lower()
-                    if asset_name.endswith(".zip"):
-                        download_url = asset.get("browser_download_url")
-                        break
-
-            # 构建更新信息
-            update_info = {
-                "version": latest_version,
-                "name": release_name,
-                "body": release_body,
-                "url": release_url,
-                "download_url": download_url,  # 直接下载链接
-                "published_at": release_data.get("published_at", ""),
-                "assets": assets,
-            }
-
-            update_info_str = json.dumps(update_info, ensure_ascii=False, indent=2)
-
-            logger.debug(f"版本检查完成 - 当前: {current_ver}, 最新: {latest_version}, 有更新: {has_update}")
-
-            # 静默模式下也发送信号，但添加静默标记，用于更新界面信息而不显示弹窗
-            self.check_finished.emit(
-                has_update,
-                current_ver,
-                latest_version,
-                update_info_str,
-                "silent_mode" if self.silent_mode else "",  # 使用错误信息字段传递静默模式标记
+            result = UpdateResult(
+                mode=mode,
+                current_version=current_ver,
+                latest_version=latest_version,
+                has_update=self._compare_versions(current_ver, latest_version),
+                release_name=release_data.get("name", ""),
+                release_body=release_data.get("body", ""),
+                release_url=release_data.get("html_url", self.github_releases_url),
+                published_at=release_data.get("published_at", ""),
+                assets=release_data.get("assets", []),
             )
 
-            # 记录静默模式信息
-            if self.silent_mode:
-                logger.info(f"静默检查模式：有更新: {has_update}, 最新版本: {latest_version}")
+            logger.debug(f"版本检查完成 - 当前: {current_ver}, 最新: {latest_version}, 有更新: {result.has_update}")
+
+            # 静默模式下也发送信号，用于更新界面信息而不显示弹窗
+            self.check_finished.emit(result)
+
+            if result.is_silent:
+                logger.info(f"静默检查模式：有更新: {result.has_update}, 最新版本: {latest_version}")
+
+            return True
 
         except requests.exceptions.Timeout:
             error_msg = "网络请求超时，请检查网络连接后稍后重试"
             logger.warning(f"检查更新失败: {error_msg}")
-            if not self.silent_mode:
-                self.check_finished.emit(False, self.get_current_version(), "", "", error_msg)
+            self._emit_error(mode, error_msg)
+            return False
 
         except requests.exceptions.ConnectionError:
             error_msg = "网络连接失败，请检查网络连接后稍后重试"
             logger.warning(f"检查更新失败: {error_msg}")
-            if not self.silent_mode:
-                self.check_finished.emit(False, self.get_current_version(), "", "", error_msg)
+            self._emit_error(mode, error_msg)
+            return False
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 403:
@@ -150,14 +274,42 @@ class VersionChecker(QObject):
             else:
                 error_msg = f"GitHub API 请求失败: {e.response.status_code}"
                 logger.warning(f"检查更新失败: {error_msg}")
-            if not self.silent_mode:
-                self.check_finished.emit(False, self.get_current_version(), "", "", error_msg)
+            self._emit_error(mode, error_msg)
+            return False
+
+        except TaskCancelledError:
+            raise
 
         except Exception as e:
             error_msg = f"检查更新时发生错误: {str(e)}"
             logger.error(f"检查更新失败: {error_msg}")
-            if not self.silent_mode:
-                self.check_finished.emit(False, self.get_current_version(), "", "", error_msg)
+            self._emit_error(mode, error_msg)
+            return False
+
+    def _validate_release(self, release_data):
+        """
+        校验镜像返回的发布信息
+
+        Args:
+            release_data (dict): 发布信息
+
+        Raises:
+            ValueError: 发布信息无效
+        """
+        if not isinstance(release_data, dict) or not release_data.get("tag_name"):
+            raise ValueError("镜像返回的发布信息无效")
+
+    def _emit_error(self, mode, error_msg):
+        """
+        发送检查失败结果，静默检查失败时不打扰用户
+
+        Args:
+            mode (CheckMode): 检查模式
+            error_msg (str): 错误信息
+        """
+        if mode is CheckMode.SILENT:
+            return
+        self.check_finished.emit(UpdateResult(mode=mode, current_version=self.get_current_version(), error=error_msg))
 
     def _compare_versions(self, current_ver, latest_ver):
         """
@@ -277,27 +429,25 @@ def format_version_info(current_version, latest_version=None, has_update=False):
         return f"当前版本: v{current_version}"
 
 
-def create_update_message(has_update, current_ver, latest_ver, update_info_str, error_msg, github_url=None):
+def create_update_message(result, github_url=None):
     """
     创建更新检查结果消息
 
     Args:
-        has_update: 是否有更新
-        current_ver: 当前版本
-        latest_ver: 最新版本
-        update_info_str: 更新信息JSON字符串
-        error_msg: 错误信息
+        result (UpdateResult): 检查更新结果
         github_url: GitHub发布页面URL（可选）
 
     Returns:
         tuple: (标题, 消息内容, 消息类型, 额外数据)
     """
+    current_ver = result.current_version
+    latest_ver = result.latest_version
 
-    # 处理其他错误
-    if error_msg:
+    # 处理错误
+    if result.error:
         return (
             "检查更新失败",
-            f"检查更新时遇到问题：\n{error_msg}\n\n"
+            f"检查更新时遇到问题：\n{result.error}\n\n"
             f"当前版本: v{current_ver}\n\n"
             f"建议操作：\n"
             f"• 检查网络连接\n"
@@ -309,45 +459,70 @@ def create_update_message(has_update, current_ver, latest_ver, update_info_str,
         )
 
     # 处理有更新的情况
-    if has_update:
-        try:
-            update_info = json.loads(update_info_str)
-            release_name = update_info.get("name", f"v{latest_ver}")
-            release_body = update_info.get("body", "").strip()
-            release_url = update_info.get("url", github_url)
-            direct_download_url = update_info.get("download_url")
+    if result.has_update:
+        release_body = (result.release_body or "").strip()
+        release_url = result.release_url or github_url
+        direct_download_url = result.download_url
 
-            if len(release_body) > 500:
-                release_body = release_body[:500] + "..."
+        if len(release_body) > 500:
+            release_body = release_body[:500] + "..."
 
-            message = f"当前版本: v{current_ver}\n" f"最新版本: v{latest_ver}\n\n"
+        message = f"当前版本: v{current_ver}\n" f"最新版本: v{latest_ver}\n\n"
 
-            if release_body:
-                message += f"更新内容:\n{release_body}\n\n"
+        if release_body:
+            message += f"更新内容:\n{release_body}\n\n"
 
-            # 根据是否有直接下载链接调整消息
-            if direct_download_url:
-                message += "是否立即下载新版本？"
-            else:
-                message += "是否前往下载页面？"
-
-            return (
-                "发现新版本",
-                message,
-                "update",
-                {
-                    "download_url": direct_download_url if direct_download_url else release_url,
-                    "is_direct_download": bool(direct_download_url),
-                },
-            )
+        # 根据是否有直接下载链接调整消息
+        if direct_download_url:
+            message += "是否立即下载新版本？"
+        else:
+            message += "是否前往下载页面？"
 
-        except Exception as e:
-            logger.error(f"解析更新信息失败: {str(e)}")
-            return (
-                "发现新版本",
-                f"发现新版本！\n\n当前版本: v{current_ver}\n最新版本: v{latest_ver}\n\n是否前往下载页面？",
-                "update",
-                {"download_url": github_url, "is_direct_download": False},
-            )
-    else:
-        return ("已是最新版本", f"您当前使用的已经是最新版本。\n\n当前版本: v{current_ver}", "info", {})
+        return (
+            "发现新版本",
+            message,
+            "update",
+            {
+                "download_url": direct_download_url if direct_download_url else release_url,
+                "is_direct_download": bool(direct_download_url),
+            },
+        )
+
+    return ("已是最新版本", f"您当前使用的已经是最新版本。\n\n当前版本: v{current_ver}", "info", {})
+
+
+if __name__ == "__main__":
+    """测试发布资源的选择"""
+
+    def asset(name):
+        return {"name": name, "browser_download_url": f"https://example.com/{name}", "digest": f"sha256:{name}"}
+
+    # GitHub 返回的资源顺序不固定，差异包可能排在完整包之前
+    assets = [
+        asset("ACE-KILLER-v1.0.0-to-v1.2.0-x64.delta.zip"),
+        asset("ACE-KILLER-v1.1.0-to-v1.2.0-x64.delta.zip"),
+        asset("ACE-KILLER-v1.2.0-delta-report.json"),
+        asset("ACE-KILLER-v1.2.0-x64.zip"),
+    ]
+    result = UpdateResult(
+        mode=CheckMode.SILENT, current_version="1.1.0", latest_version="1.2.0", has_update=True, assets=assets
+    )
+    assert result.download_name == "ACE-KILLER-v1.2.0-x64.zip", result.download_name
+    assert result.delta_name == "ACE-KILLER-v1.1.0-to-v1.2.0-x64.delta.zip", result.delta_name
+    print(f"✅ 完整包: {result.download_name}，差异包: {result.delta_name}")
+
+    # 只有差异包时不会把差异包当作完整包
+    result = UpdateResult(mode=CheckMode.SILENT, current_version="1.1.0", latest_version="1.2.0", assets=assets[:2])
+    assert result.download_asset is None and result.download_url is None
+    assert result.delta_name == "ACE-KILLER-v1.1.0-to-v1.2.0-x64.delta.zip"
+    print("✅ 只有差异包时没有完整包")
+
+    # 完整包命名不规范时仍回退到其他x64的zip文件
+    result = UpdateResult(
+        mode=CheckMode.SILENT,
+        current_version="1.1.0",
+        latest_version="1.2.0",
+        assets=[assets[0], asset("ACE-KILLER-x64.zip"), asset("source.zip")],
+    )
+    assert result.download_name == "ACE-KILLER-x64.zip", result.download_name
+    print(f"✅ 回退到x64完整包: {result.download_name}")